@@ -1,128 +1,73 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
+import numpy as np
 
 
-class Node:
-    def __init__(self, h):
-        self._h = h
-        self._score = 0
-    
-    @property
-    def height(self):
-        return self._h
+class TrailMap:
+    def __init__(self, grid):
+        self._grid = grid
+        self._heights = grid.flat
+        self._neighbours = grid.neighbour_table()
 
-    @height.setter
-    def height(self, h):
-        self._h = h
-    
-    @property
-    def score(self):
-        return self._score
+    def _descending_edges(self, h):
+        """Get the edges from all nodes of height h to their neighbours of height h - 1."""
 
-    @score.setter
-    def score(self, s):
-        self._score = s
+        nodes = self._grid.cells()
+        nodes = nodes[self._heights[nodes] == h]
 
-    def __repr__(self):
-        output = f"Node with height {self._h}. Current score: {self._score}"
-        return output
+        neighbours = self._neighbours[nodes]
+        valid = self._heights[neighbours] == h - 1
 
+        return np.repeat(nodes, valid.sum(axis=1)), neighbours[valid]
 
-class TrailMap:
-    def __init__(self, grid):
-        self._nodes = {}
-        self._edges_desc = {}
-        self._edges_asc = {}
-
-        directions = [(-1, 0), (1, 0), (0, 1), (0, -1)]
-
-        ni = len(grid)
-        nj = len(grid[0])
-        for i in range(ni):
-            for j in range(nj):
-                self._nodes[(i, j)] = Node(grid[i][j])
-
-                self._edges_desc[(i, j)] = []
-                self._edges_asc[(i, j)] = []
-                for di, dj in directions:
-                    if i + di >= 0 and i + di < ni and j + dj >= 0 and j + dj < nj:
-                        if grid[i+di][j+dj] == grid[i][j] - 1:
-                            self._edges_desc[(i, j)].append((i + di, j+dj))
-                        elif grid[i+di][j+dj] == grid[i][j] + 1:
-                            self._edges_asc[(i, j)].append((i + di, j+dj))
-    
-    def _init_scores(self, h):
-        for n in self._nodes:
-            self._nodes[n].score = 1 if self._nodes[n].height == h else 0
+    def get_trailhead_scores(self):
 
-    def has_path(self, src, trg):
-        if src == trg:
-            return True
+        # Each summit is a bit, each node keeps the set of summits reachable from it
+        summits = {n: 1 << k for k, n in enumerate(self._grid.to_flat(*self._grid.find(9).T).tolist())}
 
-        elif self._nodes[src].height == self._nodes[trg].height:
-            return False
+        for h in range(9, 0, -1):
+            src, trg = self._descending_edges(h)
+            for n0, n1 in zip(src.tolist(), trg.tolist()):
+                summits[n1] = summits.get(n1, 0) | summits.get(n0, 0)
 
-        return any([self.has_path(n, trg) for n in self._edges_asc[src]])
-    
-    def get_trailhead_scores(self):
+        trailheads = self._grid.to_flat(*self._grid.find(0).T).tolist()
 
-        src_list = [n for n in self._nodes if self._nodes[n].height == 0]
-        trg_list = [n for n in self._nodes if self._nodes[n].height == 9]
+        return sum([bin(summits.get(n, 0)).count("1") for n in trailheads])
 
-        tot = 0
-        for src in src_list:
-            for trg in trg_list:
-                if self.has_path(src, trg):
-                    tot += 1
-        
-        return tot
-    
     def propagate(self, src, trg):
 
-        self._init_scores(src)
+        scores = np.zeros(self._heights.shape, dtype=np.int64)
+        scores[self._heights == src] = 1
 
         h = src
 
-        while h >= trg:
-
-            nodes = [n for n in self._nodes if self._nodes[n].height == h]
+        while h > trg:
+            n0, n1 = self._descending_edges(h)
+            np.add.at(scores, n1, scores[n0])
 
-            for n in nodes:
-                for nei in self._edges_desc[n]:
-                    self._nodes[nei].score += self._nodes[n].score
-            
             h -= 1
-    
-        return sum([self._nodes[n].score for n in self._nodes if self._nodes[n].height == trg])
 
-    def __repr__(self):
-        output = ""
-        for n in self._nodes:
-            output += self._nodes[n].__repr__()
+        return int(scores[self._grid.to_flat(*self._grid.find(trg).T)].sum())
 
-            output += f"\n    Node position: ({n[0]}, {n[1]})"
 
-            output += "\n    Ascending neighbours: "
-            output += ", ".join([f"({i}, {j})" for i, j in self._edges_asc[n]])
-            output += "\n    Descending neighbours: "
-            output += ", ".join([f"({i}, {j})" for i, j in self._edges_desc[n]])
-            output += "\n"
-        return output
+def parse_txt(txt):
 
+    grid = aoc.Grid.from_text(txt, mapping={str(h): h for h in range(10)}, fill=-10, dtype=np.int32)
 
-def parse_input():
+    trail_map = TrailMap(grid)
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
+    return trail_map
 
-    grid = [[int(c) for c in line] for line in txt.split("\n")]
 
-    trail_map = TrailMap(grid)
+def parse_input():
 
-    return trail_map
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
 
 
+@aoc.solution(2024, 10, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -134,6 +79,7 @@ def solve_level_1():
     return trail_map.get_trailhead_scores()
 
 
+@aoc.solution(2024, 10, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -149,27 +95,44 @@ if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
@@ -1,149 +1,91 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
+import numpy as np
 
 
 class Field:
     def __init__(self, txt):
 
-        self.grid = [[c for c in line] for line in txt.split("\n")]
-        self.ni = len(self.grid)
-        self.nj = len(self.grid[0])
-        self.num_edges = [[0 for _ in g] for g in self.grid]
-        self.num_corners = [[0 for _ in g] for g in self.grid]
-        self.regions = []
+        # Padding cells match no plant, so that they bound every region
+        self.grid = aoc.Grid.from_text(txt)
+        self.ni, self.nj = self.grid.shape
+        self.num_edges = None
+        self.sides = None
+        self.regions = None
+        self.num_regions = 0
 
     def __repr__(self):
-        output = "\n".join(["".join([c for c in g]) for g in self.grid])
+        output = self.grid.to_text()
 
-        output += "\n\n"
-        output += "\n".join(["".join([str(n) for n in g]) for g in self.num_edges])
+        if self.num_edges is not None:
+            output += "\n\n"
+            output += "\n".join(["".join([str(n) for n in g]) for g in self.num_edges.tolist()])
         return "\n" + output + "\n"
-    
-    def _get_edge(self, i, j):
-
-        num = 0
-
-        if i-1 < 0 or self.grid[i-1][j] != self.grid[i][j]:
-            num += 1
-        if i+1 >= self.ni or self.grid[i+1][j] != self.grid[i][j]:
-            num += 1
-        if j-1 < 0 or self.grid[i][j-1] != self.grid[i][j]:
-            num += 1
-        if j+1 >= self.nj or self.grid[i][j+1] != self.grid[i][j]:
-            num += 1
-        
-        return num
 
-    def get_edges(self):
-
-        for i in range(self.ni):
-            for j in range(self.nj):
-
-                self.num_edges[i][j] = self._get_edge(i, j)
-    
-    def _get_region(self, i0, j0):
+    def _same(self, di, dj):
+        # Whether the neighbour of each cell in direction (di, dj) is the same plant
+        p = self.grid.padded
+        return p[1+di:1+di+self.ni, 1+dj:1+dj+self.nj] == self.grid.values
 
-        todo = [(i0, j0)]
-        region = [(i0, j0)]
-
-        while len(todo) > 0:
-            i, j = todo.pop()
+    def get_edges(self):
 
-            if i-1 >= 0 and self.grid[i-1][j] == self.grid[i][j]:
-                if (i-1, j) not in region:
-                    region.append((i-1, j))
-                    todo.append((i-1, j))
+        self.num_edges = 4 - sum([self._same(di, dj).astype(np.int32) for di, dj in aoc.Grid.directions_4])
 
-            if i+1 < self.ni and self.grid[i+1][j] == self.grid[i][j]:
-                if (i+1, j) not in region:
-                    region.append((i+1, j))
-                    todo.append((i+1, j))
+    def get_regions(self):
 
-            if j-1 >= 0 and self.grid[i][j-1] == self.grid[i][j]:
-                if (i, j-1) not in region:
-                    region.append((i, j-1))
-                    todo.append((i, j-1))
+        plants = self.grid.flat.tolist()
+        neighbours = self.grid.neighbour_table().tolist()
 
-            if j+1 < self.nj and self.grid[i][j+1] == self.grid[i][j]:
-                if (i, j+1) not in region:
-                    region.append((i, j+1))
-                    todo.append((i, j+1))
-    
-        return region
+        labels = [-1] * len(plants)
+        for cell in self.grid.cells().tolist():
 
-    def get_regions(self):
+            if labels[cell] >= 0:
+                continue
 
-        done = []
+            labels[cell] = self.num_regions
+            todo = [cell]
+            while len(todo) > 0:
+                node = todo.pop()
+                for nei in neighbours[node]:
+                    if labels[nei] < 0 and plants[nei] == plants[node]:
+                        labels[nei] = self.num_regions
+                        todo.append(nei)
 
-        for i in range(self.ni):
-            for j in range(self.nj):
+            self.num_regions += 1
 
-                if (i, j) not in done:
-                    region = self._get_region(i, j)
-                    self.regions.append(region)
-                    done.extend(region)
+        self.regions = np.array(labels)[self.grid.cells()].reshape(self.ni, self.nj)
 
     def get_region_scores(self, discount=False):
 
-        tot = 0
+        area = np.bincount(self.regions.ravel(), minlength=self.num_regions)
 
         if discount:
-            for region, side in zip(self.regions, self.sides):
-                
-                tot += side * len(region)
-
+            fences = np.bincount(self.regions.ravel(), weights=self.sides.ravel(), minlength=self.num_regions)
         else:
-            for region in self.regions:
-                
-                tot += sum([self.num_edges[i][j] for i, j in region]) * len(region)
-
-        return tot
-    
-    def count_corners(self, region, i, j):
-
-        searches = [[(i, j), (i-1, j), (i, j-1), (i-1, j-1)],
-                    [(i, j), (i-1, j), (i, j+1), (i-1, j+1)],
-                    [(i, j), (i, j-1), (i+1, j), (i+1, j-1)],
-                    [(i, j), (i+1, j), (i, j+1), (i+1, j+1)]
-                    ]
-        
-        n = 0
-        for search in searches:
-            search_result = [1 if s in region else 0 for s in search]
-            
-            if (sum(search_result) == 1
-                or (sum(search_result) == 2 and search_result[0] == 1 and search_result[-1] == 1)
-                or (sum(search_result) == 3 and search_result[-1] == 0)):
-                n += 1
-        return n
+            fences = np.bincount(self.regions.ravel(), weights=self.num_edges.ravel(), minlength=self.num_regions)
 
-    def get_region_sides(self, region):
-
-        num = 0
-
-        for i, j in region:
-
-            num += self.count_corners(region, i, j)
-
-        return num
+        return int((area * fences).sum())
 
     def get_sides(self):
 
-        self.sides = []
+        # A region has as many sides as corners, each cell is checked for a corner on each of its four corners
+        self.sides = np.zeros((self.ni, self.nj), dtype=np.int32)
+        for di, dj in [(-1, -1), (-1, 1), (1, -1), (1, 1)]:
+            a = self._same(di, 0)
+            b = self._same(0, dj)
+            c = self._same(di, dj)
+            self.sides += (~a & ~b) | (a & b & ~c)
 
-        for region in self.regions:
-            self.sides.append(self.get_region_sides(region))
-    
 
 def parse_input():
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
-
-    return txt
+    # The input text is memoized, so that both levels read it once
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"))
 
 
+@aoc.solution(2024, 12, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -159,6 +101,7 @@ def solve_level_1():
     return field.get_region_scores()
 
 
+@aoc.solution(2024, 12, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -177,27 +120,44 @@ if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
@@ -1,5 +1,6 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
 
 
@@ -29,36 +30,29 @@ def nearest_int(x, max_diff=0.1):
     return -1
 
 
-def parse_input(add=0):
+def parse_txt(txt):
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
-    
-    i = 0
-    lines = txt.split("\n")
+    # Button A, button B and prize of each machine
+    return aoc.parse.int_rows(txt, 6).tolist()
 
-    machines = []
 
-    while i+2 < len(lines):
+def parse_input(add=0):
 
-        xa = int(lines[i].split("X+")[1].split(",")[0])
-        ya = int(lines[i].split("Y+")[1])
-        xb = int(lines[i+1].split("X+")[1].split(",")[0])
-        yb = int(lines[i+1].split("Y+")[1])
+    # The parsed input is memoized, the prizes depend on the level
+    rows = aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
 
-        a = [[xa, xb], [ya, yb]]
+    machines = []
+    for xa, ya, xb, yb, px, py in rows:
 
-        px = float(lines[i+2].split("X=")[1].split(",")[0])
-        py = float(lines[i+2].split("Y=")[1])
-        b = [px + add, py + add]
+        a = [[xa, xb], [ya, yb]]
+        b = [float(px + add), float(py + add)]
 
         machines.append((a, b))
 
-        i += 4
-    
     return machines
 
 
+@aoc.solution(2024, 13, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -84,6 +78,7 @@ def solve_level_1():
     return tokens
 
 
+@aoc.solution(2024, 13, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -113,27 +108,44 @@ if __name__ == "__main__":
 
     debug = True
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
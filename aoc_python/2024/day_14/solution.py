@@ -1,46 +1,23 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
+import numpy as np
 
 from copy import deepcopy
 from matplotlib import pyplot as plt
 
 
-def parse_input():
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
-
-    guards = []
-
-    for line in txt.split("\n"):
-        px = int(line.split("p=")[1].split(",")[0])
-        py = int(line.split("p=")[1].split(",")[1].split()[0])
-        vx = int(line.split("v=")[1].split(",")[0])
-        vy = int(line.split("v=")[1].split(",")[1].split()[0])
-
-        guards.append([[px, py], [vx, vy]])
-    
-    return guards
-
-
-def normalize(p, n):
-
-    while p < 0:
-        p += n
-    while p >= n:
-        p -= n
+def parse_txt(txt):
 
-    return p
+    # Position and velocity of each guard
+    return aoc.parse.int_rows(txt, 4).reshape(-1, 2, 2)
 
 
-def update(guards, nx, ny):
-
-    for p, v in guards:
-        p[0] = normalize(p[0] + v[0], nx)
-        p[1] = normalize(p[1] + v[1], ny)
+def parse_input():
 
-    return guards
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
 
 
 def print_map(guards, nx, ny):
@@ -122,16 +99,18 @@ def plot_map_interactive(guard_frames, nx, ny):
     plt.close()
 
 
-def count_quadrants(guards, nx, ny):
+def safety_factor(pos, nx, ny):
 
-    n1 = len([1 for p, _ in guards if p[0] < nx // 2 and p[1] < ny // 2])
-    n2 = len([1 for p, _ in guards if p[0] > nx // 2 and p[1] < ny // 2])
-    n3 = len([1 for p, _ in guards if p[0] < nx // 2 and p[1] > ny // 2])
-    n4 = len([1 for p, _ in guards if p[0] > nx // 2 and p[1] > ny // 2])
+    left, right = pos[:, 0] < nx // 2, pos[:, 0] > nx // 2
+    top, bottom = pos[:, 1] < ny // 2, pos[:, 1] > ny // 2
 
-    return n1 * n2 * n3 * n4
+    return (
+        int(np.count_nonzero(left & top)) * int(np.count_nonzero(right & top)) *
+        int(np.count_nonzero(left & bottom)) * int(np.count_nonzero(right & bottom))
+    )
 
 
+@aoc.solution(2024, 14, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -145,12 +124,12 @@ def solve_level_1():
 
     n_update = 100
 
-    for _ in range(n_update):
-        guards = update(guards, nx, ny)
+    pos = (guards[:, 0] + n_update * guards[:, 1]) % np.array([nx, ny])
 
-    return count_quadrants(guards, nx, ny)
+    return safety_factor(pos, nx, ny)
 
 
+@aoc.solution(2024, 14, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -162,57 +141,68 @@ def solve_level_2():
     nx = 101
     ny = 103
 
-    n_update = 1000
+    pos, vel = guards[:, 0], guards[:, 1]
+    size = np.array([nx, ny])
 
-    guard_frames = []
-    guard_frames.append(deepcopy(guards))
+    def step(p):
+        return (p + vel) % size
 
-    for _ in range(n_update):
+    # The robots come back to their initial positions after one period, the
+    # picture is searched as the frame with the lowest safety factor
+    _, period = aoc.cycles.find_cycle(step, pos, key=aoc.cycles.state_hash)
 
-        guards = update(guards, nx, ny)
-        guard_frames.append(deepcopy(guards))
+    best, best_frame = None, 0
+    for i in range(period):
+        res = safety_factor(pos, nx, ny)
+        if best is None or res < best:
+            best, best_frame = res, i
+        pos = step(pos)
 
-    plot_map_interactive(guard_frames, nx, ny)
-
-    res = 1e12
-    guards = deepcopy(guard_frames[0])
-    i = 0
-    while True:
-        guards = update(guards, nx, ny)
-        i += 1
-        new_res = count_quadrants(guards, nx, ny)
-        if new_res < res:
-            plot_map(guards, nx, ny, f"Frame {i}")
-            res = new_res
-    
-    return 0
+    return best_frame
 
 
 if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
@@ -1,5 +1,6 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
 
 
@@ -129,8 +130,8 @@ def print_grid(grid, boxes, robot, direction=None):
 
 def parse_input(wide=False):
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        lines = file.read().strip().split("\n")
+    # The input text is memoized, the grid depends on the width of the warehouse
+    lines = aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt")).split("\n")
 
     grid = []
     boxes = []
@@ -159,6 +160,7 @@ def parse_input(wide=False):
     return grid, boxes, robot, directions
 
 
+@aoc.solution(2024, 15, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -174,6 +176,7 @@ def solve_level_1():
     return sum([box.x + 100 * box.y for box in boxes])
 
 
+@aoc.solution(2024, 15, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -193,27 +196,44 @@ if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
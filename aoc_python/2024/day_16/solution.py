@@ -1,158 +1,82 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
 
 
 class Maze:
-    def __init__(self, path, start_pos, end_pos, start_orientation="E"):
-        self._nodes = []
-        self._neighbours = {}
-        self._start_node = (start_pos[0], start_pos[1], start_orientation)
-        self._end_nodes = [(end_pos[0], end_pos[1], orientation) for orientation in self.get_orientations()]
-
-        self._nx = len(path[0])
-        self._ny = len(path)
-
-        self._build_maze(path)
+    def __init__(self, grid, start_pos, end_pos, start_orientation="E"):
+        self._grid = grid
+        self._open = grid.flat.tolist()
+        self._offsets = grid.neighbour_offsets().tolist()
+
+        # Each node is a cell and an orientation, encoded as flat_index * 4 + orientation
+        start = grid.to_flat(*start_pos)
+        end = grid.to_flat(*end_pos)
+        self._start_node = start * 4 + self.get_orientations().index(start_orientation)
+        self._end_nodes = [end * 4 + o for o in range(4)]
+        self._n_nodes = grid.flat.size * 4
 
     @staticmethod
     def get_orientations():
+        # Same order as the directions of the grid
         return "NESW"
 
-    @staticmethod
-    def rotate(orientation, clockwise=True):
-        if clockwise:
-            return "ESWN"["NESW".index(orientation)]
-        return "WNES"["NESW".index(orientation)]
-
-    def _add_node(self, i, j, path):
-
-        for o in self.get_orientations():
-            self._nodes.append((i, j, o))
-            self._neighbours[(i, j, o)] = set()
-            self._neighbours[(i, j, o)].add(((i, j, self.rotate(o)), 1000))
-            self._neighbours[(i, j, o)].add(((i, j, self.rotate(o, clockwise=False)), 1000))
-
-        if path[i-1][j]:
-            self._neighbours[(i, j, "W")].add(((i-1, j, "W"), 1))
-
-        if path[i+1][j]:
-            self._neighbours[(i, j, "E")].add(((i+1, j, "E"), 1))
+    def _neighbours(self, node):
 
-        if path[i][j-1]:
-            self._neighbours[(i, j, "N")].add(((i, j-1, "N"), 1))
+        cell, o = divmod(node, 4)
+        neighbours = [(cell * 4 + (o + 1) % 4, 1000), (cell * 4 + (o - 1) % 4, 1000)]
 
-        if path[i][j+1]:
-            self._neighbours[(i, j, "S")].add(((i, j+1, "S"), 1))
+        nxt = cell + self._offsets[o]
+        if self._open[nxt]:
+            neighbours.append((nxt * 4 + o, 1))
 
-    def _build_maze(self, path):
-
-        for i, line in enumerate(path):
-            for j, valid in enumerate(line):
-                if valid:
-                    self._add_node(i, j, path)
+        return neighbours
 
     def __repr__(self):
-        output = ""
-        for j in range(self._ny):
-            for i in range(self._nx):
-                output += "." if (i, j, "E") in self._nodes else "#"
-
-            output += "\n"
-        return output
+        return self._grid.to_text({0: "#", 1: "."})
 
     def shortest_path(self):
 
-        costs = {self._start_node: 0}
-
-        todo = set()
-        todo.add(self._start_node)
-        visited = []
-
-        while todo:
-            node = min(todo, key=lambda x: costs[x])
-
-            todo.remove(node)
-
-            if node in self._end_nodes:
-                return costs[node]
+        costs = aoc.search.dijkstra(self._neighbours, self._start_node, self._n_nodes, targets=self._end_nodes)
 
-            for nei, move_cost in self._neighbours[node]:
-                if nei not in visited:
-                    if nei not in costs or costs[node] + move_cost < costs[nei]:
-                        costs[nei] = costs[node] + move_cost
-                        todo.add(nei)
+        cost = min(costs[self._end_nodes])
 
-        return -1
+        return int(cost) if cost < float("inf") else -1
 
     def best_tiles(self):
 
-        costs = {self._start_node: 0}
+        costs, predecessors = aoc.search.dijkstra(self._neighbours, self._start_node, self._n_nodes,
+                                                  targets=self._end_nodes, return_predecessors=True)
 
-        todo = set()
-        todo.add(self._start_node)
-        visited = []
+        end_cost = min(costs[self._end_nodes])
+        end_nodes = [n for n in self._end_nodes if costs[n] == end_cost]
 
-        parents = {self._start_node: None}
-        end_cost = None
+        best_nodes = aoc.search.shortest_path_nodes(predecessors, end_nodes)
 
-        while todo:
-            node = min(todo, key=lambda x: costs[x])
+        return len(set([n // 4 for n in best_nodes]))
 
-            todo.remove(node)
 
-            if end_cost is not None and costs[node] > end_cost:
-                continue
+def parse_txt(txt):
 
-            if node in self._end_nodes:
-                end_cost = costs[node]
+    chars = aoc.Grid.from_text(txt)
+    grid = aoc.Grid.from_text(txt, mapping={".": 1, "S": 1, "E": 1, "#": 0})
 
-            for nei, move_cost in self._neighbours[node]:
-                if nei not in visited:
+    start_pos = chars.find_one(ord("S"))
+    end_pos = chars.find_one(ord("E"))
 
-                    # Neighbour already visited: a second path leads to that node
-                    if nei in costs and costs[node] + move_cost == costs[nei]:
-                        parents[nei].append(node)
+    maze = Maze(grid, start_pos, end_pos)
 
-                    if nei not in costs or costs[node] + move_cost < costs[nei]:
-                        costs[nei] = costs[node] + move_cost
-                        parents[nei] = [node]
-                        todo.add(nei)
-
-        best_tiles = set()
-
-        todo = [n for n in self._end_nodes if n in parents]
-        while len(todo) > 0:
-            n = todo.pop(0)
-            best_tiles.add((n[0], n[1]))
-            node_parents = parents[n]
-            if n != self._start_node:
-                todo.extend([n2 for n2 in node_parents])
-
-        return len(best_tiles)
+    return maze
 
 
 def parse_input():
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        lines = file.read().strip().split("\n")
-
-    path = []
-    for j, line in enumerate(lines):
-        path.append([False if c == "#" else True for c in line])
-
-        if "S" in line:
-            start_pos = (line.index("S"), j)
-        if "E" in line:
-            end_pos = (line.index("E"), j)
-
-    path = list(map(list, zip(*path)))
-
-    maze = Maze(path, start_pos, end_pos)
-
-    return maze
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
 
 
+@aoc.solution(2024, 16, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -164,6 +88,7 @@ def solve_level_1():
     return maze.shortest_path()
 
 
+@aoc.solution(2024, 16, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -179,27 +104,44 @@ if __name__ == "__main__":
 
     debug = True
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
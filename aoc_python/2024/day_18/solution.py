@@ -1,6 +1,8 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
+import numpy as np
 
 
 class Grid:
@@ -11,16 +13,13 @@ class Grid:
         self._last_byte = None
         self._path = None
 
-        self._grid = [[0 for _ in range(self._h)] for _ in range(self._w)]
+        # Padding cells are corrupted, so that the memory space is closed
+        self._grid = aoc.Grid(np.zeros((self._w, self._h), dtype=np.int32), fill=1)
+        self._corrupted = self._grid.flat.tolist()
+        self._neighbours = self._grid.neighbour_table().tolist()
 
     def __repr__(self):
-        output = ""
-        for j in range(self._h):
-            for i in range(self._w):
-                output += "." if self._grid[i][j] == 0 else "#"
-
-            output += "\n"
-        return output
+        return "\n".join(["".join(["." if v == 0 else "#" for v in line]) for line in self._grid.values.T])
 
     def fall_bytes(self, num_bytes=-1):
 
@@ -30,50 +29,28 @@ class Grid:
         while num_bytes > 0 and len(self._byte_list) > 0:
             i, j = self._byte_list.pop(0)
             self._last_byte = (i, j)
-            self._grid[i][j] += 1
+            self._grid[i, j] += 1
+            self._corrupted[self._grid.to_flat(i, j)] += 1
             num_bytes -= 1
 
-    def get_neighbours(self, i, j):
-
-        dirs = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-        neighbours = []
-        for di, dj in dirs:
-            i2 = i + di
-            j2 = j + dj
-            if i2 >= 0 and j2 >= 0 and i2 < self._w and j2 < self._h and self._grid[i2][j2] == 0:
-                neighbours.append((i2, j2))
-        return neighbours
+    def get_neighbours(self, node):
+        return [nei for nei in self._neighbours[node] if self._corrupted[nei] == 0]
 
     def shortest_path(self):
 
-        start_node = (0, 0)
-        end_node = (self._w - 1, self._h - 1)
-
-        visited = set()
-        lengths = {start_node: 0}
-        todo = [start_node]
-        parents = {start_node: None}
-
-        while len(todo) > 0:
-            coords = todo.pop(0)
-            visited.add(coords)
-            for nei in self.get_neighbours(*coords):
-                length = lengths[coords] + 1
-                if nei not in visited or length < lengths[nei]:
-                    lengths[nei] = length
-                    parents[nei] = coords
-                    if nei not in todo:
-                        todo.append(nei)
-
-                if nei == end_node:
-                    n = nei
-                    self._path = [n]
-                    while parents[n] is not None:
-                        n = parents[n]
-                        self._path.append(n)
-                    return lengths[nei]
-
-        return -1
+        start_node = self._grid.to_flat(0, 0)
+        end_node = self._grid.to_flat(self._w - 1, self._h - 1)
+
+        lengths, parents = aoc.search.bfs(self.get_neighbours, start_node, len(self._corrupted),
+                                          targets=[end_node], return_parents=True)
+
+        if lengths[end_node] < 0:
+            return -1
+
+        path = aoc.search.reconstruct_path(parents, end_node)
+        self._path = [tuple(map(int, self._grid.to_coords(n))) for n in path[::-1]]
+
+        return int(lengths[end_node])
 
     def get_last_byte(self):
         return self._last_byte
@@ -82,16 +59,20 @@ class Grid:
         return self._path
 
 
-def parse_input():
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
+def parse_txt(txt):
 
     byte_list = [list(map(int, line.split(","))) for line in txt.split("\n")]
 
     return byte_list
 
 
+def parse_input():
+
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
+
+
+@aoc.solution(2024, 18, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -109,6 +90,7 @@ def solve_level_1():
     return grid.shortest_path()
 
 
+@aoc.solution(2024, 18, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -135,27 +117,44 @@ if __name__ == "__main__":
 
     debug = True
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
@@ -1,15 +1,10 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
 
-POSSIBLE_MEM = {}
-WAYS_MEM = {}
 
-
-def parse_input():
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
+def parse_txt(txt):
 
     lines = txt.split("\n")
     
@@ -19,27 +14,29 @@ def parse_input():
     return elems, target_list
 
 
-def is_possible(target, elems):
+def parse_input():
 
-    if target in POSSIBLE_MEM:
-        return POSSIBLE_MEM[target]
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
+
+
+# The towel patterns are the same for a whole run, so that only the target is used as key
+@aoc.memo.memoize(key=lambda target, elems: target)
+def is_possible(target, elems):
 
     if len(target) == 0:
         return True
 
     for elem in elems:
         if target.startswith(elem) and is_possible(target[len(elem):], elems):
-            POSSIBLE_MEM[target] = True
             return True
-    
-    POSSIBLE_MEM[target] = False
+
     return False
 
+
+@aoc.memo.memoize(key=lambda target, elems: target)
 def num_ways(target, elems):
 
-    if target in WAYS_MEM:
-        return WAYS_MEM[target]
-    
     if len(target) == 0:
         return 1
 
@@ -49,10 +46,10 @@ def num_ways(target, elems):
         if target.startswith(elem):
             n += num_ways(target[len(elem):], elems)
 
-    WAYS_MEM[target] = n
-    
     return n
 
+
+@aoc.solution(2024, 19, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -61,9 +58,11 @@ def solve_level_1():
     # Read input file
     elems, target_list = parse_input()
 
-    return len([0 for target in target_list if is_possible(target, elems)])
+    with aoc.memo.scope(is_possible):
+        return len([0 for target in target_list if is_possible(target, elems)])
 
 
+@aoc.solution(2024, 19, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -72,34 +71,52 @@ def solve_level_2():
     # Read input file
     elems, target_list = parse_input()
 
-    return sum([num_ways(target, elems) for target in target_list])
+    with aoc.memo.scope(num_ways):
+        return sum([num_ways(target, elems) for target in target_list])
 
 
 if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
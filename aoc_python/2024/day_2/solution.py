@@ -1,26 +1,8 @@
 import pathlib as pl
+import argparse
 import adventofcode as aoc
 
 
-def get_year_day_from_path():
-    """
-    Get the challenge year and day from the current path
-
-    Returns
-    -------
-    int
-        Challenge year
-    int
-        Challenge day
-    """
-
-    this_path = str(pl.Path(__file__).resolve())
-    year = int(this_path.split("/")[-3])
-    day = int(this_path.split("day_")[1].split("/")[0])
-
-    return year, day
-
-
 def is_monotonous(report):
 
     sorted_report = list(sorted(report))
@@ -56,6 +38,18 @@ def is_safe_with_tol(report, min_diff=1, max_diff=3):
     return False
 
 
+def parse_txt(txt):
+
+    return [list(map(int, line.split())) for line in txt.split("\n")]
+
+
+def parse_input():
+
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), parser=parse_txt)
+
+
+@aoc.solution(2024, 2, 1)
 def solve_level_1():
 
     """
@@ -63,10 +57,7 @@ def solve_level_1():
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
-
-    report_list = [list(map(int, line.split()))for line in input_txt.split("\n")]
+    report_list = parse_input()
 
     total = 0
     for report in report_list:
@@ -76,6 +67,7 @@ def solve_level_1():
     return total
 
 
+@aoc.solution(2024, 2, 2)
 def solve_level_2():
 
     """
@@ -83,10 +75,7 @@ def solve_level_2():
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
-
-    report_list = [list(map(int, line.split()))for line in input_txt.split("\n")]
+    report_list = parse_input()
 
     total = 0
     for report in report_list:
@@ -100,18 +89,33 @@ if __name__ == "__main__":
 
     debug = True
 
-    year, day = get_year_day_from_path()
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=pl.Path(__file__).parent.resolve())
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, pl.Path(__file__).parent.resolve(), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
                 print(solve_level_1())
@@ -1,95 +1,79 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
-from copy import deepcopy
+import numpy as np
 
 
 class Race:
 
     def __init__(self, lines):
-        
-        grid = []
 
-        for i, line in enumerate(lines):
+        txt = "\n".join(lines)
 
-            grid.append([False if c == "#" else True for c in line])
+        # Track cells are 1, walls and padding cells are 0
+        self._grid = aoc.Grid.from_text(txt, mapping={".": 1, "S": 1, "E": 1})
+        chars = aoc.Grid.from_text(txt)
+
+        self._start_pos = chars.find_one(ord("S"))
+        self._end_pos = chars.find_one(ord("E"))
+
+        self._track = self._grid.flat.tolist()
+        self._neighbours = self._grid.neighbour_table().tolist()
 
-            if "S" in line:
-                self._start_pos = (line.index("S"), i)
-            
-            if "E" in line:
-                self._end_pos = (line.index("E"), i)
-    
-        self._init_grid = list(map(list, zip(*grid)))
-        self._grid = deepcopy(self._init_grid)
-
-        self._ni = len(self._grid)
-        self._nj = len(self._grid[0])
-    
     def __repr__(self):
+        chars = {0: "#", 1: "."}
+        lines = [list(line) for line in self._grid.to_text(chars).split("\n")]
+        lines[self._start_pos[0]][self._start_pos[1]] = "S"
+        lines[self._end_pos[0]][self._end_pos[1]] = "E"
+        return "\n".join(["".join(line) for line in lines]) + "\n"
 
-        output = ""
+    def _get_neighbours(self, node):
+        return [nei for nei in self._neighbours[node] if self._track[nei]]
 
-        for j in range(self._nj):
-            for i in range(self._ni):
+    def get_main_path(self):
 
-                if self._start_pos == (i, j):
-                    output += "S"
-                elif self._end_pos == (i, j):
-                    output += "E"
-                else:
-                    output += "." if self._grid[i][j] else "#"
-            
-            output += "\n"
+        start = self._grid.to_flat(*self._start_pos)
+        end = self._grid.to_flat(*self._end_pos)
 
-        return output
-    
-    def reset(self):
-        self._grid = deepcopy(self._init_grid)
+        _, parents = aoc.search.bfs(self._get_neighbours, start, len(self._track), targets=[end], return_parents=True)
 
-    def _get_neighbours(self, i, j):
-        nei = []
+        return np.array(aoc.search.reconstruct_path(parents, end))
 
-        dirs = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    def get_path_coords(self, path):
+        return np.stack(self._grid.to_coords(path), axis=1)
 
-        for di, dj in dirs:
-            i2 = i + di
-            j2 = j + dj
+    def get_cheat_times(self, path):
+        """
+        Time saved by going through each wall between two cells of the track
+        """
 
-            if i2 >= 0 and j2 >= 0 and i2 < self._ni and j2 < self._nj and self._grid[i2][j2]:
-                nei.append((i2, j2))
+        # Time at which each cell of the track is reached, -1 for walls
+        times = np.full(len(self._track), -1)
+        times[path] = np.arange(len(path))
 
-        return nei
-    
-    def get_main_path(self):
-        path = [self._start_pos]
-        pos = self._start_pos
-        while pos != self._end_pos:
-            for nei in self._get_neighbours(*pos):
-                if nei not in path:
-                    path.append(nei)
-                    pos = nei
-                    break
-        
-        return path
-    
-    def get_cheat_positions(self):
-        cheat_pos = []
-        for i in range(self._ni):
-            for j in range(self._nj):
-                if not self._grid[i][j] and len(self._get_neighbours(i, j)) >= 2:
-                    cheat_pos.append((i, j))
-        return cheat_pos
+        walls = self._grid.cells()[~self._grid.mask(1).ravel()]
+        nei_times = times[self._grid.neighbour_table()[walls]]
 
+        first = np.where(nei_times >= 0, nei_times, len(path)).min(axis=1)
+        last = nei_times.max(axis=1)
 
-def parse_input():
+        # Walls with less than two track neighbours save no time
+        return np.where(last > first, last - first - 2, 0)
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        lines = file.read().strip().split("\n")
 
-    return Race(lines)
+def parse_txt(txt):
 
+    return Race(txt.split("\n"))
 
+
+def parse_input():
+
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
+
+
+@aoc.solution(2024, 20, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -100,22 +84,12 @@ def solve_level_1():
 
     path = race.get_main_path()
 
-    cheat_pos = race.get_cheat_positions()
-
     thresh = 100
-    num = 0
-
-    for pos in cheat_pos:
-        cheat_nei = race._get_neighbours(*pos)
-        ps = [path.index(p) for p in cheat_nei]
-        time_saved = max(ps) - min(ps) - 2
 
-        if time_saved >= thresh:
-            num += 1
-
-    return num
+    return int((race.get_cheat_times(path) >= thresh).sum())
 
 
+@aoc.solution(2024, 20, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -125,37 +99,37 @@ def solve_level_2():
     race = parse_input()
 
     path = race.get_main_path()
+    coords = race.get_path_coords(path)
     max_cheat_len = 20
+    thresh = 100
 
-    cheats = {}
-
-    for t0, p1 in enumerate(path):
-        for dt, p2 in enumerate(path[t0+1:]):
-
-            dp = tuple(x2 - x1 for x1, x2 in zip(p1, p2))
-            t = abs(dp[0]) + abs(dp[1])
-
-            time_saved = dt - t + 1
+    num = 0
 
-            if t <= max_cheat_len and time_saved > 0:
+    # Cheats from each cell of the track to the cells at least `thresh` steps further
+    for t0 in range(len(path) - thresh):
 
-                if time_saved not in cheats:
-                    cheats[time_saved]  = 0
-                
-                cheats[time_saved] += 1
+        dist = np.abs(coords[t0+thresh:] - coords[t0]).sum(axis=1)
+        time_saved = np.arange(thresh, len(path) - t0) - dist
 
-    return sum([cheats[k] for k in cheats if k >= 100])
+        num += int(np.count_nonzero((dist <= max_cheat_len) & (time_saved >= thresh)))
 
+    return num
 
 if __name__ == "__main__":
 
     debug = True
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     level = 2
     if level < 1:
         raise aoc.WrongLevelError()
@@ -163,16 +137,27 @@ if __name__ == "__main__":
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
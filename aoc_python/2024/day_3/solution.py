@@ -1,32 +1,21 @@
 import pathlib as pl
 import re
+import argparse
 import adventofcode as aoc
 
 
-def get_year_day_from_path():
-    """
-    Get the challenge year and day from the current path
-
-    Returns
-    -------
-    int
-        Challenge year
-    int
-        Challenge day
-    """
-
-    this_path = str(pl.Path(__file__).resolve())
-    year = int(this_path.split("/")[-3])
-    day = int(this_path.split("day_")[1].split("/")[0])
-
-    return year, day
-
-
 def solve(txt):
     result = re.findall(r"mul\(\d+,\d+\)", txt)
     return sum([int((num := re.split(r"\W", res))[1]) * int(num[2]) for res in result])
 
 
+def parse_input():
+
+    # The input text is memoized, so that both levels read it once
+    return aoc.load_input(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"))
+
+
+@aoc.solution(2024, 3, 1)
 def solve_level_1():
 
     """
@@ -34,12 +23,12 @@ def solve_level_1():
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
+    input_txt = parse_input()
 
     return solve(input_txt)
 
 
+@aoc.solution(2024, 3, 2)
 def solve_level_2():
 
     """
@@ -47,8 +36,7 @@ def solve_level_2():
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
+    input_txt = parse_input()
 
     txt = re.sub(r"don't\(\)(.|\n)*?do\(\)", "", input_txt)
     return solve(txt)
@@ -58,11 +46,17 @@ if __name__ == "__main__":
 
     debug = True
 
-    year, day = get_year_day_from_path()
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=pl.Path(__file__).parent.resolve())
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     level = 2
     if level < 1:
         raise aoc.WrongLevelError()
@@ -70,7 +64,16 @@ if __name__ == "__main__":
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, pl.Path(__file__).parent.resolve(), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
                 print(solve_level_1())
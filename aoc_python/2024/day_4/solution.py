@@ -1,140 +1,53 @@
 import pathlib as pl
+import argparse
 import adventofcode as aoc
-
-
-def get_year_day_from_path():
-    """
-    Get the challenge year and day from the current path
-
-    Returns
-    -------
-    int
-        Challenge year
-    int
-        Challenge day
-    """
-
-    this_path = str(pl.Path(__file__).resolve())
-    year = int(this_path.split("/")[-3])
-    day = int(this_path.split("day_")[1].split("/")[0])
-
-    return year, day
+import numpy as np
 
 
 import pathlib as pl
 
 
-def count_word_at_pos(word, grid, i, j):
-
-    if grid[i][j] != word[0]:
-        return 0
-
-    num = 0
-
-    # Search right
-    if all([grid[i][j+k] == w for k, w in enumerate(word)]):
-        num += 1
-
-    # Search down
-    if all([grid[i+k][j] == w for k, w in enumerate(word)]):
-        num += 1
-
-    # Search left
-    if all([grid[i][j-k] == w for k, w in enumerate(word)]):
-        num += 1
-
-    # Search down
-    if all([grid[i-k][j] == w for k, w in enumerate(word)]):
-        num += 1
-
-    # Search down right
-    if all([grid[i+k][j+k] == w for k, w in enumerate(word)]):
-        num += 1
-
-    # Search down left
-    if all([grid[i+k][j-k] == w for k, w in enumerate(word)]):
-        num += 1
-
-    # Search up right
-    if all([grid[i-k][j+k] == w for k, w in enumerate(word)]):
-        num += 1
-
-    # Search up left
-    if all([grid[i-k][j-k] == w for k, w in enumerate(word)]):
-        num += 1
-
-    return num
-
-
-def count_word(word, grid):
-
-    num = 0
-
-    nrow = len(grid)
-    ncol = len(grid[0])
-
-    for i in range(nrow):
-        for j in range(ncol):
+def match_word(word, grid, pad, di, dj, start=0):
+    """
+    Mask of the cells where the word is read in direction (di, dj), the cell holding its letter of index `start`
+    """
 
-            num += count_word_at_pos(word, grid, i, j)
+    ni, nj = grid.shape
+    mask = np.ones((ni, nj), dtype=bool)
 
-    return num
+    for k, w in enumerate(word):
+        i = pad + (k - start) * di
+        j = pad + (k - start) * dj
+        mask &= grid.padded[i:i+ni, j:j+nj] == ord(w)
 
+    return mask
 
-def pad_grid(grid, pad):
 
-    for line in grid:
-        for _ in range(pad):
-            line.insert(0, ".")
-        line.extend(["." for _ in range(pad)])
+def count_word(word, grid, pad):
 
-    n = len(grid[0])
-    for _ in range(pad):
-        grid.insert(0, ["." for _ in range(n)])
-        grid.insert(len(grid), ["." for _ in range(n)])
+    return sum([int(match_word(word, grid, pad, di, dj).sum()) for di, dj in aoc.Grid.directions_8])
 
 
-def count_x_word_at_pos(word, grid, i, j):
+def count_x_word(word, grid, pad):
 
     n = len(word) // 2
 
-    idx = list([-x - 1 for x in reversed(range(n))])
-    idx.append(0)
-    idx.extend([x + 1 for x in range(n)])
-
-    assert len(idx) == len(word)
-
-    if grid[i][j] != word[n]:
-        return 0
-
-    a = False
-    b = False
     # Search down-right or up-left
-    if all([grid[i+k][j+k] == w for k, w in zip(idx, word)]) or all([grid[i-k][j-k] == w for k, w in zip(idx, word)]):
-        a = True
+    a = match_word(word, grid, pad, 1, 1, start=n) | match_word(word, grid, pad, -1, -1, start=n)
 
     # Search up-right or down-left
-    if all([grid[i+k][j-k] == w for k, w in zip(idx, word)]) or all([grid[i-k][j+k] == w for k, w in zip(idx, word)]):
-        b = True
+    b = match_word(word, grid, pad, 1, -1, start=n) | match_word(word, grid, pad, -1, 1, start=n)
 
-    return int(a) * int(b)
+    return int((a & b).sum())
 
 
-def count_x_word(word, grid):
+def parse_input():
 
-    num = 0
-
-    nrow = len(grid)
-    ncol = len(grid[0])
-
-    for i in range(nrow):
-        for j in range(ncol):
-
-            num += count_x_word_at_pos(word, grid, i, j)
-
-    return num
+    # The input text is memoized, so that both levels read it once
+    return aoc.load_input(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"))
 
 
+@aoc.solution(2024, 4, 1)
 def solve_level_1():
 
     """
@@ -142,18 +55,16 @@ def solve_level_1():
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
+    input_txt = parse_input()
 
     word = "XMAS"
 
-    grid = [[c for c in line] for line in input_txt.split("\n")]
-
-    pad_grid(grid, len(word))
+    grid = aoc.Grid.from_text(input_txt, pad=len(word))
 
-    return count_word(word, grid)
+    return count_word(word, grid, len(word))
 
 
+@aoc.solution(2024, 4, 2)
 def solve_level_2():
 
     """
@@ -161,27 +72,30 @@ def solve_level_2():
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
+    input_txt = parse_input()
 
     word = "MAS"
 
-    grid = [[c for c in line] for line in input_txt.split("\n")]
+    grid = aoc.Grid.from_text(input_txt, pad=len(word) // 2)
 
-    pad_grid(grid, len(word) // 2)
-
-    return count_x_word(word, grid)
+    return count_x_word(word, grid, len(word) // 2)
 
 
 if __name__ == "__main__":
 
     debug = True
 
-    year, day = get_year_day_from_path()
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=pl.Path(__file__).parent.resolve())
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     level = 2
     if level < 1:
         raise aoc.WrongLevelError()
@@ -189,7 +103,16 @@ if __name__ == "__main__":
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, pl.Path(__file__).parent.resolve(), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
                 print(solve_level_1())
@@ -1,27 +1,9 @@
 import pathlib as pl
+import argparse
 import adventofcode as aoc
 
 
-def get_year_day_from_path():
-    """
-    Get the challenge year and day from the current path
-
-    Returns
-    -------
-    int
-        Challenge year
-    int
-        Challenge day
-    """
-
-    this_path = str(pl.Path(__file__).resolve())
-    year = int(this_path.split("/")[-3])
-    day = int(this_path.split("day_")[1].split("/")[0])
-
-    return year, day
-
-
-def parse_input(txt: str):
+def parse_txt(txt: str):
 
     mandatory_before = {}
     update_list = []
@@ -69,16 +51,20 @@ def reorder(update: list, mandatory_before: dict):
                         changed = True
 
 
+def parse_input():
+
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), parser=parse_txt)
+
+
+@aoc.solution(2024, 5, 1)
 def solve_level_1():
     """
     Solve level 1
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
-
-    mandatory_before, update_list = parse_input(input_txt)
+    mandatory_before, update_list = parse_input()
 
     tot = 0
     for update in update_list:
@@ -88,16 +74,14 @@ def solve_level_1():
     return tot
 
 
+@aoc.solution(2024, 5, 2)
 def solve_level_2():
     """
     Solve level 2
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
-
-    mandatory_before, update_list = parse_input(input_txt)
+    mandatory_before, update_list = parse_input()
 
     tot = 0
     for update in update_list:
@@ -112,18 +96,33 @@ if __name__ == "__main__":
 
     debug = False
 
-    year, day = get_year_day_from_path()
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=pl.Path(__file__).parent.resolve())
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, pl.Path(__file__).parent.resolve(), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
                 print(solve_level_1())
@@ -1,144 +1,150 @@
 import pathlib as pl
+import argparse
 import adventofcode as aoc
-import copy
 import tqdm
 
-guard_chars = {(1, 0): "v", (-1, 0): "^", (0, 1): ">", (0, -1): "<"}
+# Directions in the order of the rotations of the guard, the same as the directions of the grid
+guard_chars = "^>v<"
+
+# Values of the cells, padding cells are outside of the lab
+EMPTY, OBSTACLE, GUARD, OUTSIDE = 0, 1, 2, 3
 
 
 class GuardPath:
 
     def __init__(self, txt):
 
-        self.grid = []
-        self._init_grid = []
-        for i, line in enumerate(txt.split("\n")):
-            if "^" in line:
-                self._init_guard_pos = (i, line.index("^"))
-                self.guard_pos = (i, line.index("^"))
-                self._init_guard_dir = (-1, 0)
-                self.guard_dir = (-1, 0)
-
-            self._init_grid.append([c for c in line.replace("^", ".")])
-            self.grid.append([c for c in line.replace("^", ".")])
-        
+        self.grid = aoc.Grid.from_text(txt, mapping={"#": OBSTACLE, "^": GUARD}, fill=OUTSIDE)
 
-        self.boundaries = (len(self.grid), len(self.grid[0]))
-        self.path = {}
-    
-    def move(self):
+        guard_pos = self.grid.find_one(GUARD)
+        self.grid[guard_pos] = EMPTY
+        self._init_guard_pos = int(self.grid.to_flat(*guard_pos))
+        self._init_guard_dir = 0
 
-        trg_pos = list(self.guard_pos)
-        while self.grid[trg_pos[0]][trg_pos[1]] != "#":
+        self._init_cells = self.grid.flat.tolist()
+        self._offsets = self.grid.neighbour_offsets().tolist()
+        self.reset_grid()
 
-            self.grid[trg_pos[0]][trg_pos[1]] = "X"
-            self.guard_pos = tuple(trg_pos)
-        
-            if self.guard_pos not in self.path:
-                self.path[self.guard_pos] = []
+    def compute_path(self):
+        """
+        Walk until the guard leaves the lab or loops, the path maps each visited cell to the directions of the
+        guard on it. Returns whether the guard loops.
+        """
+        cells = self._cells
+        pos, d = self.guard_pos, self.guard_dir
 
-            if self.guard_dir in self.path[self.guard_pos]:
+        while cells[pos] != OUTSIDE:
+            dirs = self.path.setdefault(pos, set())
+            if d in dirs:
                 return True
-            self.path[self.guard_pos].append(self.guard_dir)
+            dirs.add(d)
 
-            trg_pos[0] += self.guard_dir[0]
-            trg_pos[1] += self.guard_dir[1]
+            while cells[pos + self._offsets[d]] == OBSTACLE:
+                d = (d + 1) % 4
+            pos += self._offsets[d]
 
-            if any([p < 0 or p >= b for p, b in zip(trg_pos, self.boundaries)]):
-                self.guard_pos = tuple(trg_pos)
-                break
-        
-        return False
-    
-    def rotate(self):
-        """
-        -1,  0 -->  0,  1
-         1,  0 -->  0, -1
-         0,  1 -->  1,  0
-         0, -1 --> -1,  0
-         """
-        guard_rotation = {(1, 0): (0, -1), (-1, 0): (0, 1), (0, 1): (1, 0), (0, -1): (-1, 0)}
-        self.guard_dir = guard_rotation[self.guard_dir]
+            self.guard_pos, self.guard_dir = pos, d
 
-    def compute_path(self):
-        while all([p >= 0 and p < b for p, b in zip(self.guard_pos, self.boundaries)]):
-            loop = self.move()
-            if loop:
-                break
-            self.rotate()
+        return False
 
     def count_path(self):
-        return sum([line.count("X") for line in self.grid])
-    
+        return len(self.path)
+
     def get_path(self):
         return self.path
-    
+
     def reset_grid(self):
-        self.grid = copy.deepcopy(self._init_grid)
+        self._cells = list(self._init_cells)
         self.guard_pos = self._init_guard_pos
         self.guard_dir = self._init_guard_dir
         self.path = {}
-    
+
     def print_grid(self):
 
-        print()
-        for i, line in enumerate(self.grid):
+        # Padding cells are left out
+        chars = [".#"[c] if c != OUTSIDE else "" for c in self._cells]
+        for pos in self.path:
+            chars[pos] = "X"
+        if self._cells[self.guard_pos] != OUTSIDE:
+            chars[self.guard_pos] = guard_chars[self.guard_dir]
 
-            if self.guard_pos[0] == i:
-                txt_line = "".join(line[:self.guard_pos[1]]) + guard_chars[self.guard_dir] + "".join(line[self.guard_pos[1]+1:])
-            else:
-                txt_line = "".join(line)
-            print(txt_line)
+        _, nj = self.grid.padded.shape
+        lines = ["".join(chars[i:i+nj]) for i in range(0, len(chars), nj)]
         print()
-    
+        print("\n".join([line for line in lines if line]))
+        print()
+
     def add_obstacle(self, pos):
-        self.grid[pos[0]][pos[1]] = "#"
-    
+        self._cells[pos] = OBSTACLE
+
+    def remove_obstacle(self, pos):
+        self._cells[pos] = self._init_cells[pos]
+
+    def next_turn(self, state):
+        """
+        Walk from a state to the next obstacle and turn, states are encoded
+        as flat_index * 4 + direction. Returns None when the guard leaves.
+        """
+        pos, d = divmod(state, 4)
+        offset = self._offsets[d]
+
+        while self._cells[pos + offset] == EMPTY:
+            pos += offset
+
+        if self._cells[pos + offset] == OUTSIDE:
+            return None
+        return pos * 4 + (d + 1) % 4
+
     def check_loop(self):
-        while all([p >= 0 and p < b for p, b in zip(self.guard_pos, self.boundaries)]):
-            loop = self.move()
-            if loop:
-                return True
-            self.rotate()
-        return False
+        # Only the turns are hashed, the guard loops if it turns twice at the same place
+        return aoc.cycles.find_cycle(self.next_turn, self.guard_pos * 4 + self.guard_dir) is not None
+
+
+def parse_txt(txt):
+
+    return GuardPath(txt)
 
 
+def parse_input():
+
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), parser=parse_txt)
+
+
+@aoc.solution(2024, 6, 1)
 def solve_level_1():
     """
     Solve level 1
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
-
-    guard = GuardPath(input_txt)
+    guard = parse_input()
 
     guard.compute_path()
 
     return guard.count_path()
 
 
+@aoc.solution(2024, 6, 2)
 def solve_level_2():
     """
     Solve level 2
     """
 
     # Read input file
-    with open(pl.Path(pl.Path(__file__).parent.resolve(), "input.txt"), "r") as file:
-        input_txt = file.read().strip()
-
-    guard = GuardPath(input_txt)
+    guard = parse_input()
 
     guard.compute_path()
 
     path = guard.get_path()
 
+    # Checking a loop does not move the guard, so that only the obstacle is undone
+    guard.reset_grid()
+
     tot = 0
     for p in tqdm.tqdm(path):
 
-        if not all([pi == gi for pi, gi in zip(p, guard._init_guard_pos)]):
-            guard.reset_grid()
+        if p != guard._init_guard_pos:
             guard.add_obstacle(p)
 
             loop = guard.check_loop()
@@ -146,6 +152,8 @@ def solve_level_2():
             if loop:
                 tot += 1
 
+            guard.remove_obstacle(p)
+
     return tot
 
 
@@ -153,13 +161,28 @@ if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=pl.Path(__file__).parent.resolve())
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
+
+    if debug and args.profile is not None:
+        # Profile the solution
+        from adventofcode.profiling import profile_level
+
+        solve = solve_level_1 if level == 1 else solve_level_2
+        answer, report = profile_level(solve, args.profile, pl.Path(__file__).parent.resolve(), level)
+        print(report)
+        print(answer)
 
-    if debug:
+    elif debug:
         # Just print the solution
         if level == 1:
             print(solve_level_1())
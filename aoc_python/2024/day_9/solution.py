@@ -1,12 +1,10 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
 
 
-def parse_input(flag=False):
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
+def parse_txt(txt):
 
     # Array of (value, index_start, length)
     values = []
@@ -20,10 +18,7 @@ def parse_input(flag=False):
         index_start += int(txt[i-1]) if i > 0 else 0
         num_values = int(txt[i])
 
-        if flag:
-            values.append((value, index_start, num_values, True))
-        else:
-            values.append((value, index_start, num_values))
+        values.append((value, index_start, num_values))
 
         index_start += num_values
         value += 1
@@ -33,6 +28,17 @@ def parse_input(flag=False):
     return values
 
 
+def parse_input(flag=False):
+
+    # The parsed input is memoized, each call returns a fresh copy
+    values = aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
+
+    if flag:
+        values = [v + (True,) for v in values]
+
+    return values
+
+
 def to_array(values: list[tuple], flag=False):
     output = []
 
@@ -120,6 +126,7 @@ def compress_part2(values: list[tuple]):
         j -= 1
 
 
+@aoc.solution(2024, 9, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -133,6 +140,7 @@ def solve_level_1():
     return sum([i * v for i, v in enumerate(to_array(values))])
 
 
+@aoc.solution(2024, 9, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -150,27 +158,44 @@ if __name__ == "__main__":
 
     debug = True
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
             
             print(f"Level {level} run in {stop - start:.4e} s")
 
@@ -1,14 +1,13 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
 
 
 def parse_input():
 
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
-
-    return txt
+    # The input text is memoized, so that both levels read it once
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"))
 
 
 def num_digits(n):
@@ -22,14 +21,6 @@ def num_digits(n):
     return n_digits
 
 
-def split_parts(n, part_factor):
-    parts = []
-    while n > 0:
-        parts.append(n - n // part_factor * part_factor)
-        n //= part_factor
-    return parts[::-1]
-
-
 def join_parts(parts, part_factor):
     num = 0
     for i, part in enumerate(parts[::-1]):
@@ -41,59 +32,54 @@ def repeat_part(part, part_factor, num_parts):
     return join_parts([part] * num_parts, part_factor)
 
 
-def keep_first_part(parts):
-
-    for part in parts[1:]:
-        if part > parts[0]:
-            return False
-        if part < parts[0]:
-            return True
-
-    return True
-
-
-def next_invalid(n, split_in=2):
+def mobius(n):
 
-    nd = num_digits(n)
-    part_factor = 10 ** (nd // split_in)
+    res = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            res = -res
+        p += 1
 
-    # Only numbers with even numbers of digits can be invalid
-    if nd % split_in == 0:
+    return -res if n > 1 else res
 
-        parts = split_parts(n, part_factor)
 
-        if not keep_first_part(parts):
+def sum_repeated(r1, r2, nd, part_len):
+    """
+    Sum of the numbers of nd digits between r1 and r2 made of one part of
+    part_len digits repeated, as an arithmetic series over the parts
+    """
 
-            parts[0] += 1
-            if num_digits(parts[0]) != num_digits(parts[1]):
-                return next_invalid(10**(nd+1), split_in=split_in)
+    part_factor = 10 ** part_len
+    unit = repeat_part(1, part_factor, nd // part_len)
 
-        return repeat_part(parts[0], part_factor, split_in)
+    p1 = max(part_factor // 10, -(-r1 // unit))
+    p2 = min(part_factor - 1, r2 // unit)
+    if p2 < p1:
+        return 0
 
-    return next_invalid(10**nd, split_in=split_in)
+    return unit * (p1 + p2) * (p2 - p1 + 1) // 2
 
 
 def get_invalid_in_range(r1, r2, half_split_only=True):
 
     tot = 0
 
-    if half_split_only:
-        num = next_invalid(r1)
+    for nd in range(max(2, num_digits(r1)), num_digits(r2) + 1):
 
-        while num <= r2:
-            tot += num
-            num = next_invalid(num+1)
-
-    else:
-        max_split = max(2, num_digits(r1))
-        nums = [next_invalid(r1, n) for n in range(2, max_split+1)]
-        num = min(nums)
+        if half_split_only:
+            if nd % 2 == 0:
+                tot += sum_repeated(r1, r2, nd, nd // 2)
 
-        while num <= r2:
-            tot += num
-            max_split = max(2, num_digits(num+1))
-            nums = [next_invalid(num+1, n) for n in range(2, max_split+1)]
-            num = min(nums)
+        else:
+            # Numbers with several repeated parts (e.g. 1111 for parts of
+            # 1 and 2 digits) are counted once by inclusion-exclusion
+            for part_len in range(1, nd):
+                if nd % part_len == 0:
+                    tot -= mobius(nd // part_len) * sum_repeated(r1, r2, nd, part_len)
 
     return tot
 
@@ -102,6 +88,7 @@ def get_invalid_sum(ranges, half_split_only=True):
     return sum([get_invalid_in_range(r1, r2, half_split_only=half_split_only) for r1, r2 in ranges])
 
 
+@aoc.solution(2025, 2, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -115,6 +102,7 @@ def solve_level_1():
     return get_invalid_sum(ranges)
 
 
+@aoc.solution(2025, 2, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -142,27 +130,44 @@ if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
 
             print(f"Level {level} run in {stop - start:.4e} s")
 
@@ -1,47 +1,30 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
 
 
-def parse_input():
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
+def parse_txt(txt):
 
-    grid = [[1 if c == "@" else 0 for c in row] for row in txt.split("\n")]
+    grid = aoc.Grid.from_text(txt, mapping={"@": 1, ".": 0})
 
     return grid
 
 
-def is_accessible(grid, i, j):
-
-    num_adjacent = 0
-
-    for di in [-1, 0, 1]:
-        for dj in [-1, 0, 1]:
-            if (i + di >= 0 and i + di < len(grid)
-                and j + dj >= 0 and j + dj < len(grid[0])
-                and not (di == 0 and dj == 0)):
-                num_adjacent += grid[i+di][j+dj]
-
-    return num_adjacent < 4
-
+def parse_input():
 
-def count_accessible(grid, update_grid=False):
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
 
-    accessible = 0
 
-    for i in range(len(grid)):
-        for j in range(len(grid[0])):
+def get_accessible(grid):
 
-            if grid[i][j] == 1 and is_accessible(grid, i, j):
-                accessible += 1
-                if update_grid:
-                    grid[i][j] = 0
+    rolls = grid.values == 1
 
-    return accessible
+    return rolls & (grid.count_neighbours(rolls) < 4)
 
 
+@aoc.solution(2025, 4, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -50,9 +33,10 @@ def solve_level_1():
     # Read input file
     grid = parse_input()
 
-    return count_accessible(grid)
+    return int(get_accessible(grid).sum())
 
 
+@aoc.solution(2025, 4, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -63,10 +47,11 @@ def solve_level_2():
 
     removed = 0
 
-    accessible = count_accessible(grid, update_grid=True)
-    while accessible > 0:
-        removed += accessible
-        accessible = count_accessible(grid, update_grid=True)
+    accessible = get_accessible(grid)
+    while accessible.any():
+        removed += int(accessible.sum())
+        grid[accessible] = 0
+        accessible = get_accessible(grid)
 
     return removed
 
@@ -75,27 +60,44 @@ if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
 
             print(f"Level {level} run in {stop - start:.4e} s")
 
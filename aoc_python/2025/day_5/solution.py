@@ -1,12 +1,10 @@
 import os
 import time
+import argparse
 import adventofcode as aoc
 
 
-def parse_input():
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
+def parse_txt(txt):
 
     fresh_ranges = []
     available = []
@@ -17,9 +15,16 @@ def parse_input():
         elif line != "":
             available.append(int(line))
 
-    return sorted(fresh_ranges, key=lambda x: x[0]), available
+    return fresh_ranges, available
+
+
+def parse_input():
+
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
 
 
+@aoc.solution(2025, 5, 1)
 def solve_level_1():
     """
     Solve level 1
@@ -28,33 +33,12 @@ def solve_level_1():
     # Read input file
     fresh_ranges, available = parse_input()
 
-    num_fresh = 0
-
-    for item in available:
-        for r0, r1 in fresh_ranges:
-            if item >= r0 and item <= r1:
-                num_fresh += 1
-                break
-
-    return num_fresh
-
-
-def reduce_ranges(init_ranges):
+    fresh = aoc.IntervalSet(fresh_ranges)
 
-    new_ranges = [init_ranges[0]]
-
-    for r0, r1 in init_ranges:
-
-        nr0, nr1 = new_ranges[-1]
-
-        if r0 <= nr1:
-            new_ranges[-1] = (min(r0, nr0), max(r1, nr1))
-        else:
-            new_ranges.append((r0, r1))
-
-    return new_ranges
+    return fresh.count(available)
 
 
+@aoc.solution(2025, 5, 2)
 def solve_level_2():
     """
     Solve level 2
@@ -63,36 +47,51 @@ def solve_level_2():
     # Read input file
     fresh_ranges, _ = parse_input()
 
-    fresh_ranges = reduce_ranges(fresh_ranges)
-
-    return sum([r1 - r0 + 1 for r0, r1 in fresh_ranges])
+    return aoc.IntervalSet(fresh_ranges).total_length()
 
 
 if __name__ == "__main__":
 
     debug = False
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
 
             print(f"Level {level} run in {stop - start:.4e} s")
 
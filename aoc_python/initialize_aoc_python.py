@@ -10,17 +10,22 @@ class ParserError(Exception):
 
 python_canevas = """import os
 import time
+import argparse
 import adventofcode as aoc
 
 
-def parse_input():
-
-    with open(os.path.join(os.path.dirname(__file__), "input.txt"), "r") as file:
-        txt = file.read().strip()
+def parse_txt(txt):
 
     return txt
 
 
+def parse_input():
+
+    # The parsed input is memoized, each call returns a fresh copy
+    return aoc.load_input(os.path.join(os.path.dirname(__file__), "input.txt"), parser=parse_txt)
+
+
+@aoc.solution(<year>, <day>, 1)
 def solve_level_1():
     \"\"\"
     Solve level 1
@@ -34,6 +39,7 @@ def solve_level_1():
     return 0
 
 
+@aoc.solution(<year>, <day>, 2)
 def solve_level_2():
     \"\"\"
     Solve level 2
@@ -51,27 +57,44 @@ if __name__ == "__main__":
 
     debug = True
 
-    year, day = aoc.get_year_day_from_path(__file__)
-    con = aoc.AOCConnector(year, day)
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--refresh", action="store_true", help="force fetching the current level")
+    parser.add_argument("--profile", choices=["cpu", "mem"], help="profile the current level")
+    args = parser.parse_args()
+
+    # Year and day registered by the solution decorator
+    year, day, _ = solve_level_1.aoc_solution
+    con = aoc.AOCConnector(year, day, cache_dir=os.path.dirname(__file__))
 
     # Get current level
-    level = con.get_level()
+    level = con.get_level(refresh=args.refresh)
     if level < 1:
         raise aoc.WrongLevelError()
     if level > 2:
         print("This challenge was already solved!")
 
     else:
-        if debug:
+        if debug and args.profile is not None:
+            # Profile the solution
+            from adventofcode.profiling import profile_level
+
+            solve = solve_level_1 if level == 1 else solve_level_2
+            answer, report = profile_level(solve, args.profile, os.path.dirname(__file__), level)
+            print(report)
+            print(answer)
+
+        elif debug:
             # Just print the solution
             if level == 1:
-                start = time.time()
-                print(solve_level_1())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_1()
+                stop = time.perf_counter()
+                print(answer)
             elif level == 2:
-                start = time.time()
-                print(solve_level_2())
-                stop = time.time()
+                start = time.perf_counter()
+                answer = solve_level_2()
+                stop = time.perf_counter()
+                print(answer)
 
             print(f"Level {level} run in {stop - start:.4e} s")
 
@@ -91,8 +114,8 @@ if __name__ == "__main__":
 if __name__ == "__main__":
 
     # Setup parser
-    usage_str = "python initialize_challenge.py -y [year] -d [day]"
-    descr_str = "Initializes an Advent of Code challenge with requested day and year."
+    usage_str = "python initialize_challenge.py -y [year] -d [day(s)] | --all"
+    descr_str = "Initializes Advent of Code challenges with requested day(s) and year."
     epilog_str = ""
 
     parser = argparse.ArgumentParser(
@@ -103,8 +126,11 @@ if __name__ == "__main__":
     )
 
     parser.add_argument("-y", "--year", type=int, help="requested year")
-    parser.add_argument("-d", "--day", type=int, help="requested day")
+    parser.add_argument("-d", "--day", type=str, help="requested day, or list/range of days (e.g. 1,3,5-9)")
+    parser.add_argument("-a", "--all", action="store_true", help="initialize all days of the year")
     parser.add_argument("-n", "--name", type=str, help="root directory for challenges")
+    parser.add_argument("-w", "--workers", type=int, default=8, help="number of challenges initialized at once")
+    parser.add_argument("-r", "--rate", type=float, default=None, help="minimum interval between requests (s)")
     parser.add_argument(
         "-f", "--force", action="store_true", help="force overwriting the directory"
     )
@@ -115,12 +141,28 @@ if __name__ == "__main__":
     if args.year is None:
         raise ParserError("No year requested")
 
-    if args.day is None:
+    if args.day is None and not args.all:
         raise ParserError("No day requested")
 
     if args.name is None:
         raise ParserError("No root directory requested")
 
-    con = aoc.AOCConnector(args.year, args.day)
+    if args.rate is not None:
+        aoc.AOCConnector.min_request_interval = args.rate
+
+    if args.all:
+        days = list(range(aoc.AOCConnector.min_day, aoc.AOCConnector.max_day + 1))
+    else:
+        days = aoc.parse_days(args.day)
+
+    if len(days) == 1:
+        con = aoc.AOCConnector(args.year, days[0])
 
-    con.initialize(canevas=python_canevas, dir_name=args.name)
+        con.initialize(canevas=python_canevas, dir_name=args.name, force=args.force)
+
+    else:
+        errors = aoc.AOCConnector.initialize_days(
+            args.year, days, canevas=python_canevas, dir_name=args.name, force=args.force, max_workers=args.workers
+        )
+        for day, err in sorted(errors.items()):
+            print(f"Day {day} could not be initialized: {err!r}")
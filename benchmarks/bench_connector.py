@@ -0,0 +1,99 @@
+# Connector benchmark against the local stand-in AOC server
+#
+# Measures the throughput of concurrent page fetches, and checks the retry,
+# caching and cooldown handling of the connector without network access.
+
+import time
+import argparse
+import tempfile
+import concurrent.futures as cf
+
+import adventofcode as aoc
+from adventofcode.fakeserver import FakeAOCServer
+
+
+def fetch_all(year, days, url, max_workers, cache_dir=None):
+    """Fetch the instruction page and input of several days concurrently.
+
+    Parameters
+    ----------
+    year : int
+        Year of the puzzles.
+    days : list[int]
+        Days of the puzzles.
+    url : str
+        Root URL of the server.
+    max_workers : int
+        Number of threads.
+    cache_dir : str | None, default=None
+        Challenge directory in which to cache responses.
+
+    Returns
+    -------
+    float
+        Wall time, in seconds.
+    """
+
+    def fetch(day):
+        con = aoc.AOCConnector(year, day, cache_dir=cache_dir, root_url=url)
+        con._get_instruction_page()
+        con._get(f"{con._instruction_url()}/input")
+
+    start = time.perf_counter()
+    with cf.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        list(executor.map(fetch, days))
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="bench_connector",
+        description="Benchmarks the AOC connector against a local stand-in server.",
+    )
+    parser.add_argument("-n", "--puzzles", type=int, default=25, help="number of puzzles")
+    parser.add_argument("-w", "--workers", type=int, nargs="+", default=[1, 4, 16], help="numbers of threads")
+    parser.add_argument("-i", "--interval", type=float, default=0., help="minimum interval between requests (s)")
+    parser.add_argument("--latency", type=float, default=0.01, help="server latency (s)")
+    args = parser.parse_args()
+
+    year = 2024
+    days = list(range(1, args.puzzles + 1))
+    aoc.AOCConnector.aoc_session_token = "fake"
+    aoc.AOCConnector.min_request_interval = args.interval
+    aoc.AOCConnector.retry_backoff = 0.
+
+    with FakeAOCServer(latency=args.latency, wrong_cooldown=2.) as server:
+        for day in days:
+            server.add_puzzle(year, (day - 1) % 25 + 1, "1\n2\n3\n" * 1000, {1: "42", 2: "43"})
+
+        # Throughput of uncached fetches
+        print(f"{'threads':>8} {'requests':>9} {'time (s)':>10} {'req/s':>8}")
+        for workers in args.workers:
+            n_before = server.stats["GET"]
+            elapsed = fetch_all(year, days, server.url, workers)
+            n = server.stats["GET"] - n_before
+            print(f"{workers:>8} {n:>9} {elapsed:>10.4f} {n / elapsed:>8.1f}")
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            # Cached fetches do not reach the server
+            fetch_all(year, days[:1], server.url, 1, cache_dir=tmp_dir)
+            n_before = server.stats["GET"]
+            elapsed = fetch_all(year, days[:1], server.url, 1, cache_dir=tmp_dir)
+            print(f"Cached fetch: {server.stats['GET'] - n_before} requests in {elapsed:.4f} s")
+
+            # Failed fetches are retried
+            server.fail_next(2)
+            con = aoc.AOCConnector(year, 1, root_url=server.url)
+            response = con._get(f"{con._instruction_url()}/input", use_cache=False)
+            print(f"Retried fetch: status {response.status_code} after {server.stats['failed']} failures")
+
+            # Wrong answers start a cooldown, which is waited for before the next submission
+            con = aoc.AOCConnector(year, 1, cache_dir=tmp_dir, root_url=server.url)
+            print(f"Level: {con.get_level(refresh=True)}")
+            print(f"Submit 41: {con.submit_answer(1, 41)[0]}")
+            print(f"Submit 44 without waiting: {con.submit_answer(1, 44, wait=False)[0]}")
+            start = time.perf_counter()
+            verdict, success = con.submit_answer(1, 42)
+            print(f"Submit 42 after {time.perf_counter() - start:.1f} s: {verdict}")
+            print(f"Level: {con.get_level()}")
@@ -0,0 +1,95 @@
+# Micro-benchmark of the instruction parser on large synthetic pages
+
+import time
+import argparse
+
+from adventofcode.html_extract import iter_articles
+
+
+article_template = """<article class="day-desc"><h2>--- Day {i}: Synthetic ---</h2>
+<p>The <em>elves</em> need <code>{i}</code> stars &amp; more.</p>
+<pre><code>1 2 3
+4 5 6
+</code></pre>
+<ul><li>item <a href="/2024/day/{i}">{i}</a></li></ul>
+</article>
+"""
+
+
+def make_page(n_articles):
+    """Build a synthetic AOC page.
+
+    Parameters
+    ----------
+    n_articles : int
+        Number of articles in the page.
+
+    Returns
+    -------
+    str
+        HTML content of the page.
+    """
+
+    articles = "".join([article_template.format(i=i) for i in range(n_articles)])
+    return f"<html><body><main>\n{articles}</main></body></html>"
+
+
+def legacy_parse_instructions(content):
+    """Previous split-based implementation of `HTMLParser.parse_instructions`."""
+
+    def has_tag(content, tag):
+        return f"<{tag}" in content and f"</{tag}>" in content
+
+    def get_inner_tag(content, tag):
+        if f"<{tag}>" in content and f"</{tag}>" in content:
+            return content.split(f"<{tag}>")[1].split(f"</{tag}>")[0], f"</{tag}>".join(content.split(f"</{tag}>")[1:])
+
+        elif f"<{tag}" in content and f"</{tag}>" in content:
+
+            inner_content = ">".join(content.split(f"<{tag}")[1].split(">")[1:])
+            return inner_content.split(f"</{tag}>")[0], f"</{tag}>".join(content.split(f"</{tag}>")[1:])
+
+        raise ValueError(f"No <{tag}> tag in the content!")
+
+    html_main, _ = get_inner_tag(content, "main")
+    all_instructions = ""
+    while has_tag(html_main, "article"):
+        instructions, html_main = get_inner_tag(html_main, "article")
+        all_instructions += instructions
+
+    return all_instructions
+
+
+def best_time(func, content, repeat):
+    """Get the best run time of a parser over several repetitions."""
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(content)
+        times.append(time.perf_counter() - start)
+    return min(times)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="bench_html_parser",
+        description="Compares the legacy and streaming instruction parsers on synthetic pages.",
+    )
+    parser.add_argument("-n", "--sizes", type=int, nargs="+", default=[10, 100, 1000, 4000],
+                        help="numbers of articles in the synthetic pages")
+    parser.add_argument("-r", "--repeat", type=int, default=3, help="number of repetitions")
+    args = parser.parse_args()
+
+    parsers = {
+        "legacy": legacy_parse_instructions,
+        "stream (html)": lambda c: "".join(iter_articles(c)),
+        "stream (markdown)": lambda c: "".join(iter_articles(c, markdown=True)),
+    }
+
+    print(f"{'articles':>10} {'size (kB)':>10} " + " ".join([f"{name:>18}" for name in parsers]))
+    for n in args.sizes:
+        content = make_page(n)
+        times = [best_time(func, content, args.repeat) for func in parsers.values()]
+        print(f"{n:>10} {len(content) / 1000:>10.1f} " + " ".join([f"{t:>16.4e} s" for t in times]))
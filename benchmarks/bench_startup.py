@@ -0,0 +1,63 @@
+# Startup benchmark of the adventofcode package based on `python -X importtime`
+
+import re
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+
+statements = {
+    "import adventofcode": "import adventofcode",
+    "AOCConnector": "import adventofcode as aoc; aoc.AOCConnector",
+    "requests (reference)": "import requests",
+}
+
+
+def import_time(statement):
+    """Run a statement in a fresh interpreter and measure its import time.
+
+    Parameters
+    ----------
+    statement : str
+        Python statement to run.
+
+    Returns
+    -------
+    float
+        Cumulative import time of all top-level imports, in seconds.
+    float
+        Wall time of the interpreter, in seconds.
+    """
+
+    start = time.perf_counter()
+    output = subprocess.run([sys.executable, "-X", "importtime", "-c", statement],
+                            capture_output=True, text=True, check=True)
+    stop = time.perf_counter()
+
+    total = 0
+    for line in output.stderr.split("\n"):
+        # Top-level imports have their module name right after the separator
+        match = re.match(r"import time:\s+\d+ \|\s+(\d+) \| (\S.*)$", line)
+        if match is not None and match.group(2) not in ("site", "encodings"):
+            total += int(match.group(1))
+
+    return total * 1e-6, stop - start
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="bench_startup",
+        description="Measures the import time of the adventofcode package in fresh interpreters.",
+    )
+    parser.add_argument("-r", "--repeat", type=int, default=10, help="number of repetitions")
+    args = parser.parse_args()
+
+    print(f"{'statement':>24} {'import (ms)':>12} {'wall (ms)':>12}")
+    for name, statement in statements.items():
+        times = [import_time(statement) for _ in range(args.repeat)]
+        imp = statistics.median([t[0] for t in times])
+        wall = statistics.median([t[1] for t in times])
+        print(f"{name:>24} {1e3 * imp:>12.2f} {1e3 * wall:>12.2f}")
@@ -1,4 +1,56 @@
-from .aoc_connect import AOCConnector
-from .utils import get_year_day_from_path
+import importlib
 
-__all__ = ["AOCConnector", "get_year_day_from_path"]
+from .utils import get_year_day_from_path, parse_days
+
+__all__ = [
+    "AOCConnector",
+    "InvalidDateError",
+    "OfflineError",
+    "TokenError",
+    "WrongLevelError",
+    "ResponseCache",
+    "AnswerStore",
+    "InputFile",
+    "load_input",
+    "Grid",
+    "IntervalSet",
+    "solution",
+    "get_year_day_from_path",
+    "parse_days",
+]
+
+# Submodules are only imported when first accessed, so that solutions
+# do not pay for the import of the network stack or NumPy unless needed
+_lazy_attributes = {
+    "AOCConnector": ".aoc_connect",
+    "InvalidDateError": ".aoc_connect",
+    "OfflineError": ".aoc_connect",
+    "TokenError": ".aoc_connect",
+    "WrongLevelError": ".aoc_connect",
+    "ResponseCache": ".cache",
+    "AnswerStore": ".answers",
+    "InputFile": ".io",
+    "load_input": ".io",
+    "Grid": ".grid",
+    "IntervalSet": ".intervals",
+    "solution": ".registry",
+}
+_lazy_submodules = ["search", "generators", "memo", "cycles", "parse"]
+
+
+def __getattr__(name):
+
+    if name in _lazy_attributes:
+        module = importlib.import_module(_lazy_attributes[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+
+    if name in _lazy_submodules:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_lazy_attributes) + _lazy_submodules)
@@ -0,0 +1,95 @@
+import os
+import json
+import pathlib as pl
+
+
+class AnswerStore:
+    """Store of the expected answers of a challenge.
+
+    The answers are stored as a JSON file in the challenge directory, indexed
+    by the hash of the input they were computed on, so that they remain valid
+    if the input file is replaced. The store is versioned along with the
+    solutions, while the inputs themselves are not, and is written with sorted
+    keys so that its diffs stay small.
+    """
+
+    file_name = ".aoc_answers.json"
+    version = 1
+
+    def __init__(self, root_dir):
+        """Initialize the answer store.
+
+        Parameters
+        ----------
+        root_dir : str | pl.Path
+            Challenge directory to store the answers in.
+        """
+
+        self._path = pl.Path(root_dir, self.file_name)
+        self._answers = self._load()
+
+    def _load(self):
+        """Load the answers from disk.
+
+        Returns
+        -------
+        dict
+            Answers of each level, indexed by input hash.
+        """
+
+        if not os.path.exists(self._path):
+            return {}
+
+        try:
+            with open(self._path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if data.get("version") != self.version:
+            return {}
+
+        return data.get("answers", {})
+
+    def _save(self):
+        """Write the answers to disk atomically."""
+
+        os.makedirs(self._path.parent, exist_ok=True)
+        tmp_path = pl.Path(f"{self._path}.tmp")
+        with open(tmp_path, "w") as file:
+            json.dump({"version": self.version, "answers": self._answers}, file, indent=2, sort_keys=True)
+        os.replace(tmp_path, self._path)
+
+    def get(self, digest, level):
+        """Get the expected answer of a level.
+
+        Parameters
+        ----------
+        digest : str
+            Hash of the input file.
+        level : int
+            Level of the challenge.
+
+        Returns
+        -------
+        str | None
+            Expected answer, or None if unknown.
+        """
+
+        return self._answers.get(digest, {}).get(str(level))
+
+    def set(self, digest, level, answer):
+        """Store the expected answer of a level and write it to disk.
+
+        Parameters
+        ----------
+        digest : str
+            Hash of the input file.
+        level : int
+            Level of the challenge.
+        answer : any
+            Correct answer.
+        """
+
+        self._answers.setdefault(digest, {})[str(level)] = str(answer)
+        self._save()
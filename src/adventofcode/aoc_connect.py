@@ -1,7 +1,17 @@
 import os
 import pathlib as pl
+import time
+import shutil
+import tempfile
 import datetime as dt
-import requests as req
+import threading
+
+from .cache import ResponseCache
+from .state import ChallengeState
+from .answers import AnswerStore
+from .io import file_digest
+from .ledger import SubmissionLedger
+from .html_extract import iter_articles
 
 
 class InvalidDateError(Exception):
@@ -48,6 +58,17 @@ class TokenError(Exception):
     pass
 
 
+class OfflineError(Exception):
+    """Error raised when a network request is needed in offline mode.
+
+    Parameters
+    ----------
+    Exception : OfflineError
+        The network cannot be used in offline mode.
+    """
+    pass
+
+
 class WrongLevelError(Exception):
     """Error raised when an unexpected level is obtained.
 
@@ -73,9 +94,22 @@ class AOCConnector:
     max_day = 25
     aoc_session_token = os.environ.get("AOC_SESSION_TOKEN", "N/A")
     instruction_parser = None
-    root_url = "https://adventofcode.com"
-
-    def __init__(self, year: int, day: int):
+    root_url = os.environ.get("AOC_ROOT_URL", "https://adventofcode.com").rstrip("/")
+    offline = os.environ.get("AOC_OFFLINE", "0") == "1"
+    cache_dir_name = ".aoc_cache"
+    instruction_ttl = 3600.
+    level_ttl = 86400.
+    input_ttl = None
+    max_retries = 3
+    retry_backoff = 0.5
+    pool_size = 32
+    min_request_interval = 0.1
+    _next_request_time = 0.
+    _rate_lock = threading.Lock()
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, year: int, day: int, cache_dir=None, offline=None, root_url=None):
         """Initialize the adventofcode connector.
 
         Parameters
@@ -84,9 +118,23 @@ class AOCConnector:
             Requested year of the challenge.
         day : int
             Requested day of the challenge.
+        cache_dir : str | pl.Path | None, default=None
+            Challenge directory in which to cache responses,
+            no caching is performed if None.
+        offline : bool | None, default=None
+            Only use the cached responses and challenge state, never the network.
+            Defaults to the AOC_OFFLINE environment variable being set to 1.
+        root_url : str | None, default=None
+            Root URL of the AOC website, e.g. to use a local stand-in server.
+            Defaults to the AOC_ROOT_URL environment variable, or https://adventofcode.com.
         """
 
-        if self.aoc_session_token == "N/A":
+        if offline is not None:
+            self.offline = offline
+        if root_url is not None:
+            self.root_url = root_url.rstrip("/")
+
+        if self.aoc_session_token == "N/A" and not self.offline:
             raise TokenError("AOC session token not found! Please set the AOC_SESSION_TOKEN environment variable.")
 
         if year < self.min_year:
@@ -104,12 +152,148 @@ class AOCConnector:
         self._year = year
         self._day = day
 
-    def _get_instruction_page(self):
+        self._cache = None
+        self._state = None
+        self._ledger = None
+        self._answers = None
+        self._root_dir = None
+        if cache_dir is not None:
+            self.set_cache_dir(cache_dir)
+
+    @classmethod
+    def get_session(cls):
+        """Get the HTTP session shared by all connector instances.
+
+        The session is created on first use, keeps connections alive,
+        retries failed page fetches with exponential backoff, and
+        accepts gzip-compressed responses.
+
+        Returns
+        -------
+        req.Session
+            Shared HTTP session.
+        """
+
+        with cls._session_lock:
+            if cls._session is None:
+                # The network stack is only imported when a request is actually made
+                import requests as req
+                from requests.adapters import HTTPAdapter
+                from urllib3.util.retry import Retry
+
+                session = req.Session()
+                # Answer submissions are POST requests, which are never retried
+                retry = Retry(
+                    total=cls.max_retries,
+                    backoff_factor=cls.retry_backoff,
+                    status_forcelist=[500, 502, 503, 504],
+                    allowed_methods=["GET"],
+                    # Return the last response once retries run out, so that its status is handled in `_get`
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(pool_connections=cls.pool_size, pool_maxsize=cls.pool_size, max_retries=retry)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({"Accept-Encoding": "gzip, deflate"})
+                cls._session = session
+
+        return cls._session
+
+    @classmethod
+    def _wait_rate_limit(cls):
+        """Wait until the next request is allowed by the global rate limit.
+
+        Time slots are reserved under a lock, so that concurrent requests
+        are spaced by at least `min_request_interval` seconds.
+        """
+
+        with cls._rate_lock:
+            now = time.monotonic()
+            request_time = max(now, cls._next_request_time)
+            cls._next_request_time = request_time + cls.min_request_interval
+
+        if request_time > now:
+            time.sleep(request_time - now)
+
+    @classmethod
+    def set_session(cls, session):
+        """Replace the HTTP session shared by all connector instances.
+
+        Parameters
+        ----------
+        session : req.Session | None
+            Session to use for all requests, a default session is
+            created on next use if None.
+        """
+
+        with cls._session_lock:
+            if cls._session is not None and cls._session is not session:
+                cls._session.close()
+            cls._session = session
+
+    def set_cache_dir(self, cache_dir):
+        """Set the challenge directory in which to cache responses and store the challenge state.
+
+        Parameters
+        ----------
+        cache_dir : str | pl.Path
+            Challenge directory in which to cache responses.
+        """
+
+        self._cache = ResponseCache(pl.Path(cache_dir, self.cache_dir_name))
+        self._state = ChallengeState(cache_dir)
+        self._ledger = SubmissionLedger(self._state)
+        self._answers = AnswerStore(cache_dir)
+        self._root_dir = pl.Path(cache_dir)
+
+    def _instruction_url(self):
+        """Get the URL of the instruction page."""
+        return f"{self.root_url}/{self._year}/day/{self._day}"
+
+    def _get(self, url, ttl=None, use_cache=True):
+        """Get a page, from the cache if available.
+
+        Parameters
+        ----------
+        url : str
+            URL of the page.
+        ttl : float | None, default=None
+            Maximum age of a cached page in seconds, None means no expiry.
+        use_cache : bool, default=True
+            Whether to look the page up in the cache before fetching it.
+
+        Returns
+        -------
+        req.Response | CachedResponse
+            Response object.
+        """
+
+        if self._cache is not None and use_cache:
+            response = self._cache.get(self._year, self._day, url, ttl=ttl)
+            if response is not None:
+                return response
+
+        if self.offline:
+            raise OfflineError(f"{url} is not cached and cannot be fetched in offline mode")
+
+        self._wait_rate_limit()
+        response = self.get_session().get(url, cookies={"session": self.aoc_session_token})
+
+        if self._cache is not None:
+            self._cache.set(self._year, self._day, url, response)
+
+        return response
+
+    def _get_instruction_page(self, use_cache=True):
         """Get the instruction page.
+
+        Parameters
+        ----------
+        use_cache : bool, default=True
+            Whether to use a cached instruction page if available.
         """
 
-        url = f"{self.root_url}/{self._year}/day/{self._day}"
-        response = req.get(url, cookies={"session": self.aoc_session_token})
+        response = self._get(self._instruction_url(), ttl=self.instruction_ttl, use_cache=use_cache)
         self.instruction_parser = HTMLParser(response)
 
     def _make_instructions(self, root_dir):
@@ -136,8 +320,8 @@ class AOCConnector:
             Directory to store the input in.
         """
 
-        url = f"{self.root_url}/{self._year}/day/{self._day}/input"
-        input_response = req.get(url, cookies={"session": self.aoc_session_token})
+        url = f"{self._instruction_url()}/input"
+        input_response = self._get(url, ttl=self.input_ttl)
         self.input_parser = HTMLParser(input_response)
         input_content = self.input_parser.get_content()
 
@@ -147,6 +331,9 @@ class AOCConnector:
     def _make_python_canevas(self, canevas, root_dir):
         """Create a Python canevas
 
+        The `<year>` and `<day>` placeholders of the canevas are replaced
+        by the year and day of the challenge.
+
         Parameters
         ----------
         canevas : str
@@ -155,6 +342,7 @@ class AOCConnector:
             Directory to store the Python canevas in.
         """
 
+        canevas = canevas.replace("<year>", str(self._year)).replace("<day>", str(self._day))
         with open(pl.Path(root_dir, "solution.py"), "w") as file:
             file.write(canevas)
 
@@ -184,22 +372,153 @@ class AOCConnector:
             print(f"Directory {day_path.resolve()} already exists! Use the -f flag to overwrite it.")
             return
 
-        if not os.path.exists(root_path):
-            os.mkdir(root_path)
+        os.makedirs(year_path, exist_ok=True)
 
-        if not os.path.exists(year_path):
-            os.mkdir(year_path)
+        # Build the challenge in a temporary directory, so that a failed
+        # initialization never leaves a partial challenge tree behind
+        tmp_path = pl.Path(tempfile.mkdtemp(prefix=f".day_{self._day}-", dir=year_path))
+        tmp_cache = self._cache is None
+        try:
+            if tmp_cache:
+                self.set_cache_dir(tmp_path)
 
-        if not os.path.exists(day_path):
-            os.mkdir(day_path)
+            self._get_instruction_page()
+            self._make_input(tmp_path)
+            self._make_instructions(tmp_path)
+            self._make_python_canevas(canevas, tmp_path)
 
-        self._get_instruction_page()
-        self._make_input(day_path)
-        self._make_instructions(day_path)
-        self._make_python_canevas(canevas, day_path)
+            self._move_tree(tmp_path, day_path)
 
-    def get_level(self):
-        self._get_instruction_page()
+        finally:
+            if os.path.exists(tmp_path):
+                shutil.rmtree(tmp_path)
+            if tmp_cache:
+                self.set_cache_dir(day_path)
+
+    @staticmethod
+    def _move_tree(src_path, trg_path):
+        """Move a directory tree in place.
+
+        If the target directory does not exist, the whole tree is renamed at once.
+        Otherwise, each entry is replaced individually and other files in the
+        target directory are left untouched.
+
+        Parameters
+        ----------
+        src_path : str | pl.Path
+            Directory to move.
+        trg_path : str | pl.Path
+            Target directory.
+        """
+
+        if not os.path.exists(trg_path):
+            os.replace(src_path, trg_path)
+            return
+
+        for name in os.listdir(src_path):
+            trg_entry = pl.Path(trg_path, name)
+            if os.path.isdir(trg_entry):
+                shutil.rmtree(trg_entry)
+            os.replace(pl.Path(src_path, name), trg_entry)
+
+    @classmethod
+    def initialize_days(cls, year, days, canevas, root=pl.Path(".").resolve(), dir_name="challenges",
+                        force=False, max_workers=8):
+        """Initialize multiple challenges of a year concurrently.
+
+        Instructions and inputs are fetched through a bounded thread pool,
+        all requests being subject to the connector rate limit.
+
+        Parameters
+        ----------
+        year : int
+            Requested year of the challenges.
+        days : list[int]
+            Requested days of the challenges.
+        canevas : str
+            Canevas Python script
+        root : str | pl.Path, default=`pl.Path(".").resolve()`
+            Root directory, by default pl.Path(".").resolve()
+        dir_name : str, default="challenges"
+            Directory name to store challenges in, by default "challenges"
+        force : bool, default=False
+            Force the initialization if a challenge already exists
+        max_workers : int, default=8
+            Maximum number of challenges initialized at once.
+
+        Returns
+        -------
+        dict
+            Exception raised for each day that failed to initialize.
+        """
+
+        import concurrent.futures as cf
+
+        connectors = {}
+        errors = {}
+        for day in days:
+            try:
+                connectors[day] = cls(year, day)
+            except InvalidDateError as err:
+                errors[day] = err
+
+        with cf.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                executor.submit(con.initialize, canevas, root=root, dir_name=dir_name, force=force): day
+                for day, con in connectors.items()
+            }
+            for future in cf.as_completed(futures):
+                if future.exception() is not None:
+                    errors[futures[future]] = future.exception()
+
+        return errors
+
+    def get_level(self, refresh=False):
+        """Get the current level of the challenge.
+
+        The level is read from the local challenge state when available,
+        and only fetched from the instruction page when unknown or stale.
+
+        Parameters
+        ----------
+        refresh : bool, default=False
+            Force fetching the instruction page to update the level.
+
+        Returns
+        -------
+        int
+            Current level, 3 if both parts are solved.
+        """
+
+        level = None
+        if self._state is not None and not refresh:
+            level = self._state.get_level(ttl=self.level_ttl)
+
+        if level is None:
+            level = self._fetch_level(refresh=refresh)
+
+        if level < 1:
+            raise WrongLevelError()
+        if level > 2:
+            print("This challenge was already solved!")
+
+        return level
+
+    def _fetch_level(self, refresh=False):
+        """Get the current level of the challenge from the instruction page.
+
+        Parameters
+        ----------
+        refresh : bool, default=False
+            Bypass the response cache.
+
+        Returns
+        -------
+        int
+            Current level, 3 if both parts are solved.
+        """
+
+        self._get_instruction_page(use_cache=not refresh)
 
         level = 1
 
@@ -209,21 +528,64 @@ class AOCConnector:
         if "Both parts of this puzzle are complete!" in self.instruction_parser.get_content():
             level = 3
 
-        if level < 1:
-            raise WrongLevelError()
-        if level > 2:
-            print("This challenge was already solved!")
+        if self._state is not None:
+            self._state.set_level(level)
 
         return level
 
-    def submit_answer(self, level, answer):
+    def submit_answer(self, level, answer, wait=True, retries=1):
+        """Submit an answer.
+
+        Answers already submitted, or out of the bounds given by previous
+        "too high"/"too low" verdicts, are rejected locally without being
+        submitted. If a submission cooldown is running, the submission is
+        either delayed until the end of the cooldown or rejected. Correct
+        answers are stored as the expected answers for the local input.
+
+        Parameters
+        ----------
+        level : int
+            Level of the challenge.
+        answer : any
+            Answer to submit.
+        wait : bool, default=True
+            Whether to wait for the end of a submission cooldown.
+        retries : int, default=1
+            Number of resubmissions after the cooldown when the server reports
+            that the answer was given too recently, only used if `wait` is True.
+
+        Returns
+        -------
+        str
+            Verdict of the submission.
+        bool
+            Whether the answer is correct.
+        """
 
         if str(level) not in ["1", "2"]:
             raise WrongLevelError()
 
-        url = f"{self.root_url}/{self._year}/day/{self._day}/answer"
-        answer_response = req.post(url, data={"level": str(level), "answer": str(answer)},
-                                   cookies={"session": self.aoc_session_token})
+        if self._ledger is not None:
+            verdict, success = self._ledger.check(level, answer)
+            if verdict is not None:
+                if success:
+                    self._record_answer(level, answer)
+                return verdict, success
+
+            cooldown = self._ledger.get_cooldown()
+            if cooldown > 0 and not wait:
+                return f"Please wait {cooldown:.0f}s before submitting another answer.", False
+            if cooldown > 0:
+                print(f"Waiting {cooldown:.0f}s for the submission cooldown...")
+                time.sleep(cooldown)
+
+        if self.offline:
+            raise OfflineError("Answers cannot be submitted in offline mode")
+
+        url = f"{self._instruction_url()}/answer"
+        self._wait_rate_limit()
+        answer_response = self.get_session().post(url, data={"level": str(level), "answer": str(answer)},
+                                                  cookies={"session": self.aoc_session_token})
 
         answer_content = answer_response.content.decode()
 
@@ -232,6 +594,10 @@ class AOCConnector:
 
         if "That's not the right answer" in answer_content:
             verdict = "That's not the right answer, try again!"
+            if "your answer is too low" in answer_content:
+                verdict = "That's not the right answer, your answer is too low!"
+            elif "your answer is too high" in answer_content:
+                verdict = "That's not the right answer, your answer is too high!"
 
         elif "That's the right answer" in answer_content:
             success = True
@@ -239,8 +605,53 @@ class AOCConnector:
             if str(level) == "1":
                 verdict += " On to level 2!"
 
+            # The instruction page changes once a level is solved
+            if self._cache is not None:
+                self._cache.invalidate(self._year, self._day, self._instruction_url())
+            if self._state is not None:
+                self._state.set_level(int(level) + 1)
+            self._record_answer(level, answer)
+
+        elif "You don't seem to be solving the right level" in answer_content:
+            verdict = "You don't seem to be solving the right level. Did you already complete it?"
+            if self._cache is not None:
+                self._cache.invalidate(self._year, self._day, self._instruction_url())
+            if self._state is not None:
+                self._state.clear_level()
+
+        elif "You gave an answer too recently" in answer_content:
+            verdict = "You gave an answer too recently, please wait before trying again."
+
+        if self._ledger is not None:
+            self._ledger.record(level, answer, verdict, success, content=answer_content)
+
+            # Retry once the cooldown reported by the server is over
+            if ("You gave an answer too recently" in answer_content and wait and retries > 0
+                    and self._ledger.get_cooldown() > 0):
+                return self.submit_answer(level, answer, wait=wait, retries=retries - 1)
+
         return verdict, success
 
+    def _record_answer(self, level, answer):
+        """Store a correct answer as the expected answer for the local input.
+
+        Parameters
+        ----------
+        level : int
+            Level of the challenge.
+        answer : any
+            Correct answer.
+        """
+
+        if self._answers is None:
+            return
+
+        input_path = pl.Path(self._root_dir, "input.txt")
+        if not os.path.exists(input_path):
+            return
+
+        self._answers.set(file_digest(input_path), level, answer)
+
     def reload_instructions(self, root_dir):
         """Retrieve and store the instructions from the instruction page.
 
@@ -278,60 +689,43 @@ class HTMLParser:
         self._response = response
         self._content = response.content.decode()
 
-    def parse_instructions(self):
-        """Parse the instructions from the HTML content."""
-
-        html_main, _ = self._get_inner_tag(self._content, "main")
-        all_instructions = ""
-        while self._has_tag(html_main, "article"):
-            instructions, html_main = self._get_inner_tag(html_main, "article")
-            all_instructions += instructions
-
-        return all_instructions
-
-    def get_content(self):
-        """Get the raw HTML content."""
-        return self._content
-
-    def _has_tag(self, content, tag):
-        """Check if the content has a given tag.
+    def parse_instructions(self, markdown=True):
+        """Parse the instructions from the HTML content.
 
         Parameters
         ----------
-        content : str
-            Content to check.
-        tag : str
-            Tag to check for.
+        markdown : bool, default=True
+            Whether to convert the instructions to Markdown instead of raw HTML.
 
         Returns
         -------
-        bool
-            Whether the tag is present in the content.
+        str
+            Instructions of all the articles in the page.
         """
-        return f"<{tag}" in content and f"</{tag}>" in content
 
-    def _get_inner_tag(self, content, tag):
-        """Get the inner content of a given tag.
+        instructions = "".join(self.iter_articles(markdown=markdown))
+
+        if not instructions:
+            raise InstructionParserError("No <article> tag in the content!")
+
+        return instructions
+
+    def iter_articles(self, markdown=False):
+        """Iterate over the articles of the HTML content.
+
         Parameters
         ----------
-        content : str
-            Content to parse.
-        tag : str
-            Tag to get the inner content of.
-        Returns
-        -------
-        str
-            Inner content of the tag.
+        markdown : bool, default=False
+            Whether to convert the articles to Markdown instead of raw HTML.
+
+        Yields
+        ------
         str
-            Remaining content after extracting the tag.
+            Inner content of each article.
         """
 
-        if f"<{tag}>" in content and f"</{tag}>" in content:
-            return content.split(f"<{tag}>")[1].split(f"</{tag}>")[0], f"</{tag}>".join(content.split(f"</{tag}>")[1:])
+        yield from iter_articles(self._content, markdown=markdown)
 
-        elif f"<{tag}" in content and f"</{tag}>" in content:
-
-            inner_content = ">".join(content.split(f"<{tag}")[1].split(">")[1:])
-            return inner_content.split(f"</{tag}>")[0], f"</{tag}>".join(content.split(f"</{tag}>")[1:])
-
-        raise ValueError(f"No <{tag}> tag in the content!")
+    def get_content(self):
+        """Get the raw HTML content."""
+        return self._content
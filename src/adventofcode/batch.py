@@ -0,0 +1,213 @@
+import os
+import csv
+import sys
+import time
+import argparse
+import pathlib as pl
+import concurrent.futures as cf
+
+from .check import check_results
+from .runner import run_with_input
+from .registry import scan_year_day
+
+
+def find_inputs(input_dir, pattern="*.txt"):
+    """Find the inputs of a directory of inputs.
+
+    Inputs are either files of the directory (e.g. `inputs/alice.txt`), or
+    `input.txt` files of its subdirectories (e.g. `inputs/alice/input.txt`).
+    Each input is tagged by the name of its file or subdirectory.
+
+    Parameters
+    ----------
+    input_dir : str | pl.Path
+        Directory of inputs.
+    pattern : str, default="*.txt"
+        Pattern of the input files of the directory.
+
+    Returns
+    -------
+    list[tuple[str, pl.Path]]
+        Tag and path of each input, sorted by tag.
+    """
+
+    input_dir = pl.Path(input_dir)
+
+    inputs = {}
+    for path in input_dir.glob(pattern):
+        if path.is_file():
+            inputs[path.stem] = path
+    for path in input_dir.glob("*/input.txt"):
+        inputs[path.parent.name] = path
+
+    return sorted(inputs.items())
+
+
+def run_input(path, year, day, level, input_path, timeout=None):
+    """Run one level of a solution on an input file.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    year : int
+        Year of the challenge.
+    day : int
+        Day of the challenge.
+    level : int
+        Level to run.
+    input_path : str | pl.Path
+        Path to the input file.
+    timeout : float | None, default=None
+        Time limit in seconds, no limit if None.
+
+    Returns
+    -------
+    dict
+        Answer, run time and error (if any) of the level.
+    """
+
+    with open(input_path, "r") as file:
+        txt = file.read()
+
+    return run_with_input(path, year, day, level, txt, timeout=timeout)
+
+
+def run_batch(path, inputs, levels=(1, 2), max_workers=None, timeout=None):
+    """Run the levels of a solution on several inputs across a pool of processes.
+
+    Every level of every input is run in parallel, so that the batch takes
+    about as long as its slowest run when there are enough processes.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    inputs : list[tuple[str, pl.Path]]
+        Tag and path of each input.
+    levels : tuple[int], default=(1, 2)
+        Levels to run.
+    max_workers : int | None, default=None
+        Number of processes, the number of CPUs if None.
+    timeout : float | None, default=None
+        Time limit per run in seconds, no limit if None.
+
+    Returns
+    -------
+    list[dict]
+        Result of each run, with its input tag, sorted by tag and level.
+    """
+
+    path = pl.Path(path).resolve()
+    year, day = scan_year_day(path)
+
+    results = []
+    with cf.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for tag, input_path in inputs:
+            for level in levels:
+                future = executor.submit(run_input, path, year, day, level, input_path, timeout=timeout)
+                futures[future] = (tag, input_path)
+
+        for future in cf.as_completed(futures):
+            tag, input_path = futures[future]
+            result = future.result()
+            result.update({"tag": tag, "input": str(input_path), "year": year, "day": day})
+            results.append(result)
+
+    return sorted(results, key=lambda r: (r["tag"], r["level"]))
+
+
+def format_batch(results):
+    """Format batch results as a table.
+
+    Parameters
+    ----------
+    results : list[dict]
+        Result of each run, with its status.
+
+    Returns
+    -------
+    str
+        Formatted table.
+    """
+
+    width = max([len("Input")] + [len(r["tag"]) for r in results])
+
+    lines = [f"{'Input':<{width}} {'Level':>6} {'Time (s)':>12}  {'Status':<8}  Answer"]
+    for r in results:
+        time_str = f"{r['time']:>12.4e}" if r["time"] is not None else f"{'-':>12}"
+        if r["error"] is not None:
+            answer = f"ERROR: {r['error']}"
+        elif r["status"] == "wrong":
+            answer = f"{r['answer']} (expected {r['expected']})"
+        else:
+            answer = r["answer"]
+        lines.append(f"{r['tag']:<{width}} {r['level']:>6} {time_str}  {r['status'].upper():<8}  {answer}")
+
+    return "\n".join(lines)
+
+
+def write_batch(results, output_path):
+    """Write batch results to a CSV file.
+
+    Parameters
+    ----------
+    results : list[dict]
+        Result of each run, with its status.
+    output_path : str | pl.Path
+        Path to the CSV file.
+    """
+
+    columns = ["tag", "input", "year", "day", "level", "answer", "expected", "status", "time", "error"]
+
+    tmp_path = pl.Path(f"{output_path}.tmp")
+    with open(tmp_path, "w", newline="") as file:
+        writer = csv.DictWriter(file, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(results)
+    os.replace(tmp_path, output_path)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.batch",
+        description="Runs an Advent of Code solution on every input of a directory of inputs, "
+                    "e.g. the inputs of several accounts.",
+    )
+
+    parser.add_argument("path", type=str, help="path to the solution module")
+    parser.add_argument("inputs", type=str, help="directory of inputs (<tag>.txt files or <tag>/input.txt)")
+    parser.add_argument("-g", "--glob", type=str, default="*.txt", help="pattern of the input files")
+    parser.add_argument("-l", "--level", type=int, nargs="+", default=[1, 2], help="requested level(s)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="time limit per run (s)")
+    parser.add_argument("-o", "--output", type=str, help="CSV file in which to write the results")
+    parser.add_argument("--record", action="store_true",
+                        help="store the answers of inputs without an expected answer")
+
+    args = parser.parse_args()
+
+    inputs = find_inputs(args.inputs, pattern=args.glob)
+    if len(inputs) == 0:
+        print(f"No inputs found in {args.inputs}", file=sys.stderr)
+        sys.exit(1)
+
+    start = time.perf_counter()
+    results = run_batch(args.path, inputs, levels=args.level, max_workers=args.workers, timeout=args.timeout)
+    stop = time.perf_counter()
+
+    # Expected answers are looked up by input in the answer store of the solution
+    results = check_results(results, record=args.record)
+
+    print(format_batch(results))
+    times = [r["time"] for r in results if r["time"] is not None]
+    print(f"{len(inputs)} inputs, wall time: {stop - start:.4e} s"
+          + (f", slowest run: {max(times):.4e} s" if times else ""))
+
+    if args.output is not None:
+        write_batch(results, args.output)
+        print(f"Results written to {args.output}")
+
+    sys.exit(1 if any([r["status"] in ["wrong", "error"] for r in results]) else 0)
@@ -0,0 +1,351 @@
+import os
+import json
+import time
+import argparse
+import datetime as dt
+import contextlib
+import statistics
+import subprocess
+import pathlib as pl
+
+from .io import clear_memo
+from .registry import find_level
+from .runner import discover_solutions, load_solution
+from .utils import parse_days
+
+
+class BenchmarkHistory:
+    """Versioned history of the benchmarks of a challenge.
+
+    The history is stored as a JSON file in the challenge directory. Each entry
+    records the statistics of one level along with the commit it was run at.
+    """
+
+    file_name = ".aoc_bench.json"
+    version = 1
+
+    def __init__(self, root_dir):
+        """Initialize the benchmark history.
+
+        Parameters
+        ----------
+        root_dir : str | pl.Path
+            Challenge directory to store the history in.
+        """
+
+        self._path = pl.Path(root_dir, self.file_name)
+        self._runs = self._load()
+
+    def _load(self):
+        """Load the history from disk.
+
+        Returns
+        -------
+        list[dict]
+            Benchmark runs.
+        """
+
+        if not os.path.exists(self._path):
+            return []
+
+        try:
+            with open(self._path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return []
+
+        if data.get("version") != self.version:
+            return []
+
+        return data.get("runs", [])
+
+    def _save(self):
+        """Write the history to disk atomically."""
+
+        tmp_path = pl.Path(f"{self._path}.tmp")
+        with open(tmp_path, "w") as file:
+            json.dump({"version": self.version, "runs": self._runs}, file, indent=2)
+        os.replace(tmp_path, self._path)
+
+    def get_previous(self, level, commit):
+        """Get the latest run of a level at another commit.
+
+        Parameters
+        ----------
+        level : int
+            Level of the challenge.
+        commit : str | None
+            Current commit.
+
+        Returns
+        -------
+        dict | None
+            Latest run at another commit, or None if there is none.
+        """
+
+        for run in reversed(self._runs):
+            if run["level"] == level and run["commit"] != commit:
+                return run
+        return None
+
+    def add(self, run):
+        """Add a run to the history and write it to disk.
+
+        Parameters
+        ----------
+        run : dict
+            Benchmark run.
+        """
+
+        self._runs.append(run)
+        self._save()
+
+
+def get_commit(path):
+    """Get the current git commit of the repository containing a path.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path inside the repository.
+
+    Returns
+    -------
+    str | None
+        Short commit hash, with a "-dirty" suffix for uncommitted changes,
+        or None outside of a git repository.
+    """
+
+    try:
+        output = subprocess.run(
+            ["git", "describe", "--always", "--dirty"],
+            cwd=pl.Path(path).parent, capture_output=True, text=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return output.stdout.strip()
+
+
+def percentile(values, q):
+    """Get a percentile of values using linear interpolation.
+
+    Parameters
+    ----------
+    values : list[float]
+        Values.
+    q : float
+        Percentile, between 0 and 100.
+
+    Returns
+    -------
+    float
+        Percentile of the values.
+    """
+
+    values = sorted(values)
+    pos = (len(values) - 1) * q / 100.
+    i = int(pos)
+    if i + 1 >= len(values):
+        return values[-1]
+    return values[i] + (values[i + 1] - values[i]) * (pos - i)
+
+
+def summarize(times_ns):
+    """Get the statistics of run times.
+
+    Parameters
+    ----------
+    times_ns : list[int]
+        Run times in nanoseconds.
+
+    Returns
+    -------
+    dict
+        Minimum, median and 95th percentile in seconds.
+    """
+
+    return {
+        "min": min(times_ns) * 1e-9,
+        "median": statistics.median(times_ns) * 1e-9,
+        "p95": percentile(times_ns, 95) * 1e-9,
+    }
+
+
+def time_level(path, level):
+    """Time one run of a level, separating parse time from solve time.
+
+    The module is freshly imported, so that module-level state does not leak
+    between runs, and the in-process caches of parsed inputs are cleared, so
+    that every run parses its input. The `parse_input` function of the module,
+    if any, is wrapped to measure the time spent parsing the input.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    level : int
+        Level to run.
+
+    Returns
+    -------
+    int
+        Total run time in nanoseconds.
+    int
+        Time spent in `parse_input` in nanoseconds.
+    any
+        Answer of the level.
+    """
+
+    clear_memo()
+    module = load_solution(path)
+    parse_ns = [0]
+
+    parse_input = getattr(module, "parse_input", None)
+    if parse_input is not None:
+        def timed_parse_input(*args, **kwargs):
+            start = time.perf_counter_ns()
+            try:
+                return parse_input(*args, **kwargs)
+            finally:
+                parse_ns[0] += time.perf_counter_ns() - start
+        module.parse_input = timed_parse_input
+
+    solve = find_level(module, level)
+
+    start = time.perf_counter_ns()
+    answer = solve()
+    stop = time.perf_counter_ns()
+
+    return stop - start, parse_ns[0], answer
+
+
+def benchmark_level(path, level, repeat=10, warmup=1, quiet=True):
+    """Benchmark a level of a solution.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    level : int
+        Level to run.
+    repeat : int, default=10
+        Number of timed repetitions.
+    warmup : int, default=1
+        Number of untimed repetitions run first.
+    quiet : bool, default=True
+        Whether to silence the output of the solution.
+
+    Returns
+    -------
+    dict
+        Answer and statistics of the total, parse and solve times.
+    """
+
+    total_ns = []
+    parse_ns = []
+    answer = None
+
+    with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+        if quiet:
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+            stack.enter_context(contextlib.redirect_stderr(devnull))
+
+        for _ in range(warmup):
+            time_level(path, level)
+
+        for _ in range(repeat):
+            t_tot, t_parse, answer = time_level(path, level)
+            total_ns.append(t_tot)
+            parse_ns.append(t_parse)
+
+    return {
+        "level": level,
+        "answer": str(answer),
+        "repeat": repeat,
+        "total": summarize(total_ns),
+        "parse": summarize(parse_ns),
+        "solve": summarize([t - p for t, p in zip(total_ns, parse_ns)]),
+    }
+
+
+def check_regression(run, previous, threshold=0.1):
+    """Check whether a run is slower than a previous one.
+
+    A regression is flagged when the median total time increased by more than
+    the threshold, and the new minimum is above the previous median.
+
+    Parameters
+    ----------
+    run : dict
+        Current benchmark run.
+    previous : dict | None
+        Previous benchmark run.
+    threshold : float, default=0.1
+        Relative slowdown of the median considered as a regression.
+
+    Returns
+    -------
+    float | None
+        Relative slowdown of the median if it is a regression, None otherwise.
+    """
+
+    if previous is None:
+        return None
+
+    old = previous["total"]["median"]
+    new = run["total"]["median"]
+    if new > old * (1. + threshold) and run["total"]["min"] > old:
+        return new / old - 1.
+
+    return None
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.bench",
+        description="Benchmarks Advent of Code solutions and records their timing history.",
+    )
+
+    parser.add_argument("-r", "--root", type=str, default=".", help="root directory of the challenges")
+    parser.add_argument("-y", "--year", type=int, nargs="+", help="requested year(s)")
+    parser.add_argument("-d", "--day", type=str, help="requested day, or list/range of days (e.g. 1,3,5-9)")
+    parser.add_argument("-l", "--level", type=int, nargs="+", default=[1, 2], help="requested level(s)")
+    parser.add_argument("-n", "--repeat", type=int, default=10, help="number of timed repetitions")
+    parser.add_argument("-w", "--warmup", type=int, default=1, help="number of warmup repetitions")
+    parser.add_argument("--threshold", type=float, default=0.1, help="relative slowdown flagged as regression")
+    parser.add_argument("--no-save", action="store_true", help="do not record the results in the history")
+
+    args = parser.parse_args()
+
+    days = parse_days(args.day) if args.day is not None else None
+
+    print(f"{'Year':>6} {'Day':>4} {'Level':>6} {'min (s)':>12} {'median (s)':>12} {'p95 (s)':>12}"
+          f" {'parse (s)':>12} {'solve (s)':>12}")
+
+    for year, day, path in discover_solutions(args.root, years=args.year, days=days):
+        commit = get_commit(path)
+        history = BenchmarkHistory(path.parent)
+
+        for level in args.level:
+            try:
+                run = benchmark_level(path, level, repeat=args.repeat, warmup=args.warmup)
+            except Exception as err:
+                print(f"{year:>6} {day:>4} {level:>6}  ERROR: {err!r}")
+                continue
+
+            run["commit"] = commit
+            run["date"] = dt.datetime.now().isoformat(timespec="seconds")
+
+            line = (f"{year:>6} {day:>4} {level:>6} {run['total']['min']:>12.4e} {run['total']['median']:>12.4e}"
+                    f" {run['total']['p95']:>12.4e} {run['parse']['median']:>12.4e} {run['solve']['median']:>12.4e}")
+
+            previous = history.get_previous(level, commit)
+            slowdown = check_regression(run, previous, threshold=args.threshold)
+            if slowdown is not None:
+                line += f"  REGRESSION: +{100 * slowdown:.0f}% vs {previous['commit']}"
+            print(line)
+
+            if not args.no_save:
+                history.add(run)
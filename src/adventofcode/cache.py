@@ -0,0 +1,208 @@
+import os
+import json
+import time
+import hashlib
+import pathlib as pl
+
+
+class CachedResponse:
+    """Minimal stand-in for a `requests.Response` read back from the cache.
+
+    Only the attributes used by the `HTMLParser` are provided.
+    """
+
+    def __init__(self, content: bytes, status_code: int = 200):
+        """Initialize the cached response.
+
+        Parameters
+        ----------
+        content : bytes
+            Raw content of the response.
+        status_code : int, default=200
+            HTTP status code of the response.
+        """
+
+        self.content = content
+        self.status_code = status_code
+
+
+class ResponseCache:
+    """Persistent on-disk cache for AOC responses.
+
+    Entries are keyed by (year, day, url) and stored under a cache directory,
+    usually located inside the challenge directory. Each entry can be given
+    a time-to-live, after which it is considered stale.
+    """
+
+    index_name = "index.json"
+
+    def __init__(self, cache_dir):
+        """Initialize the response cache.
+
+        Parameters
+        ----------
+        cache_dir : str | pl.Path
+            Directory to store the cached responses in.
+        """
+
+        self._cache_dir = pl.Path(cache_dir)
+        self._index_path = pl.Path(self._cache_dir, self.index_name)
+        self._index = self._load_index()
+
+    def _load_index(self):
+        """Load the cache index from disk.
+
+        Returns
+        -------
+        dict
+            Cache index, mapping keys to entry metadata.
+        """
+
+        if not os.path.exists(self._index_path):
+            return {}
+
+        try:
+            with open(self._index_path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            # A corrupted index simply means an empty cache
+            return {}
+
+    def _save_index(self):
+        """Write the cache index to disk atomically."""
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        tmp_path = pl.Path(self._cache_dir, f"{self.index_name}.tmp")
+        with open(tmp_path, "w") as file:
+            json.dump(self._index, file, indent=2)
+        os.replace(tmp_path, self._index_path)
+
+    @staticmethod
+    def make_key(year: int, day: int, url: str):
+        """Build the cache key of a request.
+
+        Parameters
+        ----------
+        year : int
+            Year of the challenge.
+        day : int
+            Day of the challenge.
+        url : str
+            Requested URL.
+
+        Returns
+        -------
+        str
+            Cache key.
+        """
+
+        return hashlib.sha1(f"{year}/{day}/{url}".encode()).hexdigest()
+
+    def get(self, year: int, day: int, url: str, ttl=None):
+        """Get a cached response.
+
+        Parameters
+        ----------
+        year : int
+            Year of the challenge.
+        day : int
+            Day of the challenge.
+        url : str
+            Requested URL.
+        ttl : float | None, default=None
+            Maximum age of the entry in seconds, None means no expiry.
+
+        Returns
+        -------
+        CachedResponse | None
+            Cached response, or None if the entry is missing or stale.
+        """
+
+        key = self.make_key(year, day, url)
+        if key not in self._index:
+            return None
+
+        entry = self._index[key]
+        if ttl is not None and time.time() - entry["time"] > ttl:
+            return None
+
+        data_path = pl.Path(self._cache_dir, entry["file"])
+        if not os.path.exists(data_path):
+            return None
+
+        with open(data_path, "rb") as file:
+            content = file.read()
+
+        return CachedResponse(content, entry["status_code"])
+
+    def set(self, year: int, day: int, url: str, response):
+        """Store a response in the cache.
+
+        Only successful responses are cached.
+
+        Parameters
+        ----------
+        year : int
+            Year of the challenge.
+        day : int
+            Day of the challenge.
+        url : str
+            Requested URL.
+        response : req.Response | CachedResponse
+            Response to store.
+        """
+
+        if response.status_code != 200:
+            return
+
+        key = self.make_key(year, day, url)
+        file_name = f"{key}.html"
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        tmp_path = pl.Path(self._cache_dir, f"{file_name}.tmp")
+        with open(tmp_path, "wb") as file:
+            file.write(response.content)
+        os.replace(tmp_path, pl.Path(self._cache_dir, file_name))
+
+        self._index[key] = {
+            "year": year,
+            "day": day,
+            "url": url,
+            "time": time.time(),
+            "status_code": response.status_code,
+            "file": file_name,
+        }
+        self._save_index()
+
+    def invalidate(self, year: int, day: int, url: str):
+        """Remove an entry from the cache.
+
+        Parameters
+        ----------
+        year : int
+            Year of the challenge.
+        day : int
+            Day of the challenge.
+        url : str
+            URL of the entry to remove.
+        """
+
+        key = self.make_key(year, day, url)
+        if key not in self._index:
+            return
+
+        entry = self._index.pop(key)
+        data_path = pl.Path(self._cache_dir, entry["file"])
+        if os.path.exists(data_path):
+            os.remove(data_path)
+        self._save_index()
+
+    def clear(self):
+        """Remove all entries from the cache."""
+
+        for entry in self._index.values():
+            data_path = pl.Path(self._cache_dir, entry["file"])
+            if os.path.exists(data_path):
+                os.remove(data_path)
+        self._index = {}
+        self._save_index()
@@ -0,0 +1,217 @@
+import sys
+import argparse
+import pathlib as pl
+import concurrent.futures as cf
+
+from .answers import AnswerStore
+from .io import file_digest
+from .registry import scan_year_day
+from .runner import discover_solutions, run_solutions
+from .sweep import run_scaled
+from .utils import parse_days
+
+
+def check_results(results, record=False):
+    """Compare run results with the expected answers.
+
+    Parameters
+    ----------
+    results : list[dict]
+        Result of each level, as returned by `run_solutions` or `run_batch`.
+    record : bool, default=False
+        Whether to store the answers of levels without an expected answer.
+
+    Returns
+    -------
+    list[dict]
+        Results, with the expected answer and the status ("ok", "wrong",
+        "error", "missing" or "recorded") of each level.
+    """
+
+    stores = {}
+    for r in results:
+        root_dir = pl.Path(r["path"]).parent
+        if root_dir not in stores:
+            stores[root_dir] = AnswerStore(root_dir)
+
+        # Results of runs on other inputs than the solution's own carry their input
+        input_path = pl.Path(r["input"]) if r.get("input") is not None else pl.Path(root_dir, "input.txt")
+        digest = file_digest(input_path) if input_path.exists() else None
+        r["expected"] = stores[root_dir].get(digest, r["level"]) if digest is not None else None
+
+        if r["error"] is not None:
+            r["status"] = "error"
+        elif r["expected"] is None:
+            if record and digest is not None:
+                stores[root_dir].set(digest, r["level"], r["answer"])
+                r["status"] = "recorded"
+            else:
+                r["status"] = "missing"
+        elif r["answer"] == r["expected"]:
+            r["status"] = "ok"
+        else:
+            r["status"] = "wrong"
+
+    return results
+
+
+def format_check(results):
+    """Format checked results as a table.
+
+    Parameters
+    ----------
+    results : list[dict]
+        Checked result of each level.
+
+    Returns
+    -------
+    str
+        Formatted table.
+    """
+
+    lines = [f"{'Year':>6} {'Day':>4} {'Level':>6} {'Time (s)':>12} {'Status':>9}  Answer"]
+    for r in results:
+        time_str = f"{r['time']:>12.4e}" if r["time"] is not None else f"{'-':>12}"
+        if r["status"] == "wrong":
+            answer = f"{r['answer']} (expected {r['expected']})"
+        elif r["status"] == "error":
+            answer = f"ERROR: {r['error']}"
+        else:
+            answer = r["answer"]
+        lines.append(f"{r['year']:>6} {r['day']:>4} {r['level']:>6} {time_str} {r['status'].upper():>9}  {answer}")
+
+    counts = {}
+    for r in results:
+        counts[r["status"]] = counts.get(r["status"], 0) + 1
+    lines.append(", ".join([f"{n} {status}" for status, n in sorted(counts.items())]))
+
+    return "\n".join(lines)
+
+
+def diff_solutions(reference, candidate, levels=(1, 2), scales=(1.,), seeds=(0,), max_workers=None, timeout=None):
+    """Run a reference and a candidate implementation of a day on generated inputs.
+
+    Parameters
+    ----------
+    reference : str | pl.Path
+        Path to the reference solution module.
+    candidate : str | pl.Path
+        Path to the candidate solution module.
+    levels : tuple[int], default=(1, 2)
+        Levels to run.
+    scales : tuple[float], default=(1.,)
+        Scale factors of the generated inputs.
+    seeds : tuple[int], default=(0,)
+        Seeds of the generated inputs.
+    max_workers : int | None, default=None
+        Number of processes, the number of CPUs if None.
+    timeout : float | None, default=None
+        Time limit per run in seconds, no limit if None.
+
+    Returns
+    -------
+    list[dict]
+        Level, scale, seed, answers and times of both implementations for each input.
+    """
+
+    year, day = scan_year_day(reference)
+
+    with cf.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for level in levels:
+            for scale in scales:
+                for seed in seeds:
+                    for name, path in [("reference", reference), ("candidate", candidate)]:
+                        future = executor.submit(run_scaled, path, year, day, level, scale,
+                                                 seed=seed, timeout=timeout)
+                        futures[future] = (level, scale, seed, name)
+
+        runs = {}
+        for future in cf.as_completed(futures):
+            level, scale, seed, name = futures[future]
+            runs.setdefault((level, scale, seed), {})[name] = future.result()
+
+    diffs = []
+    for (level, scale, seed), run in sorted(runs.items()):
+        ref, cand = run["reference"], run["candidate"]
+        diffs.append({
+            "level": level,
+            "scale": scale,
+            "seed": seed,
+            "reference": ref["answer"] if ref["error"] is None else f"ERROR: {ref['error']}",
+            "candidate": cand["answer"] if cand["error"] is None else f"ERROR: {cand['error']}",
+            "reference_time": ref["time"],
+            "candidate_time": cand["time"],
+            "match": ref["error"] is None and cand["error"] is None and ref["answer"] == cand["answer"],
+        })
+
+    return diffs
+
+
+def format_diff(diffs):
+    """Format the differences between two implementations as a table.
+
+    Parameters
+    ----------
+    diffs : list[dict]
+        Result of each input, as returned by `diff_solutions`.
+
+    Returns
+    -------
+    str
+        Formatted table.
+    """
+
+    lines = [f"{'Level':>6} {'Scale':>6} {'Seed':>5} {'Ref (s)':>11} {'Cand (s)':>11} {'Speedup':>8}  Result"]
+    for d in diffs:
+        ref_time = f"{d['reference_time']:>11.3e}" if d["reference_time"] is not None else f"{'-':>11}"
+        cand_time = f"{d['candidate_time']:>11.3e}" if d["candidate_time"] is not None else f"{'-':>11}"
+        if d["reference_time"] and d["candidate_time"]:
+            speedup = f"{d['reference_time'] / d['candidate_time']:>7.2f}x"
+        else:
+            speedup = f"{'-':>8}"
+        result = "OK" if d["match"] else f"MISMATCH: {d['reference']} != {d['candidate']}"
+        lines.append(f"{d['level']:>6} {d['scale']:>6g} {d['seed']:>5} {ref_time} {cand_time} {speedup}  {result}")
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.check",
+        description="Checks Advent of Code solutions against their expected answers, "
+                    "or checks two implementations of a day against each other on generated inputs.",
+    )
+
+    parser.add_argument("-r", "--root", type=str, default=".", help="root directory of the challenges")
+    parser.add_argument("-y", "--year", type=int, nargs="+", help="requested year(s)")
+    parser.add_argument("-d", "--day", type=str, help="requested day, or list/range of days (e.g. 1,3,5-9)")
+    parser.add_argument("-l", "--level", type=int, nargs="+", default=[1, 2], help="requested level(s)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="time limit per run (s)")
+    parser.add_argument("--record", action="store_true",
+                        help="store the answers of levels without an expected answer")
+    parser.add_argument("--diff", type=str, nargs=2, metavar=("REFERENCE", "CANDIDATE"),
+                        help="compare two implementations of a day on generated inputs")
+    parser.add_argument("-s", "--scales", type=float, nargs="+", default=[1.],
+                        help="scale factors of the generated inputs (with --diff)")
+    parser.add_argument("--seeds", type=int, default=5, help="number of generated inputs per scale (with --diff)")
+
+    args = parser.parse_args()
+
+    if args.diff is not None:
+        diffs = diff_solutions(*args.diff, levels=args.level, scales=args.scales, seeds=range(args.seeds),
+                               max_workers=args.workers, timeout=args.timeout)
+        print(format_diff(diffs))
+        failed = not all([d["match"] for d in diffs])
+
+    else:
+        days = parse_days(args.day) if args.day is not None else None
+        solutions = discover_solutions(args.root, years=args.year, days=days)
+        results = run_solutions(solutions, levels=args.level, max_workers=args.workers, timeout=args.timeout)
+        results = check_results(results, record=args.record)
+        print(format_check(results))
+        failed = any([r["status"] in ["wrong", "error"] for r in results])
+
+    sys.exit(1 if failed else 0)
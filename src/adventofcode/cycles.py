@@ -0,0 +1,286 @@
+import hashlib
+
+import numpy as np
+
+
+def _identity(state):
+    return state
+
+
+def state_hash(state):
+    """Build a hashable snapshot of a state.
+
+    Arrays are reduced to a digest of their content, so that long histories
+    of large states stay small. Lists, tuples, sets and dictionaries are
+    converted recursively, other states are assumed to be hashable already.
+
+    Parameters
+    ----------
+    state : object
+        State of a simulation.
+
+    Returns
+    -------
+    Hashable
+        Snapshot of the state, equal for equal states.
+    """
+
+    if isinstance(state, np.ndarray):
+        digest = hashlib.blake2b(f"{state.shape}{state.dtype.str}".encode(), digest_size=16)
+        digest.update(np.ascontiguousarray(state).data)
+        return digest.digest()
+
+    if isinstance(state, (list, tuple)):
+        return tuple([state_hash(s) for s in state])
+
+    if isinstance(state, (set, frozenset)):
+        return frozenset([state_hash(s) for s in state])
+
+    if isinstance(state, dict):
+        return frozenset([(k, state_hash(v)) for k, v in state.items()])
+
+    return state
+
+
+def find_cycle(step, x0, key=None, max_steps=None):
+    """Find the cycle of a sequence of states by hashing every state.
+
+    Takes the fewest steps, at the cost of keeping the key of every state.
+
+    Parameters
+    ----------
+    step : callable
+        Function returning the next state, or None when the sequence ends.
+        Must not modify its argument in place.
+    x0 : object
+        Initial state.
+    key : callable | None, default=None
+        Function building a hashable key from a state, e.g. `state_hash` or an
+        integer encoding, the state itself is used if None.
+    max_steps : int | None, default=None
+        Maximum number of steps to simulate, unbounded if None.
+
+    Returns
+    -------
+    tuple[int, int] | None
+        Index of the first state of the cycle and period of the cycle, None if
+        the sequence ends or no cycle is found within `max_steps` steps.
+    """
+
+    if key is None:
+        key = _identity
+
+    seen = {}
+    x = x0
+    i = 0
+    while x is not None and (max_steps is None or i <= max_steps):
+        k = key(x)
+        if k in seen:
+            return seen[k], i - seen[k]
+        seen[k] = i
+        x = step(x)
+        i += 1
+
+    return None
+
+
+def _brent_period(step, x0, key, max_steps):
+    """Find the period of the cycle of a sequence with Brent's algorithm."""
+
+    power = period = 1
+    tortoise = key(x0)
+    hare = step(x0)
+    n = 1
+    while hare is not None and (max_steps is None or n <= max_steps):
+        k = key(hare)
+        if k == tortoise:
+            return period
+        # Move the tortoise to the hare every power of two
+        if power == period:
+            tortoise = k
+            power *= 2
+            period = 0
+        hare = step(hare)
+        period += 1
+        n += 1
+
+    return None
+
+
+def brent(step, x0, key=None, max_steps=None):
+    """Find the cycle of a sequence of states with Brent's algorithm.
+
+    Only two states are kept at any time, at the cost of simulating up to
+    about three times as many steps as `find_cycle`.
+
+    Parameters
+    ----------
+    step : callable
+        Function returning the next state, or None when the sequence ends.
+        Must not modify its argument in place.
+    x0 : object
+        Initial state.
+    key : callable | None, default=None
+        Function building a comparable key from a state, the state itself is
+        used if None.
+    max_steps : int | None, default=None
+        Maximum number of steps to simulate while searching for the period,
+        unbounded if None.
+
+    Returns
+    -------
+    tuple[int, int] | None
+        Index of the first state of the cycle and period of the cycle, None if
+        the sequence ends or no cycle is found within `max_steps` steps.
+    """
+
+    if key is None:
+        key = _identity
+
+    period = _brent_period(step, x0, key, max_steps)
+    if period is None:
+        return None
+
+    # Walk two states one period apart until they meet at the start of the cycle
+    tortoise = hare = x0
+    for _ in range(period):
+        hare = step(hare)
+
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+
+    return start, period
+
+
+def floyd(step, x0, key=None, max_steps=None):
+    """Find the cycle of a sequence of states with Floyd's algorithm.
+
+    Parameters
+    ----------
+    step : callable
+        Function returning the next state, or None when the sequence ends.
+        Must not modify its argument in place.
+    x0 : object
+        Initial state.
+    key : callable | None, default=None
+        Function building a comparable key from a state, the state itself is
+        used if None.
+    max_steps : int | None, default=None
+        Maximum number of steps of the slow state while searching for a
+        repetition, unbounded if None.
+
+    Returns
+    -------
+    tuple[int, int] | None
+        Index of the first state of the cycle and period of the cycle, None if
+        the sequence ends or no cycle is found within `max_steps` steps.
+    """
+
+    if key is None:
+        key = _identity
+
+    tortoise = step(x0)
+    hare = step(tortoise) if tortoise is not None else None
+    n = 1
+    while hare is not None and key(tortoise) != key(hare):
+        if max_steps is not None and n >= max_steps:
+            return None
+        tortoise = step(tortoise)
+        hare = step(hare)
+        hare = step(hare) if hare is not None else None
+        n += 1
+
+    if hare is None:
+        return None
+
+    tortoise = x0
+    start = 0
+    while key(tortoise) != key(hare):
+        tortoise = step(tortoise)
+        hare = step(hare)
+        start += 1
+
+    period = 1
+    k = key(tortoise)
+    hare = step(tortoise)
+    while key(hare) != k:
+        hare = step(hare)
+        period += 1
+
+    return start, period
+
+
+def has_cycle(step, x0, key=None, max_steps=None):
+    """Check whether a sequence of states cycles, with Brent's algorithm.
+
+    Parameters
+    ----------
+    step : callable
+        Function returning the next state, or None when the sequence ends.
+        Must not modify its argument in place.
+    x0 : object
+        Initial state.
+    key : callable | None, default=None
+        Function building a comparable key from a state, the state itself is
+        used if None.
+    max_steps : int | None, default=None
+        Maximum number of steps to simulate, unbounded if None.
+
+    Returns
+    -------
+    bool
+        Whether a cycle was found.
+    """
+
+    return _brent_period(step, x0, key if key is not None else _identity, max_steps) is not None
+
+
+def fast_forward(step, x0, n, key=None):
+    """Get the state of a sequence after a number of steps.
+
+    The states are simulated until the target step or the first repeated
+    state. Once a cycle is found, the steps that fall on whole periods are
+    skipped, so that far targets (e.g. 10^12) are reached in at most the
+    length of the cycle plus its start.
+
+    Parameters
+    ----------
+    step : callable
+        Function returning the next state, or None when the sequence ends.
+        Must not modify its argument in place.
+    x0 : object
+        Initial state.
+    n : int
+        Number of steps.
+    key : callable | None, default=None
+        Function building a hashable key from a state, e.g. `state_hash` or an
+        integer encoding, the state itself is used if None.
+
+    Returns
+    -------
+    object
+        State after `n` steps, None if the sequence ends before.
+    """
+
+    if key is None:
+        key = _identity
+
+    seen = {}
+    x = x0
+    i = 0
+    while i < n and x is not None:
+        k = key(x)
+        if k in seen:
+            # The current state repeats every period, skip the whole periods left
+            period = i - seen[k]
+            for _ in range((n - i) % period):
+                x = step(x)
+            return x
+        seen[k] = i
+        x = step(x)
+        i += 1
+
+    return x
@@ -0,0 +1,389 @@
+import re
+import html
+import json
+import time
+import argparse
+import threading
+import http.server
+import pathlib as pl
+import urllib.parse
+
+from .answers import AnswerStore
+from .io import file_digest
+
+
+class FakePuzzle:
+    """Puzzle served by the fake AOC server, with its progress and cooldown."""
+
+    def __init__(self, year, day, input_txt, answers, title=None):
+        """Initialize the puzzle.
+
+        Parameters
+        ----------
+        year : int
+            Year of the puzzle.
+        day : int
+            Day of the puzzle.
+        input_txt : str
+            Input of the puzzle.
+        answers : dict
+            Correct answer of each level, as strings indexed by level.
+        title : str | None, default=None
+            Title of the puzzle.
+        """
+
+        self.year = year
+        self.day = day
+        self.input_txt = input_txt
+        self.answers = {int(level): str(answer) for level, answer in answers.items()}
+        self.title = title if title is not None else f"Puzzle {day}"
+        self.level = 1
+        self.cooldown_until = 0.
+        self.lock = threading.Lock()
+
+    def instruction_page(self):
+        """Build the instruction page of the puzzle at its current level.
+
+        Returns
+        -------
+        str
+            HTML instruction page.
+        """
+
+        articles = [
+            f'<article class="day-desc"><h2>--- Day {self.day}: {html.escape(self.title)} ---</h2>'
+            f"<p>Instructions of the first part of day {self.day} of {self.year}.</p>"
+            f"<pre><code>example\ninput</code></pre></article>"
+        ]
+        if self.level >= 2:
+            articles.append(
+                f'<p>Your puzzle answer was <code>{html.escape(self.answers.get(1, "?"))}</code>.</p>'
+                f'<article class="day-desc"><h2 id="part2">--- Part Two ---</h2>'
+                f"<p>Instructions of the second part of day {self.day} of {self.year}.</p></article>"
+            )
+        if self.level >= 3:
+            articles.append(
+                f'<p>Your puzzle answer was <code>{html.escape(self.answers.get(2, "?"))}</code>.</p>'
+                f'<p class="day-success">Both parts of this puzzle are complete! They provide two gold stars: **</p>'
+            )
+
+        return f"<!DOCTYPE html><html><body><main>{''.join(articles)}</main></body></html>"
+
+
+class FakeAOCServer(http.server.ThreadingHTTPServer):
+    """Local stand-in for the AOC website.
+
+    The server serves instruction pages, inputs, and answer verdicts for a set
+    of puzzles, including the "too high"/"too low" hints and the submission
+    cooldowns. Failures and latency can be injected to exercise the retries
+    and the concurrency of the connector. Request counts are kept in `stats`.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, address=("127.0.0.1", 0), wrong_cooldown=60., recent_cooldown=None, latency=0.):
+        """Initialize the fake server.
+
+        Parameters
+        ----------
+        address : tuple[str, int], default=("127.0.0.1", 0)
+            Address to listen on, a free port is picked if the port is 0.
+        wrong_cooldown : float, default=60.
+            Cooldown after a wrong answer, in seconds.
+        recent_cooldown : float | None, default=None
+            Cooldown reported when answering too recently, the remaining
+            cooldown is reported if None.
+        latency : float, default=0.
+            Delay added to each response, in seconds.
+        """
+
+        super().__init__(address, _FakeAOCHandler)
+
+        self.puzzles = {}
+        self.wrong_cooldown = wrong_cooldown
+        self.recent_cooldown = recent_cooldown
+        self.latency = latency
+        self.failures = 0
+        self.stats = {"GET": 0, "POST": 0, "failed": 0}
+        self._lock = threading.Lock()
+        self._thread = None
+
+    @property
+    def url(self):
+        """Root URL of the server."""
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def add_puzzle(self, year, day, input_txt, answers, title=None):
+        """Add a puzzle to the server.
+
+        Parameters
+        ----------
+        year : int
+            Year of the puzzle.
+        day : int
+            Day of the puzzle.
+        input_txt : str
+            Input of the puzzle.
+        answers : dict
+            Correct answer of each level, indexed by level.
+        title : str | None, default=None
+            Title of the puzzle.
+
+        Returns
+        -------
+        FakePuzzle
+            Added puzzle.
+        """
+
+        puzzle = FakePuzzle(year, day, input_txt, answers, title=title)
+        self.puzzles[(year, day)] = puzzle
+        return puzzle
+
+    def load_challenges(self, root):
+        """Add the puzzles recorded in a challenge root directory.
+
+        Each `<year>/day_<day>` directory with an `input.txt` file is served,
+        with the answers recorded for that input in its answer store.
+
+        Parameters
+        ----------
+        root : str | pl.Path
+            Root directory of the challenges.
+
+        Returns
+        -------
+        int
+            Number of puzzles added.
+        """
+
+        n = 0
+        for input_path in sorted(pl.Path(root).glob("*/day_*/input.txt")):
+            match = re.match(r"^day_(\d+)$", input_path.parent.name)
+            if match is None or not input_path.parent.parent.name.isdigit():
+                continue
+
+            store = AnswerStore(input_path.parent)
+            digest = file_digest(input_path)
+            answers = {level: store.get(digest, level) for level in [1, 2]}
+            answers = {level: answer for level, answer in answers.items() if answer is not None}
+
+            with open(input_path, "r") as file:
+                input_txt = file.read()
+
+            self.add_puzzle(int(input_path.parent.parent.name), int(match.group(1)), input_txt, answers)
+            n += 1
+
+        return n
+
+    def fail_next(self, n):
+        """Make the next GET requests fail with a 503 error.
+
+        Parameters
+        ----------
+        n : int
+            Number of requests to fail.
+        """
+
+        with self._lock:
+            self.failures = n
+
+    def count(self, key):
+        """Increment a request counter, and check whether the request should fail.
+
+        Parameters
+        ----------
+        key : str
+            Counter to increment.
+
+        Returns
+        -------
+        bool
+            Whether the request should fail.
+        """
+
+        with self._lock:
+            self.stats[key] = self.stats.get(key, 0) + 1
+            if key == "GET" and self.failures > 0:
+                self.failures -= 1
+                self.stats["failed"] += 1
+                return True
+
+        return False
+
+    def start(self):
+        """Serve requests from a background thread.
+
+        Returns
+        -------
+        FakeAOCServer
+            The server itself.
+        """
+
+        self._thread = threading.Thread(target=self.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """Stop serving requests and close the server."""
+
+        if self._thread is not None:
+            self.shutdown()
+            self._thread.join()
+            self._thread = None
+        self.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+class _FakeAOCHandler(http.server.BaseHTTPRequestHandler):
+    """Handler of the requests sent to the fake AOC server."""
+
+    protocol_version = "HTTP/1.1"
+    page_pattern = re.compile(r"^/(\d+)/day/(\d+)(/input|/answer)?/?$")
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, content, content_type="text/html"):
+        if self.server.latency > 0:
+            time.sleep(self.server.latency)
+
+        data = content.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", f"{content_type}; charset=utf-8")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _get_puzzle(self):
+        match = self.page_pattern.match(urllib.parse.urlsplit(self.path).path)
+        if match is None:
+            return None, None
+
+        return self.server.puzzles.get((int(match.group(1)), int(match.group(2)))), match.group(3)
+
+    def _has_session(self):
+        return "session=" in self.headers.get("Cookie", "")
+
+    def do_GET(self):
+
+        if self.server.count("GET"):
+            self._send(503, "Service temporarily unavailable")
+            return
+
+        puzzle, page = self._get_puzzle()
+        if puzzle is None:
+            self._send(404, "404 Not Found")
+            return
+
+        if page is None:
+            with puzzle.lock:
+                content = puzzle.instruction_page()
+            self._send(200, content)
+
+        elif page == "/input":
+            if not self._has_session():
+                self._send(400, "Puzzle inputs differ by user.  Please log in to get your puzzle input.\n",
+                           content_type="text/plain")
+                return
+            self._send(200, puzzle.input_txt, content_type="text/plain")
+
+        else:
+            self._send(405, "Method Not Allowed")
+
+    def do_POST(self):
+
+        self.server.count("POST")
+        length = int(self.headers.get("Content-Length", 0))
+        form = urllib.parse.parse_qs(self.rfile.read(length).decode())
+
+        puzzle, page = self._get_puzzle()
+        if puzzle is None or page != "/answer":
+            self._send(404, "404 Not Found")
+            return
+
+        level = int(form.get("level", ["0"])[0])
+        answer = form.get("answer", [""])[0]
+
+        with puzzle.lock:
+            verdict = self._judge(puzzle, level, answer)
+
+        self._send(200, f"<!DOCTYPE html><html><body><main><article><p>{verdict}</p></article></main></body></html>")
+
+    def _judge(self, puzzle, level, answer):
+        """Judge a submitted answer, and update the progress and cooldown of the puzzle."""
+
+        now = time.time()
+        if now < puzzle.cooldown_until:
+            wait = self.server.recent_cooldown
+            if wait is None:
+                wait = puzzle.cooldown_until - now
+            minutes, seconds = divmod(int(round(wait)), 60)
+            left = f"{minutes}m {seconds}s" if minutes > 0 else f"{seconds}s"
+            return ("You gave an answer too recently; you have to wait after submitting an answer before "
+                    f"trying again.  You have {left} left to wait.")
+
+        if level != puzzle.level:
+            return "You don't seem to be solving the right level.  Did you already complete it?"
+
+        expected = puzzle.answers.get(level)
+        if expected is not None and answer == expected:
+            puzzle.level += 1
+            return "That's the right answer!  You are one gold star closer to finding the Chief Historian."
+
+        hint = ""
+        try:
+            if expected is not None:
+                hint = " your answer is too low." if int(answer) < int(expected) else " your answer is too high."
+        except ValueError:
+            pass
+
+        puzzle.cooldown_until = now + self.server.wrong_cooldown
+        verdict = f"That's not the right answer;{hint}  If you're stuck, make sure you're using the full input data."
+        # Cooldowns shorter than a minute are only reported when answering too recently
+        minutes = int(self.server.wrong_cooldown // 60)
+        if minutes > 0:
+            verdict += f"  Please wait {minutes} minute{'s' if minutes > 1 else ''} before trying again."
+
+        return verdict
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.fakeserver",
+        description="Serves the recorded Advent of Code puzzles of a challenge root from a local stand-in server.",
+    )
+
+    parser.add_argument("-r", "--root", type=str, default=".", help="root directory of the challenges")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="host to listen on")
+    parser.add_argument("-p", "--port", type=int, default=8000, help="port to listen on")
+    parser.add_argument("--cooldown", type=float, default=60., help="cooldown after a wrong answer (s)")
+    parser.add_argument("--latency", type=float, default=0., help="delay added to each response (s)")
+    parser.add_argument("--puzzles", type=str, help="JSON file of extra puzzles "
+                                                    "([{\"year\", \"day\", \"input\", \"answers\"}, ...])")
+
+    args = parser.parse_args()
+
+    server = FakeAOCServer((args.host, args.port), wrong_cooldown=args.cooldown, latency=args.latency)
+    n = server.load_challenges(args.root)
+    if args.puzzles is not None:
+        with open(args.puzzles, "r") as file:
+            for puzzle in json.load(file):
+                server.add_puzzle(puzzle["year"], puzzle["day"], puzzle["input"], puzzle["answers"],
+                                  title=puzzle.get("title"))
+                n += 1
+
+    print(f"Serving {n} puzzles on {server.url}")
+    print(f"Use it with: AOC_ROOT_URL={server.url} AOC_SESSION_TOKEN=fake python ...")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,686 @@
+import random
+import string
+
+
+# Registry of the input generators, indexed by (year, day)
+_generators = {}
+
+
+def generator(year, day, levels=(1, 2)):
+    """Register an input generator for a challenge.
+
+    Parameters
+    ----------
+    year : int
+        Year of the challenge.
+    day : int
+        Day of the challenge.
+    levels : tuple[int], default=(1, 2)
+        Levels of the solution that can run on the generated inputs.
+
+    Returns
+    -------
+    callable
+        Decorator registering the generator.
+    """
+
+    def register(func):
+        _generators[(year, day)] = (func, tuple(levels))
+        return func
+
+    return register
+
+
+def get_generators():
+    """Get all the registered input generators.
+
+    Returns
+    -------
+    dict
+        Generator function and supported levels, indexed by (year, day).
+    """
+
+    return dict(_generators)
+
+
+def generate_input(year, day, scale=1., seed=0):
+    """Generate a synthetic input for a challenge.
+
+    Parameters
+    ----------
+    year : int
+        Year of the challenge.
+    day : int
+        Day of the challenge.
+    scale : float, default=1.
+        Scale factor of the input, 1 gives an input of the order of a real one.
+    seed : int, default=0
+        Seed of the random generator.
+
+    Returns
+    -------
+    str
+        Generated input.
+    """
+
+    if (year, day) not in _generators:
+        raise KeyError(f"No input generator for {year} day {day}")
+
+    func, _ = _generators[(year, day)]
+    rng = random.Random(f"{seed}-{year}-{day}-{scale}")
+
+    return func(rng, scale)
+
+
+def _odd(n):
+    return n if n % 2 == 1 else n + 1
+
+
+def _grid_to_text(grid):
+    return "\n".join(["".join(row) for row in grid])
+
+
+def _maze(rng, side, extra_openings=0.):
+    """Generate a perfect maze with random depth-first search, on an odd-sized grid.
+
+    Parameters
+    ----------
+    rng : random.Random
+        Random generator.
+    side : int
+        Side of the grid, made odd.
+    extra_openings : float, default=0.
+        Fraction of inner walls removed to create loops.
+
+    Returns
+    -------
+    list[list[str]]
+        Maze, with "#" walls and "." paths.
+    """
+
+    side = _odd(max(side, 5))
+    grid = [["#"] * side for _ in range(side)]
+
+    stack = [(1, 1)]
+    grid[1][1] = "."
+    while stack:
+        i, j = stack[-1]
+        moves = [(di, dj) for di, dj in [(-2, 0), (2, 0), (0, -2), (0, 2)]
+                 if 0 < i + di < side - 1 and 0 < j + dj < side - 1 and grid[i+di][j+dj] == "#"]
+        if not moves:
+            stack.pop()
+            continue
+        di, dj = rng.choice(moves)
+        grid[i+di//2][j+dj//2] = "."
+        grid[i+di][j+dj] = "."
+        stack.append((i + di, j + dj))
+
+    for i in range(1, side - 1):
+        for j in range(1, side - 1):
+            if grid[i][j] == "#" and (i + j) % 2 == 1 and rng.random() < extra_openings:
+                grid[i][j] = "."
+
+    return grid
+
+
+# 2024
+
+
+@generator(2024, 1)
+def gen_2024_1(rng, scale):
+    """Two columns of 5-digit numbers, 1000 lines per unit of scale."""
+
+    n = int(1000 * scale)
+    values = [rng.randint(10000, 99999) for _ in range(n // 2 + 1)]
+    return "\n".join([f"{rng.randint(10000, 99999)}   {rng.choice(values)}" for _ in range(n)])
+
+
+@generator(2024, 2)
+def gen_2024_2(rng, scale):
+    """Reports of 5 to 8 levels, 1000 lines per unit of scale."""
+
+    lines = []
+    for _ in range(int(1000 * scale)):
+        level = rng.randint(10, 90)
+        sign = rng.choice([-1, 1])
+        report = [level]
+        for _ in range(rng.randint(4, 7)):
+            report.append(report[-1] + sign * rng.choice([1, 2, 3, 3, 4, 0, -1]))
+        lines.append(" ".join(map(str, report)))
+    return "\n".join(lines)
+
+
+@generator(2024, 3)
+def gen_2024_3(rng, scale):
+    """Corrupted memory with mul/do/don't instructions, 18000 characters per unit of scale."""
+
+    tokens = []
+    length = 0
+    while length < 18000 * scale:
+        r = rng.random()
+        if r < 0.25:
+            token = f"mul({rng.randint(1, 999)},{rng.randint(1, 999)})"
+        elif r < 0.28:
+            token = "do()"
+        elif r < 0.31:
+            token = "don't()"
+        else:
+            token = "".join(rng.choices(string.punctuation + "mul", k=rng.randint(1, 8)))
+        tokens.append(token)
+        length += len(token)
+    txt = "".join(tokens)
+    return "\n".join([txt[i:i+3000] for i in range(0, len(txt), 3000)])
+
+
+@generator(2024, 4)
+def gen_2024_4(rng, scale):
+    """Word search grid of X, M, A, S letters, side 140 * sqrt(scale)."""
+
+    side = int(140 * scale ** 0.5)
+    return _grid_to_text([rng.choices("XMAS", k=side) for _ in range(side)])
+
+
+@generator(2024, 5)
+def gen_2024_5(rng, scale):
+    """Ordering rules over 49 pages and 200 updates per unit of scale."""
+
+    pages = rng.sample(range(10, 100), 49)
+    rules = [f"{a}|{b}" for i, a in enumerate(pages) for b in pages[i+1:]]
+    rng.shuffle(rules)
+
+    updates = []
+    for _ in range(int(200 * scale)):
+        update = rng.sample(pages, _odd(rng.randint(5, 22)))
+        if rng.random() < 0.5:
+            update.sort(key=pages.index)
+        updates.append(",".join(map(str, update)))
+
+    return "\n".join(rules) + "\n\n" + "\n".join(updates)
+
+
+@generator(2024, 6)
+def gen_2024_6(rng, scale):
+    """Lab map of side 130 * sqrt(scale), where the guard walks 5000 * scale cells before leaving.
+
+    The walk is built step by step: in front of each new cell, an obstacle is
+    placed with some probability to make the guard turn. A choice that leads
+    the guard back into one of its past states, i.e. into a loop, or out of
+    the map too early is undone by backtracking. The map is then filled up to
+    about 800 * scale obstacles away from the walk.
+    """
+
+    side = int(130 * scale ** 0.5)
+    target = int(5000 * scale)
+
+    i, j = rng.randrange(side // 4, 3 * side // 4), rng.randrange(side // 4, 3 * side // 4)
+    di, dj = -1, 0
+    start = (i, j)
+
+    obstacles, visited, states = set(), {(i, j)}, {(i, j, di, dj)}
+    # Additions to the sets, undone when backtracking
+    log = []
+    # Log length, guard state and other choice at each decision
+    decisions = []
+
+    def step(turn):
+        nonlocal i, j, di, dj
+        if turn:
+            if (i + di, j + dj) not in obstacles:
+                obstacles.add((i + di, j + dj))
+                log.append((obstacles, (i + di, j + dj)))
+            di, dj = dj, -di
+        else:
+            i, j = i + di, j + dj
+            if (i, j) not in visited:
+                visited.add((i, j))
+                log.append((visited, (i, j)))
+
+        if (i, j, di, dj) in states:
+            return False
+        states.add((i, j, di, dj))
+        log.append((states, (i, j, di, dj)))
+        return True
+
+    def backtrack():
+        nonlocal i, j, di, dj
+        while decisions:
+            n, state, other = decisions.pop()
+            while len(log) > n:
+                added, x = log.pop()
+                added.discard(x)
+            i, j, di, dj = state
+            if step(other):
+                return
+        raise RuntimeError("Could not build a walk leaving the map")
+
+    while True:
+        a, b = i + di, j + dj
+        if not (0 <= a < side and 0 <= b < side):
+            if len(visited) >= target:
+                break
+            backtrack()
+        elif (a, b) in obstacles or (a, b) in visited or len(visited) >= target:
+            # Turn on existing obstacles, walk on once the walk is long enough or on visited cells
+            if not step((a, b) in obstacles):
+                backtrack()
+        else:
+            place = rng.random() < 1 / 12
+            decisions.append((len(log), (i, j, di, dj), not place))
+            if not step(place):
+                backtrack()
+
+    free = [(a, b) for a in range(side) for b in range(side) if (a, b) not in visited and (a, b) not in obstacles]
+    obstacles.update(rng.sample(free, min(len(free), max(0, int(800 * scale) - len(obstacles)))))
+
+    grid = [["#" if (a, b) in obstacles else "." for b in range(side)] for a in range(side)]
+    grid[start[0]][start[1]] = "^"
+    return _grid_to_text(grid)
+
+
+@generator(2024, 7)
+def gen_2024_7(rng, scale):
+    """Calibration equations of 3 to 10 operands, 850 lines per unit of scale."""
+
+    lines = []
+    for _ in range(int(850 * scale)):
+        nums = [rng.randint(1, 999) for _ in range(rng.randint(3, 10))]
+        total = nums[0]
+        for n in nums[1:]:
+            op = rng.choice("+*|")
+            total = total + n if op == "+" else total * n if op == "*" else int(f"{total}{n}")
+        if rng.random() < 0.5:
+            total += rng.randint(1, 10)
+        lines.append(f"{total}: " + " ".join(map(str, nums)))
+    return "\n".join(lines)
+
+
+@generator(2024, 8)
+def gen_2024_8(rng, scale):
+    """Antenna map with 4 antennas per frequency, side 50 * sqrt(scale)."""
+
+    side = int(50 * scale ** 0.5)
+    grid = [["."] * side for _ in range(side)]
+    freqs = string.digits + string.ascii_letters
+    for k in range(max(1, side * side // 200)):
+        for _ in range(4):
+            grid[rng.randrange(side)][rng.randrange(side)] = freqs[k % len(freqs)]
+    return _grid_to_text(grid)
+
+
+@generator(2024, 9)
+def gen_2024_9(rng, scale):
+    """Disk map of 20000 digits per unit of scale."""
+
+    n = _odd(int(20000 * scale))
+    return "".join([str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9)) for i in range(n)])
+
+
+@generator(2024, 10)
+def gen_2024_10(rng, scale):
+    """Topographic map of slopes with random noise, side 50 * sqrt(scale)."""
+
+    side = int(50 * scale ** 0.5)
+    grid = [[str((i + j) % 10 if rng.random() < 0.7 else rng.randint(0, 9)) for j in range(side)]
+            for i in range(side)]
+    return _grid_to_text(grid)
+
+
+@generator(2024, 11)
+def gen_2024_11(rng, scale):
+    """Stones engraved with random numbers, 8 stones per unit of scale."""
+
+    return " ".join([str(rng.randint(0, 10 ** rng.randint(1, 7))) for _ in range(max(1, int(8 * scale)))])
+
+
+@generator(2024, 12)
+def gen_2024_12(rng, scale):
+    """Garden of random plant regions grown from seeds, side 140 * sqrt(scale)."""
+
+    side = int(140 * scale ** 0.5)
+    grid = [[None] * side for _ in range(side)]
+    todo = []
+    for _ in range(max(1, side * side // 80)):
+        i, j = rng.randrange(side), rng.randrange(side)
+        grid[i][j] = rng.choice(string.ascii_uppercase)
+        todo.append((i, j))
+
+    while todo:
+        i, j = todo.pop(rng.randrange(len(todo)))
+        for di, dj in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            if 0 <= i + di < side and 0 <= j + dj < side and grid[i+di][j+dj] is None:
+                grid[i+di][j+dj] = grid[i][j]
+                todo.append((i + di, j + dj))
+
+    return _grid_to_text(grid)
+
+
+@generator(2024, 13)
+def gen_2024_13(rng, scale):
+    """Claw machines, 320 per unit of scale."""
+
+    machines = []
+    for _ in range(int(320 * scale)):
+        xa, ya, xb, yb = [rng.randint(10, 99) for _ in range(4)]
+        na, nb = rng.randint(1, 100), rng.randint(1, 100)
+        px, py = na * xa + nb * xb, na * ya + nb * yb
+        if rng.random() < 0.5:
+            px += rng.randint(1, 50)
+        machines.append(f"Button A: X+{xa}, Y+{ya}\nButton B: X+{xb}, Y+{yb}\nPrize: X={px}, Y={py}")
+    return "\n\n".join(machines)
+
+
+@generator(2024, 14, levels=(1,))
+def gen_2024_14(rng, scale):
+    """Robots in the 101x103 space, 500 per unit of scale."""
+
+    return "\n".join([f"p={rng.randrange(101)},{rng.randrange(103)} v={rng.randint(-100, 100)},{rng.randint(-100, 100)}"
+                      for _ in range(int(500 * scale))])
+
+
+@generator(2024, 15)
+def gen_2024_15(rng, scale):
+    """Warehouse of side 50 * sqrt(scale) and 20000 moves per unit of scale."""
+
+    side = int(50 * scale ** 0.5)
+    grid = [["#"] * side] + [["#"] + ["." for _ in range(side - 2)] + ["#"] for _ in range(side - 2)] + [["#"] * side]
+    for i in range(1, side - 1):
+        for j in range(1, side - 1):
+            r = rng.random()
+            grid[i][j] = "O" if r < 0.4 else "#" if r < 0.45 else "."
+    grid[side // 2][side // 2] = "@"
+
+    moves = "".join(rng.choices("<>^v", k=int(20000 * scale)))
+    return _grid_to_text(grid) + "\n\n" + "\n".join([moves[i:i+1000] for i in range(0, len(moves), 1000)])
+
+
+@generator(2024, 16)
+def gen_2024_16(rng, scale):
+    """Reindeer maze with loops, side 141 * sqrt(scale)."""
+
+    grid = _maze(rng, int(141 * scale ** 0.5), extra_openings=0.05)
+    side = len(grid)
+    grid[side - 2][1] = "S"
+    grid[1][side - 2] = "E"
+    return _grid_to_text(grid)
+
+
+@generator(2024, 17, levels=(1,))
+def gen_2024_17(rng, scale):
+    """Three-bit program, with a register A of 48 bits per unit of scale."""
+
+    a = rng.getrandbits(max(3, int(48 * scale)))
+    k1, k2 = rng.randrange(8), rng.randrange(8)
+    program = [2, 4, 1, k1, 7, 5, 1, k2, 4, 3, 5, 5, 0, 3, 3, 0]
+    return f"Register A: {a}\nRegister B: 0\nRegister C: 0\n\nProgram: " + ",".join(map(str, program))
+
+
+@generator(2024, 18)
+def gen_2024_18(rng, scale):
+    """Falling bytes in the 71x71 memory space, cut after at least 1024 + 1900 * scale bytes.
+
+    The memory space and the first kilobyte are fixed by the puzzle, the scale
+    sets how long the path resists, which is the work of level 2. A path is
+    cut as soon as the fallen bytes, connected diagonally, link the top or
+    right side to the left or bottom side, which is tracked with a union-find.
+    Bytes that would cut the path too early fall after the cutting byte.
+    """
+
+    side = 71
+    n_cut = 1024 + int(1900 * scale)
+
+    # Two virtual nodes for the top-right and bottom-left sides
+    top_right, bottom_left = side * side, side * side + 1
+    parents = list(range(side * side + 2))
+
+    def find(node):
+        while parents[node] != node:
+            parents[node] = parents[parents[node]]
+            node = parents[node]
+        return node
+
+    corrupted = set()
+
+    def roots(i, j):
+        found = set()
+        if j == 0 or i == side - 1:
+            found.add(find(top_right))
+        if i == 0 or j == side - 1:
+            found.add(find(bottom_left))
+        for di in (-1, 0, 1):
+            for dj in (-1, 0, 1):
+                if (i + di, j + dj) in corrupted:
+                    found.add(find((i + di) * side + j + dj))
+        return found
+
+    cells = [(i, j) for i in range(side) for j in range(side) if (i, j) not in [(0, 0), (side - 1, side - 1)]]
+    rng.shuffle(cells)
+
+    byte_list, deferred = [], []
+    for k, (i, j) in enumerate(cells):
+        found = roots(i, j)
+        last = find(top_right) in found and find(bottom_left) in found
+        if last and len(byte_list) < n_cut:
+            deferred.append((i, j))
+            continue
+
+        corrupted.add((i, j))
+        for root in found:
+            parents[root] = i * side + j
+        byte_list.append((i, j))
+        if last:
+            break
+    else:
+        # No byte is left that keeps the path open, a deferred byte still cuts it
+        byte_list.append(deferred.pop(rng.randrange(len(deferred))))
+        k = len(cells)
+
+    # Bytes keep falling after the path is cut, as in real inputs
+    rest = deferred + cells[k+1:]
+    rng.shuffle(rest)
+    byte_list.extend(rest[:500])
+
+    return "\n".join([f"{i},{j}" for i, j in byte_list])
+
+
+@generator(2024, 19)
+def gen_2024_19(rng, scale):
+    """Towel patterns and 400 designs of 60 stripes per unit of scale."""
+
+    patterns = sorted(set(["".join(rng.choices("wubrg", k=rng.randint(1, 8))) for _ in range(450)]))
+    designs = ["".join(rng.choices("wubrg", k=rng.randint(40, 60))) for _ in range(int(400 * scale))]
+    return ", ".join(patterns) + "\n\n" + "\n".join(designs)
+
+
+@generator(2024, 20)
+def gen_2024_20(rng, scale):
+    """Single-lane racetrack through every other cell, side 141 * sqrt(scale).
+
+    The track follows the walls of a random maze, which visits every cell of a
+    grid twice as fine as the maze once and comes back to its start. The loop
+    is cut between two consecutive cells to get the start and the end.
+    """
+
+    m = max(2, int(141 * scale ** 0.5) // 4)
+    maze = _maze(rng, 2 * m + 1)
+
+    # Each maze cell is a 2x2 block of track cells, linked around its sides
+    # unless the maze goes through them
+    links = {}
+    for a in range(m):
+        for b in range(m):
+            i, j = 2 * a, 2 * b
+            sides = [
+                ((-1, 0), (i, j), (i, j + 1)),
+                ((1, 0), (i + 1, j), (i + 1, j + 1)),
+                ((0, -1), (i, j), (i + 1, j)),
+                ((0, 1), (i, j + 1), (i + 1, j + 1)),
+            ]
+            for (da, db), p, q in sides:
+                if maze[2 * a + 1 + da][2 * b + 1 + db] == ".":
+                    links.setdefault(p, []).append((p[0] + da, p[1] + db))
+                    links.setdefault(q, []).append((q[0] + da, q[1] + db))
+                else:
+                    links.setdefault(p, []).append(q)
+                    links.setdefault(q, []).append(p)
+
+    loop = [(0, 0)]
+    prev = None
+    while len(loop) < len(links):
+        nxt = [c for c in links[loop[-1]] if c != prev][0]
+        prev = loop[-1]
+        loop.append(nxt)
+
+    cut = rng.randrange(len(loop))
+    track = loop[cut:] + loop[:cut]
+
+    side = 4 * m + 1
+    grid = [["#"] * side for _ in range(side)]
+    for (i, j), (k, l) in zip(track, track[1:]):
+        grid[2 * i + 1][2 * j + 1] = "."
+        grid[i + k + 1][j + l + 1] = "."
+
+    (i, j), (k, l) = track[0], track[-1]
+    grid[2 * i + 1][2 * j + 1] = "S"
+    grid[2 * k + 1][2 * l + 1] = "E"
+    return _grid_to_text(grid)
+
+
+@generator(2024, 21)
+def gen_2024_21(rng, scale):
+    """Door codes of three digits, 5 codes per unit of scale."""
+
+    return "\n".join([f"{rng.randint(1, 999):03d}A" for _ in range(max(1, int(5 * scale)))])
+
+
+@generator(2024, 22)
+def gen_2024_22(rng, scale):
+    """Initial secret numbers, 2000 per unit of scale."""
+
+    return "\n".join([str(rng.randint(1, 16777215)) for _ in range(int(2000 * scale))])
+
+
+@generator(2024, 23)
+def gen_2024_23(rng, scale):
+    """Network of two-letter computers with degree 13, 520 computers per unit of scale (at most 676)."""
+
+    names = rng.sample([a + b for a in string.ascii_lowercase for b in string.ascii_lowercase], 676)
+    names = names[:max(14, min(676, int(520 * scale)))]
+
+    edges = set()
+    degree = {a: 0 for a in names}
+    for a in names:
+        while degree[a] < 13:
+            b = rng.choice(names)
+            edge = tuple(sorted((a, b)))
+            if b != a and edge not in edges:
+                edges.add(edge)
+                degree[a] += 1
+                degree[b] += 1
+
+    edges = list(edges)
+    rng.shuffle(edges)
+    return "\n".join([f"{a}-{b}" for a, b in edges])
+
+
+@generator(2024, 24, levels=(1,))
+def gen_2024_24(rng, scale):
+    """Ripple-carry adder with 45 bits per unit of scale."""
+
+    n = max(2, int(45 * scale))
+    width = max(2, len(str(n)))
+    used = set()
+
+    def wire():
+        while True:
+            name = "".join(rng.choices(string.ascii_lowercase[:23], k=3))
+            if name not in used:
+                used.add(name)
+                return name
+
+    values = [f"x{i:0{width}d}: {rng.randint(0, 1)}" for i in range(n)]
+    values += [f"y{i:0{width}d}: {rng.randint(0, 1)}" for i in range(n)]
+
+    gates = [f"x{0:0{width}d} XOR y{0:0{width}d} -> z{0:0{width}d}"]
+    carry = wire()
+    gates.append(f"x{0:0{width}d} AND y{0:0{width}d} -> {carry}")
+    for i in range(1, n):
+        xy_xor, xy_and, c_and = wire(), wire(), wire()
+        new_carry = f"z{n:0{width}d}" if i == n - 1 else wire()
+        gates += [
+            f"x{i:0{width}d} XOR y{i:0{width}d} -> {xy_xor}",
+            f"x{i:0{width}d} AND y{i:0{width}d} -> {xy_and}",
+            f"{xy_xor} XOR {carry} -> z{i:0{width}d}",
+            f"{xy_xor} AND {carry} -> {c_and}",
+            f"{xy_and} OR {c_and} -> {new_carry}",
+        ]
+        carry = new_carry
+
+    rng.shuffle(gates)
+    return "\n".join(values) + "\n\n" + "\n".join(gates)
+
+
+@generator(2024, 25)
+def gen_2024_25(rng, scale):
+    """Lock and key schematics, 250 of each per unit of scale."""
+
+    schematics = []
+    for k in range(int(500 * scale)):
+        heights = [rng.randint(0, 5) for _ in range(5)]
+        lock = k % 2 == 0
+        rows = ["#####"]
+        for r in range(1, 6):
+            if lock:
+                rows.append("".join(["#" if h >= r else "." for h in heights]))
+            else:
+                rows.append("".join(["#" if h >= 6 - r else "." for h in heights]))
+        rows.append(".....")
+        schematics.append("\n".join(rows if lock else rows[::-1]))
+    return "\n\n".join(schematics)
+
+
+# 2025
+
+
+@generator(2025, 1)
+def gen_2025_1(rng, scale):
+    """Dial rotations, 4000 lines per unit of scale."""
+
+    return "\n".join([f"{rng.choice('LR')}{rng.randint(1, 999)}" for _ in range(int(4000 * scale))])
+
+
+@generator(2025, 2)
+def gen_2025_2(rng, scale):
+    """Product ID ranges, 35 ranges per unit of scale."""
+
+    ranges = []
+    for _ in range(max(1, int(35 * scale))):
+        r1 = rng.randint(10, 10 ** rng.randint(2, 10))
+        ranges.append(f"{r1}-{r1 + rng.randint(0, 10 ** 5)}")
+    return ",".join(ranges)
+
+
+@generator(2025, 3)
+def gen_2025_3(rng, scale):
+    """Battery banks of 100 digits, 200 banks per unit of scale."""
+
+    return "\n".join(["".join(rng.choices("123456789", k=100)) for _ in range(int(200 * scale))])
+
+
+@generator(2025, 4)
+def gen_2025_4(rng, scale):
+    """Paper roll grid with 60% rolls, side 135 * sqrt(scale)."""
+
+    side = int(135 * scale ** 0.5)
+    return _grid_to_text([["@" if rng.random() < 0.6 else "." for _ in range(side)] for _ in range(side)])
+
+
+@generator(2025, 5)
+def gen_2025_5(rng, scale):
+    """Fresh ingredient ID ranges and available IDs, 190 ranges and 1000 IDs per unit of scale."""
+
+    ranges = []
+    for _ in range(int(190 * scale)):
+        r1 = rng.randint(1, 10 ** 15)
+        ranges.append(f"{r1}-{r1 + rng.randint(0, 10 ** 13)}")
+    ids = [str(rng.randint(1, 10 ** 15)) for _ in range(int(1000 * scale))]
+    return "\n".join(ranges) + "\n\n" + "\n".join(ids)
@@ -0,0 +1,325 @@
+import numpy as np
+
+
+class Grid:
+    """Two-dimensional grid backed by a NumPy array.
+
+    The grid is stored with a border of padding cells, so that the neighbours
+    of any cell of the grid can be accessed without bounds checks. Cells are
+    identified either by their (row, column) coordinates in the unpadded grid,
+    or by their flat index in the padded array.
+    """
+
+    directions_4 = np.array([(-1, 0), (0, 1), (1, 0), (0, -1)])
+    directions_8 = np.array([(-1, -1), (-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1)])
+
+    def __init__(self, values, pad=1, fill=0, dtype=None):
+        """Initialize the grid.
+
+        Parameters
+        ----------
+        values : array_like
+            Two-dimensional values of the grid.
+        pad : int, default=1
+            Width of the padding around the grid.
+        fill : int, default=0
+            Value of the padding cells.
+        dtype : data-type | None, default=None
+            Data type of the grid, inferred from the values if None.
+        """
+
+        values = np.asarray(values, dtype=dtype)
+        if values.ndim != 2:
+            raise ValueError(f"A grid must be two-dimensional, got {values.ndim} dimensions")
+
+        self._pad = pad
+        self._fill = fill
+        self._data = np.full((values.shape[0] + 2 * pad, values.shape[1] + 2 * pad), fill, dtype=values.dtype)
+        self._data[pad:pad+values.shape[0], pad:pad+values.shape[1]] = values
+        self._neighbour_tables = {}
+
+    @classmethod
+    def from_text(cls, txt, mapping=None, pad=1, fill=0, dtype=np.uint8):
+        """Build a grid from text.
+
+        Parameters
+        ----------
+        txt : str
+            Lines of the grid, all of the same length.
+        mapping : dict | None, default=None
+            Value of each character, the byte values of the characters are used if None.
+        pad : int, default=1
+            Width of the padding around the grid.
+        fill : int, default=0
+            Value of the padding cells.
+        dtype : data-type, default=np.uint8
+            Data type of the grid.
+
+        Returns
+        -------
+        Grid
+            Grid built from the text.
+        """
+
+        lines = txt.strip().split("\n")
+        chars = np.frombuffer("".join(lines).encode(), dtype=np.uint8).reshape(len(lines), -1)
+
+        if mapping is None:
+            return cls(chars, pad=pad, fill=fill, dtype=dtype)
+
+        lookup = np.zeros(256, dtype=dtype)
+        for c, value in mapping.items():
+            lookup[ord(c)] = value
+
+        return cls(lookup[chars], pad=pad, fill=fill, dtype=dtype)
+
+    @property
+    def shape(self):
+        """Shape of the unpadded grid."""
+        return (self._data.shape[0] - 2 * self._pad, self._data.shape[1] - 2 * self._pad)
+
+    @property
+    def values(self):
+        """View of the unpadded values of the grid."""
+        return self._data[self._pad:self._data.shape[0]-self._pad, self._pad:self._data.shape[1]-self._pad]
+
+    @property
+    def padded(self):
+        """View of the padded values of the grid."""
+        return self._data
+
+    @property
+    def flat(self):
+        """Flat view of the padded values of the grid."""
+        return self._data.reshape(-1)
+
+    def __getitem__(self, key):
+        return self.values[key]
+
+    def __setitem__(self, key, value):
+        self.values[key] = value
+
+    def copy(self):
+        """Get a copy of the grid.
+
+        Returns
+        -------
+        Grid
+            Copy of the grid.
+        """
+
+        return Grid(self.values.copy(), pad=self._pad, fill=self._fill)
+
+    def in_bounds(self, i, j):
+        """Check whether coordinates are inside the unpadded grid.
+
+        Parameters
+        ----------
+        i : int | np.ndarray
+            Row(s).
+        j : int | np.ndarray
+            Column(s).
+
+        Returns
+        -------
+        bool | np.ndarray
+            Whether the coordinates are inside the grid.
+        """
+
+        ni, nj = self.shape
+        return (i >= 0) & (i < ni) & (j >= 0) & (j < nj)
+
+    def to_flat(self, i, j):
+        """Convert coordinates to flat indices in the padded array.
+
+        Parameters
+        ----------
+        i : int | np.ndarray
+            Row(s).
+        j : int | np.ndarray
+            Column(s).
+
+        Returns
+        -------
+        int | np.ndarray
+            Flat index(es).
+        """
+
+        return (i + self._pad) * self._data.shape[1] + j + self._pad
+
+    def to_coords(self, idx):
+        """Convert flat indices in the padded array to coordinates.
+
+        Parameters
+        ----------
+        idx : int | np.ndarray
+            Flat index(es).
+
+        Returns
+        -------
+        int | np.ndarray
+            Row(s).
+        int | np.ndarray
+            Column(s).
+        """
+
+        i, j = np.divmod(idx, self._data.shape[1])
+        return i - self._pad, j - self._pad
+
+    def cells(self):
+        """Get the flat indices of all the cells of the unpadded grid.
+
+        Returns
+        -------
+        np.ndarray
+            Flat indices, in row-major order.
+        """
+
+        ni, nj = self.shape
+        i, j = np.divmod(np.arange(ni * nj), nj)
+        return self.to_flat(i, j)
+
+    def neighbour_offsets(self, diagonal=False):
+        """Get the flat index offsets of the neighbours of a cell.
+
+        Parameters
+        ----------
+        diagonal : bool, default=False
+            Whether to include diagonal neighbours.
+
+        Returns
+        -------
+        np.ndarray
+            Offsets, in the order of `directions_4` or `directions_8`.
+        """
+
+        directions = self.directions_8 if diagonal else self.directions_4
+        return directions[:, 0] * self._data.shape[1] + directions[:, 1]
+
+    def neighbour_table(self, diagonal=False):
+        """Get the flat indices of the neighbours of every cell of the padded array.
+
+        Neighbours of padding cells on the outer border wrap around and should not
+        be used. The table is built once and cached.
+
+        Parameters
+        ----------
+        diagonal : bool, default=False
+            Whether to include diagonal neighbours.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (cells, 4 or 8), where row `idx` contains the flat
+            indices of the neighbours of cell `idx`.
+        """
+
+        if diagonal not in self._neighbour_tables:
+            idx = np.arange(self._data.size)
+            table = (idx[:, None] + self.neighbour_offsets(diagonal=diagonal)[None, :]) % self._data.size
+            self._neighbour_tables[diagonal] = table
+
+        return self._neighbour_tables[diagonal]
+
+    def mask(self, value):
+        """Get a mask of the cells with a given value.
+
+        Parameters
+        ----------
+        value : int | list[int]
+            Value(s) to look for.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of the unpadded grid.
+        """
+
+        return np.isin(self.values, value)
+
+    def find(self, value):
+        """Get the coordinates of the cells with a given value.
+
+        Parameters
+        ----------
+        value : int | list[int]
+            Value(s) to look for.
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (n, 2) with the coordinates of the cells, in row-major order.
+        """
+
+        return np.argwhere(self.mask(value))
+
+    def find_one(self, value):
+        """Get the coordinates of the first cell with a given value.
+
+        Parameters
+        ----------
+        value : int
+            Value to look for.
+
+        Returns
+        -------
+        tuple[int, int] | None
+            Coordinates of the cell, or None if no cell has the value.
+        """
+
+        coords = self.find(value)
+        if len(coords) == 0:
+            return None
+        return int(coords[0, 0]), int(coords[0, 1])
+
+    def count_neighbours(self, mask=None, diagonal=True):
+        """Count, for each cell, the neighbours inside a mask.
+
+        Parameters
+        ----------
+        mask : np.ndarray | None, default=None
+            Boolean mask of the unpadded grid, the non-zero cells are counted if None.
+        diagonal : bool, default=True
+            Whether to include diagonal neighbours.
+
+        Returns
+        -------
+        np.ndarray
+            Number of neighbours of each cell of the unpadded grid.
+        """
+
+        if mask is None:
+            mask = self.values != 0
+
+        ni, nj = mask.shape
+        padded = np.zeros((ni + 2, nj + 2), dtype=np.int32)
+        padded[1:-1, 1:-1] = mask
+
+        counts = np.zeros((ni, nj), dtype=np.int32)
+        directions = self.directions_8 if diagonal else self.directions_4
+        for di, dj in directions:
+            counts += padded[1+di:1+di+ni, 1+dj:1+dj+nj]
+
+        return counts
+
+    def to_text(self, mapping=None):
+        """Convert the grid to text.
+
+        Parameters
+        ----------
+        mapping : dict | None, default=None
+            Character of each value, values are used as byte values if None.
+
+        Returns
+        -------
+        str
+            Lines of the grid.
+        """
+
+        if mapping is None:
+            return "\n".join([bytes(row.astype(np.uint8)).decode() for row in self.values])
+
+        return "\n".join(["".join([mapping[v] for v in row.tolist()]) for row in self.values])
+
+    def __repr__(self):
+        return f"Grid(shape={self.shape}, dtype={self._data.dtype})"
@@ -0,0 +1,188 @@
+import html
+import html.parser
+
+
+class ArticleExtractor(html.parser.HTMLParser):
+    """Single-pass extractor of the `<article>` blocks of an AOC page.
+
+    The page is tokenized once by the standard library HTML parser. Each
+    article is either kept as raw inner HTML or converted to Markdown.
+    """
+
+    block_tags = {"p", "h2", "pre", "ul", "ol"}
+
+    def __init__(self, markdown=False):
+        """Initialize the article extractor.
+
+        Parameters
+        ----------
+        markdown : bool, default=False
+            Whether to convert the articles to Markdown instead of raw HTML.
+        """
+
+        super().__init__(convert_charrefs=False)
+
+        self._markdown = markdown
+        self._depth = 0
+        self._parts = []
+        self._articles = []
+        self._in_pre = 0
+        self._in_code = 0
+        self._lists = []
+        self._links = []
+
+    def pop_articles(self):
+        """Get the articles completed so far and forget them.
+
+        Returns
+        -------
+        list[str]
+            Completed articles.
+        """
+
+        articles = self._articles
+        self._articles = []
+        return articles
+
+    def handle_starttag(self, tag, attrs):
+
+        if tag == "article":
+            self._depth += 1
+            if self._depth == 1:
+                self._parts = []
+                return
+
+        if self._depth == 0:
+            return
+
+        if not self._markdown:
+            self._parts.append(self.get_starttag_text())
+            return
+
+        if tag == "h2":
+            self._parts.append("## ")
+        elif tag == "pre":
+            self._in_pre += 1
+            self._parts.append("```\n")
+        elif tag == "code":
+            self._in_code += 1
+            if not self._in_pre:
+                self._parts.append("`")
+        elif tag == "em" and not self._in_code:
+            self._parts.append("*")
+        elif tag in ("ul", "ol"):
+            self._lists.append(tag)
+        elif tag == "li":
+            indent = "  " * (len(self._lists) - 1)
+            bullet = "1." if self._lists and self._lists[-1] == "ol" else "-"
+            self._parts.append(f"{indent}{bullet} ")
+        elif tag == "a":
+            self._links.append(dict(attrs).get("href", ""))
+            self._parts.append("[")
+        elif tag == "br":
+            self._parts.append("\n")
+
+    def handle_startendtag(self, tag, attrs):
+
+        if self._depth == 0:
+            return
+
+        if not self._markdown:
+            self._parts.append(self.get_starttag_text())
+        elif tag == "br":
+            self._parts.append("\n")
+
+    def handle_endtag(self, tag):
+
+        if self._depth == 0:
+            return
+
+        if tag == "article":
+            self._depth -= 1
+            if self._depth == 0:
+                self._articles.append("".join(self._parts))
+                self._parts = []
+                return
+
+        if not self._markdown:
+            self._parts.append(f"</{tag}>")
+            return
+
+        if tag == "pre":
+            self._in_pre -= 1
+            if not "".join(self._parts[-1:]).endswith("\n"):
+                self._parts.append("\n")
+            self._parts.append("```\n\n")
+        elif tag == "code":
+            self._in_code -= 1
+            if not self._in_pre:
+                self._parts.append("`")
+        elif tag == "em" and not self._in_code:
+            self._parts.append("*")
+        elif tag in ("ul", "ol"):
+            if self._lists:
+                self._lists.pop()
+            if not self._lists:
+                self._parts.append("\n")
+        elif tag == "li":
+            self._parts.append("\n")
+        elif tag == "a":
+            href = self._links.pop() if self._links else ""
+            self._parts.append(f"]({href})")
+        elif tag in self.block_tags:
+            self._parts.append("\n\n")
+
+    def handle_data(self, data):
+
+        if self._depth == 0:
+            return
+
+        if self._markdown and not self._in_pre and data.strip() == "":
+            # Drop indentation between block tags
+            if data.count("\n") > 0:
+                return
+
+        self._parts.append(data)
+
+    def handle_entityref(self, name):
+
+        if self._depth > 0:
+            ref = f"&{name};"
+            self._parts.append(html.unescape(ref) if self._markdown else ref)
+
+    def handle_charref(self, name):
+
+        if self._depth > 0:
+            ref = f"&#{name};"
+            self._parts.append(html.unescape(ref) if self._markdown else ref)
+
+
+def iter_articles(content, markdown=False, chunk_size=65536):
+    """Iterate over the `<article>` blocks of an HTML page.
+
+    The page is processed in a single pass, and articles are yielded as soon
+    as the chunk containing their closing tag has been parsed.
+
+    Parameters
+    ----------
+    content : str
+        HTML content of the page.
+    markdown : bool, default=False
+        Whether to convert the articles to Markdown instead of raw HTML.
+    chunk_size : int, default=65536
+        Number of characters fed to the tokenizer at once.
+
+    Yields
+    ------
+    str
+        Inner content of each article.
+    """
+
+    extractor = ArticleExtractor(markdown=markdown)
+
+    for i in range(0, len(content), chunk_size):
+        extractor.feed(content[i:i+chunk_size])
+        yield from extractor.pop_articles()
+
+    extractor.close()
+    yield from extractor.pop_articles()
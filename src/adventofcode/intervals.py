@@ -0,0 +1,238 @@
+import bisect
+
+import numpy as np
+
+
+class IntervalSet:
+    """Set of integers stored as sorted, disjoint intervals.
+
+    Intervals are given and returned as inclusive (start, end) pairs, as in
+    the range puzzles. They are stored half-open and merged, so that
+    overlapping and adjacent intervals form a single interval, and membership
+    is checked by bisection. Batch membership queries over NumPy arrays are
+    run with `np.searchsorted`, on values that fit in 64-bit integers.
+
+    Iterating over the set yields its disjoint intervals, and `len` counts
+    them. The number of integers in the set is given by `total_length`.
+    """
+
+    def __init__(self, intervals=()):
+        """Initialize the interval set.
+
+        Parameters
+        ----------
+        intervals : iterable[tuple[int, int]], default=()
+            Inclusive (start, end) intervals, in any order. Empty intervals
+            (end < start) are ignored.
+        """
+
+        self._starts = []
+        self._stops = []
+        self._arrays = None
+
+        for start, stop in sorted([(int(s), int(e) + 1) for s, e in intervals if e >= s]):
+            if self._stops and start <= self._stops[-1]:
+                self._stops[-1] = max(self._stops[-1], stop)
+            else:
+                self._starts.append(start)
+                self._stops.append(stop)
+
+    @classmethod
+    def _from_half_open(cls, starts, stops):
+        """Build a set from sorted, disjoint and non-adjacent half-open intervals."""
+
+        new = cls()
+        new._starts = starts
+        new._stops = stops
+        return new
+
+    def add(self, start, end):
+        """Add an interval to the set.
+
+        Parameters
+        ----------
+        start : int
+            First value of the interval.
+        end : int
+            Last value of the interval (inclusive).
+        """
+
+        if end < start:
+            return
+
+        start, stop = int(start), int(end) + 1
+        # Intervals overlapping or adjacent to the new one are merged into it
+        i = bisect.bisect_left(self._stops, start)
+        j = bisect.bisect_right(self._starts, stop)
+        if i < j:
+            start = min(start, self._starts[i])
+            stop = max(stop, self._stops[j - 1])
+
+        self._starts[i:j] = [start]
+        self._stops[i:j] = [stop]
+        self._arrays = None
+
+    def __contains__(self, value):
+        i = bisect.bisect_right(self._starts, value) - 1
+        return i >= 0 and value < self._stops[i]
+
+    def contains(self, values):
+        """Check the membership of a batch of values.
+
+        Parameters
+        ----------
+        values : array_like
+            Integer values.
+
+        Returns
+        -------
+        np.ndarray
+            Whether each value is in the set.
+        """
+
+        values = np.asarray(values, dtype=np.int64)
+        if not self._starts:
+            return np.zeros(values.shape, dtype=bool)
+
+        if self._arrays is None:
+            self._arrays = np.array(self._starts, dtype=np.int64), np.array(self._stops, dtype=np.int64)
+        starts, stops = self._arrays
+
+        i = np.searchsorted(starts, values, side="right") - 1
+        return (i >= 0) & (values < stops[np.maximum(i, 0)])
+
+    def count(self, values):
+        """Count the values of a batch that are in the set.
+
+        Parameters
+        ----------
+        values : array_like
+            Integer values.
+
+        Returns
+        -------
+        int
+            Number of values in the set.
+        """
+
+        return int(np.count_nonzero(self.contains(values)))
+
+    def total_length(self):
+        """Get the number of integers in the set.
+
+        Returns
+        -------
+        int
+            Total length of the intervals.
+        """
+
+        return sum([stop - start for start, stop in zip(self._starts, self._stops)])
+
+    def union(self, other):
+        """Get the union with another set.
+
+        Parameters
+        ----------
+        other : IntervalSet
+            Other set.
+
+        Returns
+        -------
+        IntervalSet
+            Integers in either set.
+        """
+
+        return IntervalSet(list(self) + list(other))
+
+    def intersection(self, other):
+        """Get the intersection with another set.
+
+        Parameters
+        ----------
+        other : IntervalSet
+            Other set.
+
+        Returns
+        -------
+        IntervalSet
+            Integers in both sets.
+        """
+
+        starts, stops = [], []
+        i = j = 0
+        while i < len(self._starts) and j < len(other._starts):
+            start = max(self._starts[i], other._starts[j])
+            stop = min(self._stops[i], other._stops[j])
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+            # Move past the interval that ends first
+            if self._stops[i] < other._stops[j]:
+                i += 1
+            else:
+                j += 1
+
+        return IntervalSet._from_half_open(starts, stops)
+
+    def difference(self, other):
+        """Get the difference with another set.
+
+        Parameters
+        ----------
+        other : IntervalSet
+            Set of the integers to remove.
+
+        Returns
+        -------
+        IntervalSet
+            Integers in this set but not in the other one.
+        """
+
+        starts, stops = [], []
+        j = 0
+        for start, stop in zip(self._starts, self._stops):
+            # Skip the removed intervals that end before this one
+            while j < len(other._starts) and other._stops[j] <= start:
+                j += 1
+
+            k = j
+            while k < len(other._starts) and other._starts[k] < stop:
+                if other._starts[k] > start:
+                    starts.append(start)
+                    stops.append(other._starts[k])
+                start = max(start, other._stops[k])
+                k += 1
+
+            if start < stop:
+                starts.append(start)
+                stops.append(stop)
+
+        return IntervalSet._from_half_open(starts, stops)
+
+    def __or__(self, other):
+        return self.union(other)
+
+    def __and__(self, other):
+        return self.intersection(other)
+
+    def __sub__(self, other):
+        return self.difference(other)
+
+    def __iter__(self):
+        for start, stop in zip(self._starts, self._stops):
+            yield start, stop - 1
+
+    def __len__(self):
+        """Number of disjoint intervals, see `total_length` for the number of integers."""
+        return len(self._starts)
+
+    def __bool__(self):
+        return len(self._starts) > 0
+
+    def __eq__(self, other):
+        if not isinstance(other, IntervalSet):
+            return NotImplemented
+        return self._starts == other._starts and self._stops == other._stops
+
+    def __repr__(self):
+        return f"IntervalSet({list(self)})"
@@ -0,0 +1,329 @@
+import os
+import re
+import copy
+import mmap
+import pickle
+import hashlib
+import collections
+import pathlib as pl
+
+
+parsed_dir_name = pl.Path(".aoc_cache", "parsed")
+
+# In-process caches of file hashes and parsed inputs, every caller gets its
+# own copy of a parsed input
+_hash_memo = {}
+_parsed_memo = collections.OrderedDict()
+parsed_memo_size = 32
+
+
+class InputFile:
+    """Memory-mapped puzzle input.
+
+    The file is mapped in memory once, and exposes views of its content as
+    text, lines, integers, or a character grid. The grid view is a zero-copy
+    NumPy array backed by the mapped file.
+    """
+
+    def __init__(self, path):
+        """Initialize the input file.
+
+        Parameters
+        ----------
+        path : str | pl.Path
+            Path to the input file.
+        """
+
+        self._path = pl.Path(path)
+        self._file = open(self._path, "rb")
+        if os.fstat(self._file.fileno()).st_size > 0:
+            self._buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            # Empty files cannot be mapped
+            self._buffer = b""
+
+        # Ignore trailing whitespace, as solutions usually strip their input
+        self._end = len(self._buffer)
+        while self._end > 0 and self._buffer[self._end - 1] in b" \t\r\n":
+            self._end -= 1
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        """Unmap and close the file.
+
+        Views returned by `grid` and `line_views` stay valid after closing:
+        if some are still alive, the file is unmapped once they are all
+        garbage-collected.
+        """
+
+        if isinstance(self._buffer, mmap.mmap):
+            try:
+                self._buffer.close()
+            except BufferError:
+                # Exported views keep the mapping alive, it is released along with them
+                pass
+        self._file.close()
+
+    @property
+    def path(self):
+        """Path to the input file."""
+        return self._path
+
+    def view(self):
+        """Get a zero-copy view of the content.
+
+        Returns
+        -------
+        memoryview
+            Content of the file, without trailing whitespace.
+        """
+
+        return memoryview(self._buffer)[:self._end]
+
+    def text(self):
+        """Get the content as text.
+
+        Returns
+        -------
+        str
+            Content of the file, without trailing whitespace.
+        """
+
+        return bytes(self.view()).decode()
+
+    def lines(self):
+        """Get the lines of the content.
+
+        Returns
+        -------
+        list[str]
+            Lines of the file.
+        """
+
+        return self.text().split("\n")
+
+    def line_views(self):
+        """Get zero-copy views of the lines of the content.
+
+        Returns
+        -------
+        list[memoryview]
+            Lines of the file, without line breaks.
+        """
+
+        view = self.view()
+        views = []
+        start = 0
+        while start <= self._end:
+            stop = self._buffer.find(b"\n", start, self._end)
+            if stop < 0:
+                stop = self._end
+            views.append(view[start:stop])
+            start = stop + 1
+
+        return views
+
+    def ints(self):
+        """Get all the integers in the content.
+
+        Returns
+        -------
+        np.ndarray
+            Integers in the file, in order.
+        """
+
+        from .parse import ints
+
+        return ints(self.view())
+
+    def grid(self):
+        """Get the content as a character grid.
+
+        All lines must have the same length.
+
+        Returns
+        -------
+        np.ndarray
+            Zero-copy `uint8` array of shape (rows, columns) with the byte values
+            of the characters.
+        """
+
+        import numpy as np
+
+        ncols = self._buffer.find(b"\n", 0, self._end)
+        if ncols < 0:
+            ncols = self._end
+        nrows = (self._end + 1) // (ncols + 1)
+
+        if nrows * (ncols + 1) - 1 != self._end:
+            raise ValueError(f"The lines of {self._path} do not all have the same length")
+
+        data = np.frombuffer(self._buffer, dtype=np.uint8, count=nrows * (ncols + 1) - 1)
+        # Pad with a virtual line break to reshape the rows, without copying
+        return np.lib.stride_tricks.as_strided(data, shape=(nrows, ncols), strides=(ncols + 1, 1))
+
+    def digest(self):
+        """Get the hash of the content.
+
+        Returns
+        -------
+        str
+            Hexadecimal BLAKE2 hash of the file.
+        """
+
+        return hashlib.blake2b(self._buffer).hexdigest()
+
+
+def file_digest(path):
+    """Get the hash of a file, memoized on its modification time and size.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the file.
+
+    Returns
+    -------
+    str
+        Hexadecimal BLAKE2 hash of the file.
+    """
+
+    path = pl.Path(path).resolve()
+    stat = os.stat(path)
+    key = (str(path), stat.st_mtime_ns, stat.st_size)
+
+    if key not in _hash_memo:
+        with InputFile(path) as input_file:
+            _hash_memo[key] = input_file.digest()
+
+    return _hash_memo[key]
+
+
+def parser_key(parser):
+    """Get an identifier of a parser function, which changes when its code changes.
+
+    Parameters
+    ----------
+    parser : callable
+        Parser function.
+
+    Returns
+    -------
+    str
+        Identifier of the parser.
+    """
+
+    name = getattr(parser, "__qualname__", repr(parser))
+    code = getattr(parser, "__code__", None)
+    if code is None:
+        return name
+
+    code_hash = hashlib.blake2b(code.co_code + repr(code.co_consts).encode(), digest_size=8).hexdigest()
+    return f"{name}-{code_hash}"
+
+
+def _remember(key, value):
+    """Add an entry to the memo of parsed inputs, evicting the least recently used ones."""
+
+    _parsed_memo[key] = value
+    _parsed_memo.move_to_end(key)
+    while len(_parsed_memo) > parsed_memo_size:
+        _parsed_memo.popitem(last=False)
+
+
+def _cache_file_name(digest, key):
+    """Name of the file of a persisted parsed input, e.g. `<locals>` is not a valid file name."""
+
+    return re.sub(r"[^\w.-]", "_", f"{digest[:32]}-{key}") + ".pkl"
+
+
+def load_input(path, parser=None, persist=False):
+    """Load and parse a puzzle input, memoizing the parsed result.
+
+    Parsed inputs are memoized in process on the hash of the file and the
+    parser, so that running both levels in the same process parses the input
+    once. The memo keeps the `parsed_memo_size` most recently used inputs, and
+    every call returns a deep copy of the parsed input, which the caller is
+    free to modify. Parsed inputs that cannot be copied are not memoized.
+    Optionally, the parsed input is also pickled next to the input file so
+    that it persists across runs. Only the code of the parser itself is
+    hashed, changes in the functions it calls are not detected.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the input file.
+    parser : callable | None, default=None
+        Function parsing the stripped text of the input, the text is returned if None.
+    persist : bool, default=False
+        Whether to persist the parsed input in the `.aoc_cache/parsed` directory
+        next to the input file.
+
+    Returns
+    -------
+    any
+        Parsed input.
+    """
+
+    digest = file_digest(path)
+
+    if parser is None:
+        # Text is immutable, so that it is memoized as is
+        key = (digest, None)
+        if key in _parsed_memo:
+            _parsed_memo.move_to_end(key)
+            return _parsed_memo[key]
+        with InputFile(path) as input_file:
+            text = input_file.text()
+        _remember(key, text)
+        return text
+
+    key = (digest, parser_key(parser))
+    if key in _parsed_memo:
+        _parsed_memo.move_to_end(key)
+        return copy.deepcopy(_parsed_memo[key])
+
+    cache_path = pl.Path(pl.Path(path).parent, parsed_dir_name, _cache_file_name(digest, key[1]))
+    parsed = None
+    if persist and os.path.exists(cache_path):
+        try:
+            with open(cache_path, "rb") as file:
+                parsed = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            parsed = None
+
+    if parsed is None:
+        with InputFile(path) as input_file:
+            parsed = parser(input_file.text())
+
+        if persist:
+            try:
+                data = pickle.dumps(parsed, protocol=pickle.HIGHEST_PROTOCOL)
+            except (pickle.PicklingError, TypeError, AttributeError):
+                data = None
+            if data is not None:
+                os.makedirs(cache_path.parent, exist_ok=True)
+                tmp_path = pl.Path(f"{cache_path}.tmp")
+                with open(tmp_path, "wb") as file:
+                    file.write(data)
+                os.replace(tmp_path, cache_path)
+
+    # The memo keeps its own copy, so that changes of the caller do not leak into it
+    try:
+        _remember(key, copy.deepcopy(parsed))
+    except (TypeError, copy.Error):
+        pass
+
+    return parsed
+
+
+def clear_memo():
+    """Clear the in-process caches of hashes and parsed inputs."""
+
+    _hash_memo.clear()
+    _parsed_memo.clear()
@@ -0,0 +1,187 @@
+import re
+import time
+
+
+class SubmissionLedger:
+    """Ledger of the answers submitted for a challenge.
+
+    The ledger is kept in the challenge state, and records each submitted answer
+    with its verdict, the bounds deduced from "too high"/"too low" verdicts,
+    and the end of the current submission cooldown.
+    """
+
+    number_words = {
+        "one": 1, "two": 2, "three": 3, "four": 4, "five": 5,
+        "six": 6, "seven": 7, "eight": 8, "nine": 9, "ten": 10,
+    }
+
+    def __init__(self, state):
+        """Initialize the submission ledger.
+
+        Parameters
+        ----------
+        state : ChallengeState
+            Challenge state to store the ledger in.
+        """
+
+        self._state = state
+
+    def get_submissions(self, level):
+        """Get the answers submitted for a level.
+
+        Parameters
+        ----------
+        level : int
+            Level of the challenge.
+
+        Returns
+        -------
+        list[dict]
+            Submitted answers with their verdict and submission time.
+        """
+
+        return self._state.get("submissions", {}).get(str(level), [])
+
+    def get_bounds(self, level):
+        """Get the bounds of the answer of a level.
+
+        Parameters
+        ----------
+        level : int
+            Level of the challenge.
+
+        Returns
+        -------
+        int | None
+            Largest answer known to be too low.
+        int | None
+            Smallest answer known to be too high.
+        """
+
+        bounds = self._state.get("bounds", {}).get(str(level), {})
+        return bounds.get("low"), bounds.get("high")
+
+    def get_cooldown(self):
+        """Get the remaining submission cooldown.
+
+        Returns
+        -------
+        float
+            Remaining time before the next submission is allowed, in seconds.
+        """
+
+        return max(0., self._state.get("cooldown_until", 0.) - time.time())
+
+    def check(self, level, answer):
+        """Check an answer against the ledger before submitting it.
+
+        Parameters
+        ----------
+        level : int
+            Level of the challenge.
+        answer : any
+            Answer to check.
+
+        Returns
+        -------
+        str | None
+            Verdict if the answer can be decided locally, None otherwise.
+        bool
+            Whether the answer is known to be correct.
+        """
+
+        answer = str(answer)
+
+        for submission in self.get_submissions(level):
+            if submission["answer"] == answer:
+                return f"Answer {answer} was already submitted: {submission['verdict']}", submission["success"]
+            if submission["success"]:
+                return f"Level {level} was already solved with answer {submission['answer']}!", False
+
+        low, high = self.get_bounds(level)
+        try:
+            value = int(answer)
+        except ValueError:
+            return None, False
+
+        if low is not None and value <= low:
+            return f"Answer {answer} is too low (an answer of {low} was already too low)!", False
+        if high is not None and value >= high:
+            return f"Answer {answer} is too high (an answer of {high} was already too high)!", False
+
+        return None, False
+
+    def record(self, level, answer, verdict, success, content=""):
+        """Record a submitted answer and its verdict.
+
+        Parameters
+        ----------
+        level : int
+            Level of the challenge.
+        answer : any
+            Submitted answer.
+        verdict : str
+            Verdict of the submission.
+        success : bool
+            Whether the answer was correct.
+        content : str, default=""
+            Content of the answer page, used to update bounds and cooldown.
+        """
+
+        answer = str(answer)
+
+        cooldown = self.parse_cooldown(content)
+        if cooldown is not None:
+            self._state.set("cooldown_until", time.time() + cooldown)
+
+        # Only definitive verdicts are recorded
+        if not success and "That's not the right answer" not in content:
+            return
+
+        submissions = self._state.get("submissions", {})
+        submissions.setdefault(str(level), []).append(
+            {"answer": answer, "verdict": verdict, "success": success, "time": time.time()}
+        )
+        self._state.set("submissions", submissions)
+
+        try:
+            value = int(answer)
+        except ValueError:
+            return
+
+        bounds = self._state.get("bounds", {})
+        level_bounds = bounds.setdefault(str(level), {})
+        if "your answer is too low" in content:
+            level_bounds["low"] = max(value, level_bounds.get("low", value))
+        elif "your answer is too high" in content:
+            level_bounds["high"] = min(value, level_bounds.get("high", value))
+        self._state.set("bounds", bounds)
+
+    @classmethod
+    def parse_cooldown(cls, content):
+        """Parse the submission cooldown from an answer page.
+
+        Parameters
+        ----------
+        content : str
+            Content of the answer page.
+
+        Returns
+        -------
+        float | None
+            Cooldown in seconds, or None if the page does not mention any.
+        """
+
+        match = re.search(r"You have (?:(\d+)m\s*)?(\d+)s left to wait", content)
+        if match is not None:
+            return 60. * int(match.group(1) or 0) + float(match.group(2))
+
+        match = re.search(r"[Pp]lease wait (\w+) minutes? before trying again", content)
+        if match is not None:
+            n = match.group(1)
+            if n.isdigit():
+                return 60. * int(n)
+            if n in cls.number_words:
+                return 60. * cls.number_words[n]
+
+        return None
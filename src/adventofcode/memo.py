@@ -0,0 +1,237 @@
+import os
+import pickle
+import weakref
+import contextlib
+import functools
+import collections
+import pathlib as pl
+
+
+# Caches of the memoized functions, cleared together by `scope`
+_memos = weakref.WeakSet()
+
+
+class MemoCache:
+    """Memoization cache of a function, with its counters.
+
+    The cache is either a plain dictionary, or an ordered dictionary when it
+    is bounded so that the least recently used entries are evicted first. The
+    numbers of hits, misses and evictions are counted, and the cache can
+    optionally be persisted to a pickle file across runs.
+    """
+
+    def __init__(self, name, maxsize=None, persist=None):
+        """Initialize the memoization cache.
+
+        Parameters
+        ----------
+        name : str
+            Name of the memoized function.
+        maxsize : int | None, default=None
+            Maximum number of cached results, unbounded if None.
+        persist : str | pl.Path | None, default=None
+            Pickle file in which to persist the cache across runs, not
+            persisted if None.
+        """
+
+        self.name = name
+        self.maxsize = maxsize
+        self.data = collections.OrderedDict() if maxsize is not None else {}
+        # Hits, misses and evictions, updated in place by the memoized function
+        self.counts = [0, 0, 0]
+        self._persist = pl.Path(persist) if persist is not None else None
+
+        _memos.add(self)
+
+    def stats(self):
+        """Get the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            Numbers of hits, misses and evictions, and current and maximum size.
+        """
+
+        return {
+            "hits": self.counts[0],
+            "misses": self.counts[1],
+            "evictions": self.counts[2],
+            "size": len(self.data),
+            "maxsize": self.maxsize,
+        }
+
+    def clear(self, reset_stats=False):
+        """Clear the cache.
+
+        Parameters
+        ----------
+        reset_stats : bool, default=False
+            Whether to also reset the counters.
+        """
+
+        self.data.clear()
+        if reset_stats:
+            self.counts[:] = [0, 0, 0]
+
+    def load(self):
+        """Load the persisted cache, if any."""
+
+        if self._persist is None or not os.path.exists(self._persist):
+            return
+
+        try:
+            with open(self._persist, "rb") as file:
+                data = pickle.load(file)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return
+
+        for key, value in data.items():
+            self.data.setdefault(key, value)
+
+    def save(self):
+        """Write the cache to its persistence file, if any."""
+
+        if self._persist is None:
+            return
+
+        os.makedirs(self._persist.parent, exist_ok=True)
+        tmp_path = pl.Path(f"{self._persist}.{os.getpid()}.tmp")
+        with open(tmp_path, "wb") as file:
+            pickle.dump(dict(self.data), file)
+        os.replace(tmp_path, self._persist)
+
+    def __repr__(self):
+        return f"MemoCache({self.name}, {self.stats()})"
+
+
+def memoize(func=None, maxsize=None, key=None, persist=None):
+    """Memoize a function, with optional bounds and persistence.
+
+    Can be used as `@memoize` or `@memoize(maxsize=..., key=...)`. Recursive
+    functions call the memoized function through their module-level name.
+    The cache of the memoized function is available as its `memo` attribute,
+    and `cache_clear` and `stats` are exposed as in `functools.lru_cache`.
+
+    Parameters
+    ----------
+    func : callable | None, default=None
+        Function to memoize, when used without arguments.
+    maxsize : int | None, default=None
+        Maximum number of cached results, unbounded if None.
+    key : callable | None, default=None
+        Function building the cache key from the arguments, the tuple of
+        positional arguments (and sorted keyword arguments) is used if None.
+    persist : str | pl.Path | None, default=None
+        Pickle file in which to persist the cache across runs, not persisted
+        if None. The persisted cache is loaded when the function is decorated,
+        and again when entering a `scope`.
+
+    Returns
+    -------
+    callable
+        Memoized function, or decorator.
+    """
+
+    def decorate(f):
+
+        memo = MemoCache(f"{f.__module__}.{f.__qualname__}", maxsize=maxsize, persist=persist)
+        memo.load()
+        data = memo.data
+        counts = memo.counts
+
+        # The lookups are kept inline, as they run on every call of recursive solvers
+        if maxsize is None:
+            def wrapper(*args, **kwargs):
+                if key is not None:
+                    k = key(*args, **kwargs)
+                else:
+                    k = args + tuple(sorted(kwargs.items())) if kwargs else args
+                try:
+                    value = data[k]
+                except KeyError:
+                    counts[1] += 1
+                    value = data[k] = f(*args, **kwargs)
+                    return value
+                counts[0] += 1
+                return value
+
+        else:
+            def wrapper(*args, **kwargs):
+                if key is not None:
+                    k = key(*args, **kwargs)
+                else:
+                    k = args + tuple(sorted(kwargs.items())) if kwargs else args
+                try:
+                    value = data[k]
+                except KeyError:
+                    counts[1] += 1
+                    value = data[k] = f(*args, **kwargs)
+                    if len(data) > maxsize:
+                        data.popitem(last=False)
+                        counts[2] += 1
+                    return value
+                counts[0] += 1
+                data.move_to_end(k)
+                return value
+
+        functools.update_wrapper(wrapper, f)
+        wrapper.memo = memo
+        wrapper.cache_clear = memo.clear
+        wrapper.stats = memo.stats
+
+        return wrapper
+
+    if func is not None:
+        return decorate(func)
+
+    return decorate
+
+
+@contextlib.contextmanager
+def scope(*funcs, save=False):
+    """Scope memoization caches to a run.
+
+    The caches are cleared when entering and leaving the scope, so that
+    results computed for one input are never reused for another one.
+    Persisted caches are reloaded from their files after being cleared on
+    entry, so that only their persisted entries are reused.
+
+    Parameters
+    ----------
+    *funcs : callable
+        Memoized functions to scope, all memoized functions if none is given.
+    save : bool, default=False
+        Whether to save the persisted caches before clearing them on exit.
+    """
+
+    memos = [f.memo for f in funcs] if funcs else list(_memos)
+
+    for memo in memos:
+        memo.clear()
+        memo.load()
+    try:
+        yield
+    finally:
+        for memo in memos:
+            if save:
+                memo.save()
+            memo.clear()
+
+
+def report():
+    """Get the statistics of all the memoized functions.
+
+    Returns
+    -------
+    str
+        Formatted table of the statistics.
+    """
+
+    lines = [f"{'Function':<40} {'hits':>10} {'misses':>10} {'evictions':>10} {'size':>10} {'hit rate':>9}"]
+    for memo in sorted(_memos, key=lambda m: m.name):
+        s = memo.stats()
+        calls = s["hits"] + s["misses"]
+        rate = f"{100 * s['hits'] / calls:>8.1f}%" if calls > 0 else f"{'-':>9}"
+        lines.append(f"{memo.name:<40} {s['hits']:>10} {s['misses']:>10} {s['evictions']:>10} {s['size']:>10} {rate}")
+
+    return "\n".join(lines)
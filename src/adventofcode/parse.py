@@ -0,0 +1,268 @@
+import re
+import functools
+
+import numpy as np
+
+
+_int_pattern = re.compile(r"-?\d+")
+_uint_pattern = re.compile(r"\d+")
+
+# Texts shorter than this are parsed with a regex, as the vectorized parser
+# has a fixed overhead of a few NumPy calls
+_vectorize_min_size = 4096
+
+# Bounds of the parsed integers, checked in the same way by both parsers
+_int64_info = np.iinfo(np.int64)
+
+# Longest number of digits that always fits in a 64-bit integer, texts with
+# longer numbers are left to the regex parser, which checks the bounds
+_max_digits = 18
+
+_ord_minus = ord("-")
+_ord_zero = ord("0")
+
+
+def _as_bytes(text):
+    if isinstance(text, str):
+        return text.encode()
+    return bytes(text) if isinstance(text, memoryview) else text
+
+
+def _regex_ints(text, negative=True):
+    """Extract all the integers of a text with a regex, checking the 64-bit bounds."""
+
+    if not isinstance(text, str):
+        text = _as_bytes(text).decode()
+    pattern = _int_pattern if negative else _uint_pattern
+
+    values = list(map(int, pattern.findall(text)))
+    if values and (max(values) > _int64_info.max or min(values) < _int64_info.min):
+        raise ValueError(f"Integers outside of [{_int64_info.min}, {_int64_info.max}] do not fit in 64 bits")
+
+    return np.array(values, dtype=np.int64)
+
+
+def ints(text, negative=True):
+    """Extract all the integers of a text.
+
+    Large texts are parsed in a single vectorized pass over their bytes: runs
+    of digits are located, and their values are accumulated digit by digit
+    for all numbers at once. Both parsers accept the same integers, and raise
+    a ValueError for integers that do not fit in 64 bits.
+
+    Parameters
+    ----------
+    text : str | bytes | memoryview
+        Text to parse.
+    negative : bool, default=True
+        Whether a minus sign right before a number makes it negative. Set to
+        False for texts where dashes separate numbers (e.g. "1-5").
+
+    Returns
+    -------
+    np.ndarray
+        Integers of the text, in order, as `int64`.
+    """
+
+    if len(text) < _vectorize_min_size:
+        return _regex_ints(text, negative=negative)
+
+    buf = np.frombuffer(_as_bytes(text), dtype=np.uint8)
+    # Non-digit bytes wrap around to values above 9
+    digits = buf - np.uint8(_ord_zero)
+    is_digit = digits < 10
+
+    edges = np.diff(is_digit.view(np.int8), prepend=np.int8(0), append=np.int8(0))
+    starts = np.flatnonzero(edges == 1)
+    lengths = np.flatnonzero(edges == -1) - starts
+    if len(starts) == 0:
+        return np.zeros(0, dtype=np.int64)
+
+    max_length = int(lengths.max())
+    if max_length > _max_digits:
+        return _regex_ints(text, negative=negative)
+
+    # Horner's scheme over the digit positions, numbers shorter than k are left unchanged
+    values = np.zeros(len(starts), dtype=np.int64)
+    for k in range(max_length):
+        values = np.where(lengths > k, values * 10 + digits[np.minimum(starts + k, len(buf) - 1)], values)
+
+    if negative:
+        # The first byte is a digit if a number starts there, so that it is never a sign
+        neg = buf[np.maximum(starts - 1, 0)] == _ord_minus
+        values[neg] = -values[neg]
+
+    return values
+
+
+def int_rows(text, ncols, negative=True):
+    """Extract the integers of a text as rows of a fixed number of columns.
+
+    Parameters
+    ----------
+    text : str | bytes | memoryview
+        Text to parse, e.g. one record per line.
+    ncols : int
+        Number of integers per row.
+    negative : bool, default=True
+        Whether a minus sign right before a number makes it negative.
+
+    Returns
+    -------
+    np.ndarray
+        Integers of the text, as an `int64` array of shape (rows, ncols).
+    """
+
+    values = ints(text, negative=negative)
+    if values.size % ncols != 0:
+        raise ValueError(f"Cannot split {values.size} integers in rows of {ncols}")
+
+    return values.reshape(-1, ncols)
+
+
+def _parse_ints(txt):
+    return list(map(int, txt.replace(",", " ").split()))
+
+
+def _call(func, arg):
+    return func(arg)
+
+
+class LineTemplate:
+    """Declarative parser of lines following a template.
+
+    Templates are literal text with typed fields, e.g. "p={int},{int} v={int},{int}"
+    or "{int}: {ints}". The fields are:
+
+    - `{int}`: an integer, possibly negative.
+    - `{ints}`: integers separated by spaces or commas, as a list.
+    - `{word}`: a run of letters, digits and underscores.
+    - `{char}`: a single character.
+    - `{str}`: any text, as short as possible.
+
+    All the lines of a text are matched at once by a single compiled regex.
+    """
+
+    fields = {
+        "int": (r"(-?\d+)", int),
+        "ints": (r"(-?\d+(?:[ ,]+-?\d+)*)", _parse_ints),
+        "word": (r"(\w+)", str),
+        "char": (r"(.)", str),
+        "str": (r"(.*?)", str),
+    }
+
+    _field_pattern = re.compile(r"\{(\w+)\}")
+
+    def __init__(self, template):
+        """Initialize the template.
+
+        Parameters
+        ----------
+        template : str
+            Template of a line.
+        """
+
+        self.template = template
+
+        parts = []
+        self._converters = []
+        last = 0
+        for match in self._field_pattern.finditer(template):
+            if match.group(1) not in self.fields:
+                raise ValueError(f"Unknown field {match.group(0)} in template {template!r}")
+            pattern, converter = self.fields[match.group(1)]
+            parts.append(re.escape(template[last:match.start()]))
+            parts.append(pattern)
+            self._converters.append(converter)
+            last = match.end()
+        parts.append(re.escape(template[last:]))
+
+        self._line_pattern = re.compile("".join(parts))
+        self._text_pattern = re.compile(f"^{''.join(parts)}$", re.MULTILINE)
+
+    def _convert(self, groups):
+        # Matches of templates with a single field are not tuples
+        if isinstance(groups, str):
+            return (self._converters[0](groups),)
+        return tuple(map(_call, self._converters, groups))
+
+    def parse_line(self, line):
+        """Parse one line.
+
+        Parameters
+        ----------
+        line : str
+            Line to parse.
+
+        Returns
+        -------
+        tuple
+            Values of the fields.
+        """
+
+        match = self._line_pattern.fullmatch(line)
+        if match is None:
+            raise ValueError(f"Line does not match the template {self.template!r}: {line!r}")
+
+        return self._convert(match.groups())
+
+    def parse(self, text):
+        """Parse all the lines of a text.
+
+        Parameters
+        ----------
+        text : str
+            Lines to parse, without trailing line break.
+
+        Returns
+        -------
+        list[tuple]
+            Values of the fields of each line.
+        """
+
+        matches = self._text_pattern.findall(text)
+
+        if len(matches) != text.count("\n") + 1:
+            # Find the first line that does not match, to report it
+            for line in text.split("\n"):
+                self.parse_line(line)
+            raise ValueError(f"Text does not match the template {self.template!r} line by line")
+
+        return [self._convert(groups) for groups in matches]
+
+
+@functools.lru_cache(maxsize=64)
+def template(fmt):
+    """Get the compiled parser of a line template.
+
+    Parameters
+    ----------
+    fmt : str
+        Template of a line, see `LineTemplate`.
+
+    Returns
+    -------
+    LineTemplate
+        Parser of the template, compiled once per template.
+    """
+
+    return LineTemplate(fmt)
+
+
+def parse_lines(fmt, text):
+    """Parse all the lines of a text following a template.
+
+    Parameters
+    ----------
+    fmt : str
+        Template of a line, see `LineTemplate`.
+    text : str
+        Lines to parse, without trailing line break.
+
+    Returns
+    -------
+    list[tuple]
+        Values of the fields of each line.
+    """
+
+    return template(fmt).parse(text)
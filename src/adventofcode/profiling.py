@@ -0,0 +1,281 @@
+import io
+import sys
+import time
+import pstats
+import cProfile
+import argparse
+import threading
+import tracemalloc
+import collections
+import pathlib as pl
+
+from .registry import find_level
+from .runner import discover_solutions, load_solution
+from .utils import parse_days
+
+
+profile_dir_name = ".aoc_profile"
+
+
+class StackSampler:
+    """Sampler of the call stacks of a thread.
+
+    The stacks are sampled from a background thread at regular intervals, and
+    aggregated in the collapsed format used by flamegraph tools.
+    """
+
+    def __init__(self, thread_id, interval=0.001):
+        """Initialize the stack sampler.
+
+        Parameters
+        ----------
+        thread_id : int
+            Identifier of the thread to sample.
+        interval : float, default=0.001
+            Sampling interval in seconds.
+        """
+
+        self._thread_id = thread_id
+        self._interval = interval
+        self._stacks = collections.Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+
+        while not self._stop.is_set():
+            frame = sys._current_frames().get(self._thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({pl.Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self._stacks[";".join(reversed(stack))] += 1
+            time.sleep(self._interval)
+
+    def start(self):
+        """Start sampling."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop sampling."""
+        self._stop.set()
+        self._thread.join()
+
+    def write_collapsed(self, path):
+        """Write the sampled stacks in collapsed format.
+
+        Parameters
+        ----------
+        path : str | pl.Path
+            Output file.
+        """
+
+        with open(path, "w") as file:
+            for stack, count in self._stacks.most_common():
+                file.write(f"{stack} {count}\n")
+
+
+class PeakTracker:
+    """Tracker of the allocation sites at the peak of traced memory.
+
+    A background thread polls the traced memory, and takes a tracemalloc
+    snapshot every time a new peak is reached.
+    """
+
+    def __init__(self, interval=0.01, growth=1.05):
+        """Initialize the peak tracker.
+
+        Parameters
+        ----------
+        interval : float, default=0.01
+            Polling interval in seconds.
+        growth : float, default=1.05
+            Relative growth of the traced memory triggering a new snapshot.
+        """
+
+        self._interval = interval
+        self._growth = growth
+        self.peak = 0
+        self.snapshot = None
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+
+        while not self._stop.is_set():
+            current, _ = tracemalloc.get_traced_memory()
+            if current > self.peak * self._growth:
+                self.peak = current
+                self.snapshot = tracemalloc.take_snapshot()
+            time.sleep(self._interval)
+
+    def start(self):
+        """Start tracking."""
+        self._thread.start()
+
+    def stop(self):
+        """Stop tracking."""
+        self._stop.set()
+        self._thread.join()
+
+
+def profile_cpu(func, output_prefix, top=20):
+    """Run a function under cProfile and a stack sampler.
+
+    Parameters
+    ----------
+    func : callable
+        Function to profile.
+    output_prefix : str | pl.Path
+        Prefix of the output files, to which `.pstats` and `.collapsed` are appended.
+    top : int, default=20
+        Number of hotspots in the report.
+
+    Returns
+    -------
+    any
+        Return value of the function.
+    str
+        Report of the hotspots.
+    """
+
+    sampler = StackSampler(threading.get_ident())
+    profiler = cProfile.Profile()
+
+    sampler.start()
+    profiler.enable()
+    try:
+        result = func()
+    finally:
+        profiler.disable()
+        sampler.stop()
+
+    profiler.dump_stats(f"{output_prefix}.pstats")
+    sampler.write_collapsed(f"{output_prefix}.collapsed")
+
+    report = io.StringIO()
+    stats = pstats.Stats(profiler, stream=report)
+    stats.sort_stats("cumulative").print_stats(top)
+    stats.sort_stats("tottime").print_stats(top)
+
+    return result, report.getvalue()
+
+
+def profile_mem(func, output_prefix, top=10):
+    """Run a function under tracemalloc.
+
+    Parameters
+    ----------
+    func : callable
+        Function to profile.
+    output_prefix : str | pl.Path
+        Prefix of the output file, to which `.tracemalloc` is appended.
+    top : int, default=10
+        Number of allocation sites in the report.
+
+    Returns
+    -------
+    any
+        Return value of the function.
+    str
+        Report of the peak memory and allocation sites.
+    """
+
+    tracemalloc.start(25)
+    tracker = PeakTracker()
+    tracker.start()
+    try:
+        result = func()
+        current, peak = tracemalloc.get_traced_memory()
+        final_snapshot = tracemalloc.take_snapshot()
+    finally:
+        tracker.stop()
+        tracemalloc.stop()
+
+    snapshot = tracker.snapshot if tracker.peak > current else final_snapshot
+    # Hide the allocations of the profiler itself
+    snapshot = snapshot.filter_traces([
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, threading.__file__),
+        tracemalloc.Filter(False, __file__),
+    ])
+    snapshot.dump(f"{output_prefix}.tracemalloc")
+
+    lines = [f"Peak traced memory: {peak / 1024 ** 2:.3f} MiB", "", "Top allocation sites at peak:"]
+    stats = snapshot.statistics("lineno")
+    for stat in stats[:top]:
+        lines.append(f"  {stat}")
+
+    if stats:
+        lines.extend(["", "Peak allocation site traceback:"])
+        lines.extend([f"  {line}" for line in stats[0].traceback.format()])
+
+    return result, "\n".join(lines)
+
+
+def profile_level(func, mode, root_dir, level, top=20):
+    """Profile a level of a solution and write the profiles to the challenge directory.
+
+    Parameters
+    ----------
+    func : callable
+        Function solving the level.
+    mode : str
+        Profiling mode, either "cpu" or "mem".
+    root_dir : str | pl.Path
+        Challenge directory, the profiles are stored in its `.aoc_profile` subdirectory.
+    level : int
+        Level of the challenge.
+    top : int, default=20
+        Number of entries in the report.
+
+    Returns
+    -------
+    any
+        Return value of the function.
+    str
+        Profiling report.
+    """
+
+    out_dir = pl.Path(root_dir, profile_dir_name)
+    out_dir.mkdir(exist_ok=True)
+    output_prefix = pl.Path(out_dir, f"level_{level}_{mode}")
+
+    if mode == "cpu":
+        return profile_cpu(func, output_prefix, top=top)
+    if mode == "mem":
+        return profile_mem(func, output_prefix, top=top)
+
+    raise ValueError(f"Unknown profiling mode: {mode}")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.profiling",
+        description="Profiles the CPU time or memory of Advent of Code solutions.",
+    )
+
+    parser.add_argument("-r", "--root", type=str, default=".", help="root directory of the challenges")
+    parser.add_argument("-y", "--year", type=int, nargs="+", help="requested year(s)")
+    parser.add_argument("-d", "--day", type=str, help="requested day, or list/range of days (e.g. 1,3,5-9)")
+    parser.add_argument("-l", "--level", type=int, nargs="+", default=[1, 2], help="requested level(s)")
+    parser.add_argument("-p", "--profile", choices=["cpu", "mem"], default="cpu", help="profiling mode")
+    parser.add_argument("-n", "--top", type=int, default=20, help="number of entries in the report")
+
+    args = parser.parse_args()
+
+    days = parse_days(args.day) if args.day is not None else None
+
+    for year, day, path in discover_solutions(args.root, years=args.year, days=days):
+        for level in args.level:
+            module = load_solution(path)
+            solve = find_level(module, level)
+
+            print(f"=== {year} day {day} level {level} ({args.profile}) ===")
+            answer, report = profile_level(solve, args.profile, path.parent, level, top=args.top)
+            print(report)
+            print(f"Answer: {answer}")
+            print(f"Profiles written to {pl.Path(path.parent, profile_dir_name)}")
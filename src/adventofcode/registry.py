@@ -0,0 +1,294 @@
+import os
+import re
+import json
+import pathlib as pl
+
+
+def solution(year, day, level):
+    """Register a function as the solution of a level.
+
+    The decorated function is left unchanged, and is given an `aoc_solution`
+    attribute holding its (year, day, level).
+
+    Parameters
+    ----------
+    year : int
+        Year of the challenge.
+    day : int
+        Day of the challenge.
+    level : int
+        Level solved by the function.
+
+    Returns
+    -------
+    callable
+        Decorator registering the solution.
+    """
+
+    def register(func):
+        func.aoc_solution = (year, day, level)
+        return func
+
+    return register
+
+
+def find_level(module, level):
+    """Find the function solving a level in a solution module.
+
+    Functions registered with the `solution` decorator are looked up first,
+    then the `solve_level_<level>` function.
+
+    Parameters
+    ----------
+    module : module
+        Solution module.
+    level : int
+        Level of the challenge.
+
+    Returns
+    -------
+    callable
+        Solution function.
+    """
+
+    for value in vars(module).values():
+        key = getattr(value, "aoc_solution", None)
+        if callable(value) and isinstance(key, tuple) and key[2] == level:
+            return value
+
+    return getattr(module, f"solve_level_{level}")
+
+
+# Decorators of the form `@aoc.solution(2024, 1, 1)` or `@solution(2024, 1, 1)`
+_decorator_pattern = re.compile(
+    rb"^@(?:\w+\.)?solution\(\s*(\d+)\s*,\s*(\d+)\s*,\s*(\d+)\s*\)\s*\n(?:@.*\n)*def\s+(\w+)", re.MULTILINE
+)
+_level_pattern = re.compile(rb"^def\s+solve_level_(\d+)\s*\(", re.MULTILINE)
+_day_pattern = re.compile(r"^day_(\d+)$")
+
+
+def scan_file(path):
+    """Find the solutions defined in a file, without importing it.
+
+    Solutions are found from their `solution` decorators. Files located at
+    `<year>/day_<day>/solution.py` without decorators fall back to their
+    `solve_level_<level>` functions.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the file.
+
+    Returns
+    -------
+    list[list]
+        Year, day, level and function name of each solution.
+    """
+
+    path = pl.Path(path)
+    with open(path, "rb") as file:
+        content = file.read()
+
+    found = [[int(y), int(d), int(lvl), name.decode()] for y, d, lvl, name in _decorator_pattern.findall(content)]
+    if found:
+        return found
+
+    match = _day_pattern.match(path.parent.name)
+    if path.name != "solution.py" or match is None or not path.parent.parent.name.isdigit():
+        return []
+
+    year, day = int(path.parent.parent.name), int(match.group(1))
+    return [[year, day, int(lvl), f"solve_level_{int(lvl)}"] for lvl in _level_pattern.findall(content)]
+
+
+def scan_year_day(path):
+    """Find the year and day of the solutions defined in a file, without importing it.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the file.
+
+    Returns
+    -------
+    int
+        Year of the challenge.
+    int
+        Day of the challenge.
+    """
+
+    found = {(year, day) for year, day, _, _ in scan_file(path)}
+    if len(found) != 1:
+        raise ValueError(f"Expected the solutions of a single day in {path}, found {len(found)} days")
+
+    return found.pop()
+
+
+class SolutionIndex:
+    """Index of the solutions available under a root directory.
+
+    The index is stored as a JSON file in the root directory. Files are only
+    scanned again when their modification time or size changes, so that
+    listing solutions neither imports nor reads the unchanged ones.
+    """
+
+    file_name = ".aoc_index.json"
+    version = 1
+    ignored_dirs = {".git", "__pycache__", ".aoc_cache", ".aoc_profile"}
+
+    def __init__(self, root):
+        """Initialize the solution index.
+
+        Parameters
+        ----------
+        root : str | pl.Path
+            Root directory of the challenges.
+        """
+
+        self._root = pl.Path(root)
+        self._path = pl.Path(self._root, self.file_name)
+        self._files = self._load()
+
+    def _load(self):
+        """Load the index from disk.
+
+        Returns
+        -------
+        dict
+            Modification time, size and solutions of each file, indexed by relative path.
+        """
+
+        if not os.path.exists(self._path):
+            return {}
+
+        try:
+            with open(self._path, "r") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+        if data.get("version") != self.version:
+            return {}
+
+        return data.get("files", {})
+
+    def _save(self):
+        """Write the index to disk atomically."""
+
+        tmp_path = pl.Path(f"{self._path}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as file:
+            json.dump({"version": self.version, "files": self._files}, file, indent=2)
+        os.replace(tmp_path, self._path)
+
+    def _iter_files(self):
+        """Iterate over the Python files under the root directory."""
+
+        for dir_path, dir_names, file_names in os.walk(self._root):
+            dir_names[:] = sorted([d for d in dir_names if d not in self.ignored_dirs and not d.startswith(".")])
+            for file_name in file_names:
+                if file_name.endswith(".py"):
+                    yield pl.Path(dir_path, file_name)
+
+    def refresh(self):
+        """Scan the new and modified files, and forget the deleted ones.
+
+        Returns
+        -------
+        bool
+            Whether the index changed.
+        """
+
+        files = {}
+        changed = False
+        for path in self._iter_files():
+            rel_path = path.relative_to(self._root).as_posix()
+            stat = path.stat()
+            entry = self._files.get(rel_path)
+            if entry is None or entry["mtime_ns"] != stat.st_mtime_ns or entry["size"] != stat.st_size:
+                entry = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "solutions": scan_file(path)}
+                changed = True
+            files[rel_path] = entry
+
+        changed = changed or files.keys() != self._files.keys()
+        self._files = files
+        if changed:
+            self._save()
+
+        return changed
+
+    def solutions(self, years=None, days=None):
+        """List the indexed solutions.
+
+        Parameters
+        ----------
+        years : list[int] | None, default=None
+            Years to select, all years if None.
+        days : list[int] | None, default=None
+            Days to select, all days if None.
+
+        Returns
+        -------
+        list[tuple[int, int, int, pl.Path, str]]
+            Year, day, level, path and function name of each solution,
+            sorted by year, day and level.
+        """
+
+        found = []
+        for rel_path, entry in self._files.items():
+            for year, day, level, name in entry["solutions"]:
+                if years is not None and year not in years:
+                    continue
+                if days is not None and day not in days:
+                    continue
+                found.append((year, day, level, pl.Path(self._root, rel_path), name))
+
+        return sorted(found)
+
+
+def load_index(root, refresh=True):
+    """Load the solution index of a root directory.
+
+    Parameters
+    ----------
+    root : str | pl.Path
+        Root directory of the challenges.
+    refresh : bool, default=True
+        Whether to scan the new and modified files first.
+
+    Returns
+    -------
+    SolutionIndex
+        Solution index.
+    """
+
+    index = SolutionIndex(root)
+    if refresh:
+        index.refresh()
+
+    return index
+
+
+if __name__ == "__main__":
+
+    # Solutions import this module, the command line tools are only needed here
+    import argparse
+
+    from .utils import parse_days
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.registry",
+        description="Builds the index of the Advent of Code solutions and lists them.",
+    )
+
+    parser.add_argument("-r", "--root", type=str, default=".", help="root directory of the challenges")
+    parser.add_argument("-y", "--year", type=int, nargs="+", help="requested year(s)")
+    parser.add_argument("-d", "--day", type=str, help="requested day, or list/range of days (e.g. 1,3,5-9)")
+
+    args = parser.parse_args()
+
+    days = parse_days(args.day) if args.day is not None else None
+    index = load_index(args.root)
+
+    print(f"{'Year':>6} {'Day':>4} {'Level':>6}  Solution")
+    for year, day, level, path, name in index.solutions(years=args.year, days=days):
+        print(f"{year:>6} {day:>4} {level:>6}  {path}:{name}")
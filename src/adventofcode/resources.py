@@ -0,0 +1,253 @@
+import gc
+import os
+import sys
+import time
+import argparse
+import datetime as dt
+import contextlib
+import tracemalloc
+import concurrent.futures as cf
+
+from .bench import BenchmarkHistory, get_commit
+from .io import clear_memo
+from .registry import find_level
+from .runner import discover_solutions, load_solution
+from .utils import parse_days
+from .worker import preload
+
+try:
+    import resource
+except ImportError:
+    # The resource module is only available on POSIX systems
+    resource = None
+
+
+class ResourceHistory(BenchmarkHistory):
+    """Versioned history of the resource usage of a challenge.
+
+    The history is stored as a JSON file in the challenge directory. Each entry
+    records the resource usage of one level along with the commit it was run at.
+    """
+
+    file_name = ".aoc_resources.json"
+    version = 1
+
+
+def _max_rss():
+    """Get the peak resident set size of the current process, in bytes."""
+
+    if resource is None:
+        return None
+
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def measure_level(path, level, trace=True, quiet=True):
+    """Measure the resources used by one level of a solution.
+
+    The level is meant to be run in a fresh process, as the peak resident set
+    size of a process cannot be reset. The growth of the peak over the memory
+    used before the run is reported. The modules preloaded by the worker are
+    imported first, so that their import is not accounted to the level. When
+    tracing, the level is run a second time under tracemalloc, so that the
+    tracing overhead does not affect the measured times.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    level : int
+        Level to run.
+    trace : bool, default=True
+        Whether to also measure the Python allocations with tracemalloc.
+    quiet : bool, default=True
+        Whether to silence the output of the solution.
+
+    Returns
+    -------
+    dict
+        Answer, wall time, user and system CPU times, peak memory growth,
+        allocated blocks and garbage collections of the level.
+    """
+
+    with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+        if quiet:
+            stack.enter_context(contextlib.redirect_stdout(devnull))
+            stack.enter_context(contextlib.redirect_stderr(devnull))
+
+        preload()
+        module = load_solution(path)
+        solve = find_level(module, level)
+
+        gc.collect()
+        rss_start = _max_rss()
+        blocks_start = sys.getallocatedblocks()
+        gc_start = sum([s["collections"] for s in gc.get_stats()])
+        cpu_start = os.times()
+
+        start = time.perf_counter()
+        answer = solve()
+        stop = time.perf_counter()
+
+        cpu_stop = os.times()
+        gc_stop = sum([s["collections"] for s in gc.get_stats()])
+        blocks_stop = sys.getallocatedblocks()
+        rss_stop = _max_rss()
+
+        run = {
+            "level": level,
+            "answer": str(answer),
+            "wall": stop - start,
+            "user": cpu_stop.user - cpu_start.user,
+            "sys": cpu_stop.system - cpu_start.system,
+            "peak_rss": rss_stop - rss_start if rss_start is not None else None,
+            "retained_blocks": blocks_stop - blocks_start,
+            "gc_collections": gc_stop - gc_start,
+            "traced_peak": None,
+        }
+
+        if trace:
+            # Memoized inputs and module state must not hide the allocations of the second run
+            clear_memo()
+            module = load_solution(path)
+            solve = find_level(module, level)
+            gc.collect()
+            tracemalloc.start()
+            try:
+                solve()
+                _, run["traced_peak"] = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+    return run
+
+
+def measure_solutions(solutions, levels=(1, 2), trace=True, max_workers=1):
+    """Measure the resources used by solutions, each level in a fresh process.
+
+    Parameters
+    ----------
+    solutions : list[tuple[int, int, pl.Path]]
+        Year, day and path of each solution.
+    levels : tuple[int], default=(1, 2)
+        Levels to run.
+    trace : bool, default=True
+        Whether to also measure the Python allocations with tracemalloc.
+    max_workers : int, default=1
+        Number of processes, more than one makes the measured times noisier.
+
+    Returns
+    -------
+    list[dict]
+        Resource usage of each level, sorted by year, day and level. Failed
+        levels have an `error` entry.
+    """
+
+    results = []
+    with cf.ProcessPoolExecutor(max_workers=max_workers, max_tasks_per_child=1) as executor:
+        futures = {}
+        for year, day, path in solutions:
+            for level in levels:
+                futures[executor.submit(measure_level, path, level, trace=trace)] = (year, day, path, level)
+
+        for future in cf.as_completed(futures):
+            year, day, path, level = futures[future]
+            try:
+                run = future.result()
+                run["error"] = None
+            except Exception as err:
+                run = {"level": level, "error": repr(err)}
+            run.update({"year": year, "day": day, "path": path})
+            results.append(run)
+
+    return sorted(results, key=lambda r: (r["year"], r["day"], r["level"]))
+
+
+def check_memory_regression(run, previous, threshold=0.2):
+    """Check whether a run uses more memory than a previous one.
+
+    Parameters
+    ----------
+    run : dict
+        Current resource usage.
+    previous : dict | None
+        Previous resource usage.
+    threshold : float, default=0.2
+        Relative increase of the peak memory considered as a regression.
+
+    Returns
+    -------
+    str | None
+        Description of the regression, None if there is none.
+    """
+
+    if previous is None:
+        return None
+
+    for key in ["traced_peak", "peak_rss"]:
+        old, new = previous.get(key), run.get(key)
+        # Increases of less than a megabyte are noise
+        if old is not None and new is not None and new > old * (1. + threshold) and new - old > 2 ** 20:
+            return f"{key} +{100 * (new / max(old, 1) - 1.):.0f}% vs {previous['commit']}"
+
+    return None
+
+
+def _mb(value):
+    return f"{value / 2 ** 20:>10.2f}" if value is not None else f"{'-':>10}"
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.resources",
+        description="Measures the time, CPU and memory used by Advent of Code solutions and records their history.",
+    )
+
+    parser.add_argument("-r", "--root", type=str, default=".", help="root directory of the challenges")
+    parser.add_argument("-y", "--year", type=int, nargs="+", help="requested year(s)")
+    parser.add_argument("-d", "--day", type=str, help="requested day, or list/range of days (e.g. 1,3,5-9)")
+    parser.add_argument("-l", "--level", type=int, nargs="+", default=[1, 2], help="requested level(s)")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="number of processes")
+    parser.add_argument("--no-trace", action="store_true", help="do not measure allocations with tracemalloc")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative memory increase flagged as regression")
+    parser.add_argument("--no-save", action="store_true", help="do not record the results in the history")
+
+    args = parser.parse_args()
+
+    days = parse_days(args.day) if args.day is not None else None
+    solutions = discover_solutions(args.root, years=args.year, days=days)
+    results = measure_solutions(solutions, levels=args.level, trace=not args.no_trace, max_workers=args.workers)
+
+    print(f"{'Year':>6} {'Day':>4} {'Level':>6} {'wall (s)':>11} {'user (s)':>11} {'sys (s)':>11}"
+          f" {'RSS (MB)':>10} {'alloc (MB)':>10} {'blocks':>9} {'GCs':>6}")
+
+    histories = {}
+    for run in results:
+        year, day, path = run.pop("year"), run.pop("day"), run.pop("path")
+        if run["error"] is not None:
+            print(f"{year:>6} {day:>4} {run['level']:>6}  ERROR: {run['error']}")
+            continue
+
+        run.pop("error")
+        run["commit"] = get_commit(path)
+        run["date"] = dt.datetime.now().isoformat(timespec="seconds")
+
+        if path.parent not in histories:
+            histories[path.parent] = ResourceHistory(path.parent)
+        history = histories[path.parent]
+
+        line = (f"{year:>6} {day:>4} {run['level']:>6} {run['wall']:>11.4e} {run['user']:>11.4e} {run['sys']:>11.4e}"
+                f" {_mb(run['peak_rss'])} {_mb(run['traced_peak'])} {run['retained_blocks']:>9}"
+                f" {run['gc_collections']:>6}")
+
+        regression = check_memory_regression(run, history.get_previous(run["level"], run["commit"]),
+                                             threshold=args.threshold)
+        if regression is not None:
+            line += f"  MEMORY REGRESSION: {regression}"
+        print(line)
+
+        if not args.no_save:
+            history.add(run)
@@ -0,0 +1,222 @@
+import os
+import re
+import sys
+import json
+import hashlib
+import pathlib as pl
+import importlib.metadata
+
+from .io import file_digest
+
+
+results_dir_name = pl.Path(".aoc_cache", "results")
+
+# Dependencies of the package, used if the package is not installed
+default_dependencies = ["numpy", "requests", "setuptools"]
+
+# Hashes of the package sources and environment, computed once per process
+_package_digest = []
+_environment_digest = []
+
+
+def package_digest():
+    """Get the hash of the sources of the adventofcode package.
+
+    Solutions depend on the package, so that a change of any of its modules
+    invalidates the cached results.
+
+    Returns
+    -------
+    str
+        Hexadecimal BLAKE2 hash of the package sources.
+    """
+
+    if not _package_digest:
+        h = hashlib.blake2b(digest_size=16)
+        for path in sorted(pl.Path(__file__).parent.glob("*.py")):
+            h.update(path.name.encode())
+            h.update(path.read_bytes())
+        _package_digest.append(h.hexdigest())
+
+    return _package_digest[0]
+
+
+def dependency_versions():
+    """Get the installed versions of the dependencies of the package.
+
+    Returns
+    -------
+    dict[str, str | None]
+        Version of each dependency, None if it is not installed.
+    """
+
+    try:
+        requirements = importlib.metadata.requires("adventofcode") or []
+        names = [re.match(r"[A-Za-z0-9_.-]+", req).group() for req in requirements if "extra ==" not in req]
+    except importlib.metadata.PackageNotFoundError:
+        names = default_dependencies
+
+    versions = {}
+    for name in sorted(names):
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+
+    return versions
+
+
+def environment_digest():
+    """Get the hash of the Python version and of the dependency versions.
+
+    Answers and run times may change with the interpreter or the libraries, so
+    that upgrading either of them invalidates the cached results.
+
+    Returns
+    -------
+    str
+        Hexadecimal BLAKE2 hash of the environment.
+    """
+
+    if not _environment_digest:
+        h = hashlib.blake2b(digest_size=16)
+        h.update(sys.version.encode())
+        h.update(json.dumps(dependency_versions(), sort_keys=True).encode())
+        _environment_digest.append(h.hexdigest())
+
+    return _environment_digest[0]
+
+
+def result_key(path, level):
+    """Get the key of the result of a level.
+
+    The key depends on the source of the solution module, the sources of the
+    adventofcode package, the Python and dependency versions, the input file
+    next to the solution, and the level.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    level : int
+        Level of the challenge.
+
+    Returns
+    -------
+    str | None
+        Hexadecimal key, or None if the solution has no input file.
+    """
+
+    input_path = pl.Path(pl.Path(path).parent, "input.txt")
+    if not input_path.exists():
+        return None
+
+    h = hashlib.blake2b(digest_size=20)
+    h.update(pl.Path(path).read_bytes())
+    h.update(package_digest().encode())
+    h.update(environment_digest().encode())
+    h.update(file_digest(input_path).encode())
+    h.update(str(level).encode())
+
+    return h.hexdigest()
+
+
+class ResultCache:
+    """Content-addressed on-disk cache of solution results.
+
+    Each result is stored as a JSON file named after its key. The cache holds
+    at most `max_entries` results, the least recently used ones being evicted
+    first. Recency is tracked with the modification time of the files.
+    """
+
+    def __init__(self, cache_dir, max_entries=1024):
+        """Initialize the result cache.
+
+        Parameters
+        ----------
+        cache_dir : str | pl.Path
+            Directory to store the results in.
+        max_entries : int, default=1024
+            Maximum number of results kept in the cache.
+        """
+
+        self._cache_dir = pl.Path(cache_dir)
+        self.max_entries = max_entries
+        # The size limit may have been lowered since the cache was filled
+        self.evict()
+
+    def _entry_path(self, key):
+        return pl.Path(self._cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Get a cached result and mark it as recently used.
+
+        Parameters
+        ----------
+        key : str
+            Key of the result.
+
+        Returns
+        -------
+        dict | None
+            Cached result, or None if not cached.
+        """
+
+        path = self._entry_path(key)
+        try:
+            with open(path, "r") as file:
+                result = json.load(file)
+            os.utime(path)
+        except (OSError, ValueError):
+            return None
+
+        return result
+
+    def set(self, key, result):
+        """Store a result and evict the least recently used ones if needed.
+
+        Parameters
+        ----------
+        key : str
+            Key of the result.
+        result : dict
+            JSON-serializable result.
+        """
+
+        os.makedirs(self._cache_dir, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = pl.Path(f"{path}.{os.getpid()}.tmp")
+        with open(tmp_path, "w") as file:
+            json.dump(result, file)
+        os.replace(tmp_path, path)
+
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used results beyond the size limit."""
+
+        entries = []
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                entries.append((path.stat().st_mtime_ns, path))
+            except OSError:
+                continue
+
+        if len(entries) <= self.max_entries:
+            return
+
+        entries.sort()
+        for _, path in entries[:len(entries) - self.max_entries]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def clear(self):
+        """Remove all the cached results."""
+
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                os.remove(path)
+            except OSError:
+                pass
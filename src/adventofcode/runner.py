@@ -0,0 +1,334 @@
+import os
+import time
+import shutil
+import argparse
+import tempfile
+import contextlib
+import importlib.util
+import pathlib as pl
+import concurrent.futures as cf
+
+from .registry import find_level, load_index
+from .results import ResultCache, result_key, results_dir_name
+from .utils import parse_days
+
+
+def discover_solutions(root, years=None, days=None):
+    """Discover the solution modules under a root directory.
+
+    Solutions are listed from the solution index of the root directory, which
+    only scans the files modified since the last discovery.
+
+    Parameters
+    ----------
+    root : str | pl.Path
+        Root directory of the challenges.
+    years : list[int] | None, default=None
+        Years to select, all years if None.
+    days : list[int] | None, default=None
+        Days to select, all days if None.
+
+    Returns
+    -------
+    list[tuple[int, int, pl.Path]]
+        Year, day and path of each solution, sorted by year and day.
+    """
+
+    solutions = set()
+    for year, day, _, path, _ in load_index(root).solutions(years=years, days=days):
+        solutions.add((year, day, path))
+
+    return sorted(solutions)
+
+
+def load_solution(path):
+    """Import a solution module from its path.
+
+    The module is executed as a regular module, so that its `__main__`
+    block, which connects to the AOC website, is not run.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+
+    Returns
+    -------
+    module
+        Solution module.
+    """
+
+    path = pl.Path(path).resolve()
+    name = f"aoc_solution_{path.parent.parent.name}_{path.parent.name}"
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    return module
+
+
+def _solve_level(path, level, quiet=True):
+    """Run one level of a solution in the current process.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    level : int
+        Level to run.
+    quiet : bool, default=True
+        Whether to silence the output of the solution.
+
+    Returns
+    -------
+    dict
+        Answer, run time and error (if any) of the level.
+    """
+
+    result = {"path": str(path), "level": level, "answer": None, "time": None, "error": None}
+
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.ExitStack() as stack:
+            if quiet:
+                stack.enter_context(contextlib.redirect_stdout(devnull))
+                stack.enter_context(contextlib.redirect_stderr(devnull))
+
+            module = load_solution(path)
+            solve = find_level(module, level)
+
+            start = time.perf_counter()
+            answer = solve()
+            stop = time.perf_counter()
+
+        result["answer"] = str(answer)
+        result["time"] = stop - start
+
+    except Exception as err:
+        result["error"] = repr(err)
+
+    return result
+
+
+def _stop_workers(executor, grace=1.):
+    """Stop the processes of an executor, killing those that do not terminate.
+
+    Parameters
+    ----------
+    executor : cf.ProcessPoolExecutor
+        Executor whose processes are stopped.
+    grace : float, default=1.
+        Time left to the processes to terminate before being killed (s).
+    """
+
+    processes = list((executor._processes or {}).values())
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        process.join(grace)
+        if process.is_alive():
+            process.kill()
+            process.join()
+
+
+def run_level(path, level, timeout=None, quiet=True):
+    """Run one level of a solution.
+
+    With a time limit, the level runs in a child process that is terminated,
+    or killed, by the parent once the limit is exceeded, so that solutions
+    catching every exception or stuck in compiled code are stopped as well.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    level : int
+        Level to run.
+    timeout : float | None, default=None
+        Time limit in seconds, no limit if None.
+    quiet : bool, default=True
+        Whether to silence the output of the solution.
+
+    Returns
+    -------
+    dict
+        Answer, run time and error (if any) of the level.
+    """
+
+    if timeout is None:
+        return _solve_level(path, level, quiet=quiet)
+
+    executor = cf.ProcessPoolExecutor(max_workers=1)
+    try:
+        future = executor.submit(_solve_level, path, level, quiet=quiet)
+        try:
+            return future.result(timeout=timeout)
+        except cf.TimeoutError:
+            _stop_workers(executor)
+            return {"path": str(path), "level": level, "answer": None, "time": None,
+                    "error": f"timeout ({timeout:.0f} s)"}
+        except cf.process.BrokenProcessPool as err:
+            return {"path": str(path), "level": level, "answer": None, "time": None, "error": repr(err)}
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run_with_input(path, year, day, level, txt, timeout=None):
+    """Run one level of a solution on another input than its own.
+
+    Solutions read the `input.txt` file next to them, so that the solution is
+    copied to a temporary challenge directory along with the input, and the
+    real input is left untouched.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    year : int
+        Year of the challenge.
+    day : int
+        Day of the challenge.
+    level : int
+        Level to run.
+    txt : str
+        Input of the level.
+    timeout : float | None, default=None
+        Time limit in seconds, no limit if None.
+
+    Returns
+    -------
+    dict
+        Answer, run time and error (if any) of the level.
+    """
+
+    tmp_dir = tempfile.mkdtemp(prefix="aoc_input_")
+    try:
+        day_dir = pl.Path(tmp_dir, str(year), f"day_{day}")
+        day_dir.mkdir(parents=True)
+        shutil.copy(path, pl.Path(day_dir, "solution.py"))
+        with open(pl.Path(day_dir, "input.txt"), "w") as file:
+            file.write(txt)
+
+        result = run_level(pl.Path(day_dir, "solution.py"), level, timeout=timeout)
+    finally:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    result["path"] = str(path)
+    return result
+
+
+def run_solutions(solutions, levels=(1, 2), max_workers=None, timeout=None, quiet=True, cache=None):
+    """Run solutions across a pool of processes.
+
+    If a result cache is given, levels whose solution, package sources and
+    input are unchanged since a previous run are not run again, and their
+    cached answer and run time are returned.
+
+    Parameters
+    ----------
+    solutions : list[tuple[int, int, pl.Path]]
+        Year, day and path of each solution.
+    levels : tuple[int], default=(1, 2)
+        Levels to run.
+    max_workers : int | None, default=None
+        Number of processes, the number of CPUs if None.
+    timeout : float | None, default=None
+        Time limit per level in seconds, no limit if None.
+    quiet : bool, default=True
+        Whether to silence the output of the solutions.
+    cache : ResultCache | None, default=None
+        Cache of the results, no caching is performed if None.
+
+    Returns
+    -------
+    list[dict]
+        Result of each level, sorted by year, day and level.
+    """
+
+    results = []
+    with cf.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {}
+        for year, day, path in solutions:
+            for level in levels:
+                key = result_key(path, level) if cache is not None else None
+                cached = cache.get(key) if key is not None else None
+                if cached is not None:
+                    cached.update({"path": str(path), "year": year, "day": day, "cached": True})
+                    results.append(cached)
+                    continue
+
+                future = executor.submit(run_level, path, level, timeout=timeout, quiet=quiet)
+                futures[future] = (year, day, key)
+
+        for future in cf.as_completed(futures):
+            year, day, key = futures[future]
+            result = future.result()
+            # Failed runs are not cached, as they may depend on the time limit
+            if key is not None and result["error"] is None:
+                cache.set(key, result)
+            result["year"] = year
+            result["day"] = day
+            result["cached"] = False
+            results.append(result)
+
+    return sorted(results, key=lambda r: (r["year"], r["day"], r["level"]))
+
+
+def format_table(results):
+    """Format run results as a table.
+
+    Parameters
+    ----------
+    results : list[dict]
+        Result of each level.
+
+    Returns
+    -------
+    str
+        Formatted table.
+    """
+
+    lines = [f"{'Year':>6} {'Day':>4} {'Level':>6} {'Time (s)':>12}  Answer"]
+    total = 0.
+    for r in results:
+        if r["error"] is None:
+            total += r["time"]
+            cached = "  (cached)" if r.get("cached") else ""
+            lines.append(f"{r['year']:>6} {r['day']:>4} {r['level']:>6} {r['time']:>12.4e}  {r['answer']}{cached}")
+        else:
+            lines.append(f"{r['year']:>6} {r['day']:>4} {r['level']:>6} {'-':>12}  ERROR: {r['error']}")
+
+    lines.append(f"Total solve time: {total:.4e} s")
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.runner",
+        description="Runs Advent of Code solutions across a pool of processes.",
+    )
+
+    parser.add_argument("-r", "--root", type=str, default=".", help="root directory of the challenges")
+    parser.add_argument("-y", "--year", type=int, nargs="+", help="requested year(s)")
+    parser.add_argument("-d", "--day", type=str, help="requested day, or list/range of days (e.g. 1,3,5-9)")
+    parser.add_argument("-l", "--level", type=int, nargs="+", default=[1, 2], help="requested level(s)")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("-t", "--timeout", type=float, default=None, help="time limit per level (s)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="show the output of the solutions")
+    parser.add_argument("--no-cache", action="store_true", help="always run the solutions, ignoring cached results")
+    parser.add_argument("--cache-size", type=int, default=1024, help="maximum number of cached results")
+
+    args = parser.parse_args()
+
+    days = parse_days(args.day) if args.day is not None else None
+    solutions = discover_solutions(args.root, years=args.year, days=days)
+    cache = None if args.no_cache else ResultCache(pl.Path(args.root, results_dir_name), max_entries=args.cache_size)
+
+    start = time.perf_counter()
+    results = run_solutions(solutions, levels=args.level, max_workers=args.workers,
+                            timeout=args.timeout, quiet=not args.verbose, cache=cache)
+    stop = time.perf_counter()
+
+    print(format_table(results))
+    print(f"Wall time: {stop - start:.4e} s")
@@ -0,0 +1,239 @@
+import heapq
+import collections
+
+import numpy as np
+
+
+def _as_callable(neighbours):
+    """Wrap an adjacency list into a neighbour function."""
+
+    if callable(neighbours):
+        return neighbours
+    return neighbours.__getitem__
+
+
+def bfs(neighbours, sources, n_nodes, targets=None, return_parents=False):
+    """Breadth-first search over integer nodes.
+
+    Parameters
+    ----------
+    neighbours : callable | list[list[int]]
+        Function returning the neighbours of a node, or adjacency list.
+    sources : int | list[int]
+        Source node(s), all at distance 0.
+    n_nodes : int
+        Number of nodes, node ids range from 0 to n_nodes - 1.
+    targets : list[int] | None, default=None
+        Target nodes, the search stops once one of them is reached.
+    return_parents : bool, default=False
+        Whether to also return the parent of each node in the search tree.
+
+    Returns
+    -------
+    np.ndarray
+        Distance of each node from the closest source, -1 if not reached.
+    np.ndarray
+        Parent of each node, -1 for sources and nodes not reached.
+        Only returned if `return_parents` is True.
+    """
+
+    get_neighbours = _as_callable(neighbours)
+    if isinstance(sources, (int, np.integer)):
+        sources = [sources]
+    targets = set(targets) if targets is not None else set()
+
+    dist = [-1] * n_nodes
+    parents = [-1] * n_nodes
+
+    todo = collections.deque()
+    for source in sources:
+        dist[source] = 0
+        todo.append(source)
+
+    while todo:
+        node = todo.popleft()
+        if node in targets:
+            break
+
+        d = dist[node] + 1
+        for nei in get_neighbours(node):
+            if dist[nei] < 0:
+                dist[nei] = d
+                parents[nei] = node
+                todo.append(nei)
+
+    if return_parents:
+        return np.array(dist, dtype=np.int64), np.array(parents, dtype=np.int64)
+    return np.array(dist, dtype=np.int64)
+
+
+def dijkstra(neighbours, sources, n_nodes, targets=None, return_predecessors=False):
+    """Dijkstra search over integer nodes, with a binary heap.
+
+    Parameters
+    ----------
+    neighbours : callable | list[list[tuple[int, float]]]
+        Function returning the (neighbour, cost) pairs of a node, or adjacency list.
+    sources : int | list[int]
+        Source node(s), all at distance 0.
+    n_nodes : int
+        Number of nodes, node ids range from 0 to n_nodes - 1.
+    targets : list[int] | None, default=None
+        Target nodes, the search stops once all nodes closer than the closest
+        target are settled.
+    return_predecessors : bool, default=False
+        Whether to also return all the predecessors of each node on a shortest path.
+
+    Returns
+    -------
+    np.ndarray
+        Distance of each node from the closest source, inf if not reached.
+    list[list[int]]
+        Predecessors of each node on its shortest paths.
+        Only returned if `return_predecessors` is True.
+    """
+
+    get_neighbours = _as_callable(neighbours)
+    if isinstance(sources, (int, np.integer)):
+        sources = [sources]
+    targets = set(targets) if targets is not None else set()
+
+    inf = float("inf")
+    dist = [inf] * n_nodes
+    done = [False] * n_nodes
+    predecessors = [[] for _ in range(n_nodes)] if return_predecessors else None
+
+    heap = []
+    for source in sources:
+        dist[source] = 0
+        heap.append((0, source))
+    heapq.heapify(heap)
+
+    target_dist = inf
+    while heap:
+        d, node = heapq.heappop(heap)
+        if done[node]:
+            continue
+        # Keep settling nodes at the target distance to find all shortest paths
+        if d > target_dist:
+            break
+        done[node] = True
+
+        if node in targets:
+            target_dist = d
+
+        for nei, cost in get_neighbours(node):
+            new_d = d + cost
+            if new_d < dist[nei]:
+                dist[nei] = new_d
+                if return_predecessors:
+                    predecessors[nei] = [node]
+                heapq.heappush(heap, (new_d, nei))
+            elif return_predecessors and new_d == dist[nei] and not done[nei]:
+                predecessors[nei].append(node)
+
+    if return_predecessors:
+        return np.array(dist), predecessors
+    return np.array(dist)
+
+
+def astar(neighbours, source, target, heuristic, n_nodes):
+    """A* search of a shortest path between two integer nodes.
+
+    Parameters
+    ----------
+    neighbours : callable | list[list[tuple[int, float]]]
+        Function returning the (neighbour, cost) pairs of a node, or adjacency list.
+    source : int
+        Source node.
+    target : int
+        Target node.
+    heuristic : callable
+        Admissible estimate of the distance from a node to the target.
+    n_nodes : int
+        Number of nodes, node ids range from 0 to n_nodes - 1.
+
+    Returns
+    -------
+    float
+        Length of the shortest path, inf if the target cannot be reached.
+    list[int]
+        Nodes of the shortest path from source to target, empty if the target
+        cannot be reached.
+    """
+
+    get_neighbours = _as_callable(neighbours)
+
+    inf = float("inf")
+    dist = [inf] * n_nodes
+    parents = [-1] * n_nodes
+
+    dist[source] = 0
+    heap = [(heuristic(source), 0, source)]
+
+    while heap:
+        _, d, node = heapq.heappop(heap)
+        if d > dist[node]:
+            continue
+        if node == target:
+            return d, reconstruct_path(parents, target)
+
+        for nei, cost in get_neighbours(node):
+            new_d = d + cost
+            if new_d < dist[nei]:
+                dist[nei] = new_d
+                parents[nei] = node
+                heapq.heappush(heap, (new_d + heuristic(nei), new_d, nei))
+
+    return inf, []
+
+
+def reconstruct_path(parents, target):
+    """Reconstruct a path from a parent array.
+
+    Parameters
+    ----------
+    parents : list[int] | np.ndarray
+        Parent of each node, -1 for the source.
+    target : int
+        Last node of the path.
+
+    Returns
+    -------
+    list[int]
+        Nodes of the path, from source to target.
+    """
+
+    path = [int(target)]
+    while parents[path[-1]] >= 0:
+        path.append(int(parents[path[-1]]))
+
+    return path[::-1]
+
+
+def shortest_path_nodes(predecessors, targets):
+    """Get all the nodes lying on a shortest path to given targets.
+
+    Parameters
+    ----------
+    predecessors : list[list[int]]
+        Predecessors of each node on its shortest paths, as returned by `dijkstra`.
+    targets : list[int]
+        Target nodes.
+
+    Returns
+    -------
+    set[int]
+        Nodes on any shortest path to any of the targets.
+    """
+
+    nodes = set(targets)
+    todo = list(targets)
+    while todo:
+        node = todo.pop()
+        for pred in predecessors[node]:
+            if pred not in nodes:
+                nodes.add(pred)
+                todo.append(pred)
+
+    return nodes
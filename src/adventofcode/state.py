@@ -0,0 +1,130 @@
+import os
+import json
+import time
+import pathlib as pl
+
+
+class ChallengeState:
+    """Persistent local state of a challenge.
+
+    The state is stored as a JSON file in the challenge directory, and records
+    which level of the challenge is currently unsolved so that it can be known
+    without fetching the instruction page.
+    """
+
+    file_name = ".aoc_state.json"
+
+    def __init__(self, root_dir):
+        """Initialize the challenge state.
+
+        Parameters
+        ----------
+        root_dir : str | pl.Path
+            Challenge directory to store the state in.
+        """
+
+        self._path = pl.Path(root_dir, self.file_name)
+        self._state = self._load()
+
+    def _load(self):
+        """Load the state from disk.
+
+        Returns
+        -------
+        dict
+            Challenge state.
+        """
+
+        if not os.path.exists(self._path):
+            return {}
+
+        try:
+            with open(self._path, "r") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self):
+        """Write the state to disk atomically."""
+
+        os.makedirs(self._path.parent, exist_ok=True)
+        tmp_path = pl.Path(f"{self._path}.tmp")
+        with open(tmp_path, "w") as file:
+            json.dump(self._state, file, indent=2)
+        os.replace(tmp_path, self._path)
+
+    def get(self, key, default=None):
+        """Get a value of the state.
+
+        Parameters
+        ----------
+        key : str
+            Name of the value.
+        default : any, default=None
+            Value returned if the key is not set.
+
+        Returns
+        -------
+        any
+            Stored value.
+        """
+
+        return self._state.get(key, default)
+
+    def set(self, key, value):
+        """Set a value of the state and write it to disk.
+
+        Parameters
+        ----------
+        key : str
+            Name of the value.
+        value : any
+            JSON-serializable value.
+        """
+
+        self._state[key] = value
+        self._save()
+
+    def get_level(self, ttl=None):
+        """Get the stored level of the challenge.
+
+        Parameters
+        ----------
+        ttl : float | None, default=None
+            Maximum age of the stored level in seconds, None means no expiry.
+            A fully solved challenge (level 3) never expires.
+
+        Returns
+        -------
+        int | None
+            Stored level, or None if unknown or stale.
+        """
+
+        level = self._state.get("level")
+        if level is None:
+            return None
+
+        if level < 3 and ttl is not None and time.time() - self._state.get("level_time", 0.) > ttl:
+            return None
+
+        return level
+
+    def set_level(self, level):
+        """Store the level of the challenge.
+
+        Parameters
+        ----------
+        level : int
+            Current level of the challenge, 3 if both parts are solved.
+        """
+
+        self._state["level"] = level
+        self._state["level_time"] = time.time()
+        self._save()
+
+    def clear_level(self):
+        """Forget the stored level of the challenge."""
+
+        self._state.pop("level", None)
+        self._state.pop("level_time", None)
+        self._save()
@@ -0,0 +1,229 @@
+import math
+import argparse
+import concurrent.futures as cf
+
+from .generators import generate_input, get_generators
+from .runner import discover_solutions, run_with_input
+from .utils import parse_days
+
+
+def fit_exponent(sizes, times):
+    """Fit the empirical complexity exponent of a solution.
+
+    The run time is modelled as `t = c * n^k`, and `k` is fitted by least
+    squares on the logarithms of the sizes and times.
+
+    Parameters
+    ----------
+    sizes : list[float]
+        Input sizes.
+    times : list[float]
+        Run times, in seconds.
+
+    Returns
+    -------
+    float | None
+        Fitted exponent, None if less than two points are available.
+    """
+
+    points = [(math.log(n), math.log(t)) for n, t in zip(sizes, times) if n > 0 and t > 0]
+    if len(points) < 2:
+        return None
+
+    mx = sum([x for x, _ in points]) / len(points)
+    my = sum([y for _, y in points]) / len(points)
+    sxx = sum([(x - mx) ** 2 for x, _ in points])
+    if sxx == 0:
+        return None
+
+    return sum([(x - mx) * (y - my) for x, y in points]) / sxx
+
+
+def run_scaled(path, year, day, level, scale, seed=0, timeout=None):
+    """Run one level of a solution on a generated input.
+
+    The solution is run from a temporary challenge directory along with the
+    generated input, so that the real input is left untouched.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    year : int
+        Year of the challenge.
+    day : int
+        Day of the challenge.
+    level : int
+        Level to run.
+    scale : float
+        Scale factor of the input.
+    seed : int, default=0
+        Seed of the input generator.
+    timeout : float | None, default=None
+        Time limit in seconds, no limit if None.
+
+    Returns
+    -------
+    dict
+        Answer, run time, error (if any) and input size of the level.
+    """
+
+    txt = generate_input(year, day, scale=scale, seed=seed)
+    result = run_with_input(path, year, day, level, txt, timeout=timeout)
+
+    result.update({"path": str(path), "year": year, "day": day, "scale": scale, "size": len(txt)})
+    return result
+
+
+def sweep(solutions, scales, levels=(1, 2), seed=0, max_workers=None, timeout=None):
+    """Run solutions on generated inputs of increasing scale.
+
+    Parameters
+    ----------
+    solutions : list[tuple[int, int, pl.Path]]
+        Year, day and path of each solution.
+    scales : list[float]
+        Scale factors of the inputs.
+    levels : tuple[int], default=(1, 2)
+        Levels to run, levels not supported by a generator are skipped.
+    seed : int, default=0
+        Seed of the input generators.
+    max_workers : int | None, default=None
+        Number of processes, the number of CPUs if None.
+    timeout : float | None, default=None
+        Time limit per run in seconds, no limit if None.
+
+    Returns
+    -------
+    list[dict]
+        Result of each run, sorted by year, day, level and scale.
+    """
+
+    generators = get_generators()
+
+    results = []
+    with cf.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for year, day, path in solutions:
+            if (year, day) not in generators:
+                continue
+            _, supported = generators[(year, day)]
+            for level in levels:
+                if level not in supported:
+                    continue
+                for scale in scales:
+                    futures.append(executor.submit(run_scaled, path, year, day, level, scale,
+                                                   seed=seed, timeout=timeout))
+
+        for future in cf.as_completed(futures):
+            results.append(future.result())
+
+    return sorted(results, key=lambda r: (r["year"], r["day"], r["level"], r["scale"]))
+
+
+def summarize_sweep(results, threshold=1.3):
+    """Fit the complexity exponent of each level.
+
+    Once a run fails or times out, larger scales of the same level are ignored.
+
+    Parameters
+    ----------
+    results : list[dict]
+        Result of each run, as returned by `sweep`.
+    threshold : float, default=1.3
+        Exponent above which a level is flagged as super-linear.
+
+    Returns
+    -------
+    list[dict]
+        Year, day, level, times, fitted exponent, flag and error of each level.
+    """
+
+    levels = {}
+    for r in results:
+        levels.setdefault((r["year"], r["day"], r["level"]), []).append(r)
+
+    summary = []
+    for (year, day, level), runs in sorted(levels.items()):
+        sizes, times, error = [], [], None
+        for r in runs:
+            if r["error"] is not None:
+                error = f"{r['error']} at scale {r['scale']:g}"
+                break
+            sizes.append(r["size"])
+            times.append(r["time"])
+
+        exponent = fit_exponent(sizes, times)
+        summary.append({
+            "year": year,
+            "day": day,
+            "level": level,
+            "times": times,
+            "exponent": exponent,
+            "flag": exponent is not None and exponent > threshold,
+            "error": error,
+        })
+
+    return summary
+
+
+def format_sweep(summary, scales):
+    """Format a sweep summary as a table.
+
+    Parameters
+    ----------
+    summary : list[dict]
+        Summary of each level, as returned by `summarize_sweep`.
+    scales : list[float]
+        Scale factors of the inputs.
+
+    Returns
+    -------
+    str
+        Formatted table.
+    """
+
+    header = f"{'Year':>6} {'Day':>4} {'Level':>6} " + " ".join([f"{f'x{s:g} (s)':>11}" for s in scales])
+    lines = [header + f" {'Exponent':>9}"]
+    for s in summary:
+        times = [f"{t:>11.3e}" for t in s["times"]] + [f"{'-':>11}"] * (len(scales) - len(s["times"]))
+        exponent = f"{s['exponent']:>9.2f}" if s["exponent"] is not None else f"{'-':>9}"
+        line = f"{s['year']:>6} {s['day']:>4} {s['level']:>6} " + " ".join(times) + f" {exponent}"
+        if s["flag"]:
+            line += "  SUPER-LINEAR"
+        if s["error"] is not None:
+            line += f"  ERROR: {s['error']}"
+        lines.append(line)
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.sweep",
+        description="Runs Advent of Code solutions on generated inputs of increasing size "
+                    "and fits their empirical complexity.",
+    )
+
+    parser.add_argument("-r", "--root", type=str, default=".", help="root directory of the challenges")
+    parser.add_argument("-y", "--year", type=int, nargs="+", help="requested year(s)")
+    parser.add_argument("-d", "--day", type=str, help="requested day, or list/range of days (e.g. 1,3,5-9)")
+    parser.add_argument("-l", "--level", type=int, nargs="+", default=[1, 2], help="requested level(s)")
+    parser.add_argument("-s", "--scales", type=float, nargs="+", default=[0.25, 0.5, 1., 2., 4.],
+                        help="scale factors of the inputs")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the input generators")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="number of processes")
+    parser.add_argument("-t", "--timeout", type=float, default=60., help="time limit per run (s)")
+    parser.add_argument("--threshold", type=float, default=1.3,
+                        help="exponent above which a level is flagged as super-linear")
+
+    args = parser.parse_args()
+
+    days = parse_days(args.day) if args.day is not None else None
+    solutions = discover_solutions(args.root, years=args.year, days=days)
+    scales = sorted(args.scales)
+
+    results = sweep(solutions, scales, levels=args.level, seed=args.seed,
+                    max_workers=args.workers, timeout=args.timeout)
+    print(format_sweep(summarize_sweep(results, threshold=args.threshold), scales))
@@ -19,3 +19,28 @@ def get_year_day_from_path(file_path: str):
     day = int(this_path.split("day_")[1].split(os.sep)[0])
 
     return year, day
+
+
+def parse_days(days_str):
+    """Parse a list of days.
+
+    Parameters
+    ----------
+    days_str : str
+        Comma-separated days or ranges of days, e.g. "1,3,5-9".
+
+    Returns
+    -------
+    list[int]
+        Requested days.
+    """
+
+    days = []
+    for part in days_str.split(","):
+        if "-" in part:
+            d0, d1 = map(int, part.split("-"))
+            days.extend(range(d0, d1 + 1))
+        else:
+            days.append(int(part))
+
+    return sorted(set(days))
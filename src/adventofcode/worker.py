@@ -0,0 +1,407 @@
+import io
+import os
+import sys
+import json
+import time
+import socket
+import argparse
+import tempfile
+import importlib
+import contextlib
+import socketserver
+import pathlib as pl
+
+from .runner import run_level
+
+
+default_socket_path = pl.Path(tempfile.gettempdir(), f"aoc_worker_{os.getuid()}.sock")
+
+# Modules imported once by the worker, so that solutions do not pay for their import
+preload_modules = [
+    "numpy",
+    "requests",
+    "tqdm",
+    "matplotlib.pyplot",
+    "adventofcode.aoc_connect",
+    "adventofcode.grid",
+    "adventofcode.io",
+    "adventofcode.search",
+]
+
+
+class WorkerError(Exception):
+    """Error raised when the worker cannot be reached.
+
+    Parameters
+    ----------
+    Exception : WorkerError
+        The worker is not running or did not answer.
+    """
+    pass
+
+
+def preload(modules=None):
+    """Import the modules needed by the solutions.
+
+    Modules that are not installed are skipped.
+
+    Parameters
+    ----------
+    modules : list[str] | None, default=None
+        Names of the modules, `preload_modules` if None.
+
+    Returns
+    -------
+    list[str]
+        Names of the imported modules.
+    """
+
+    if modules is None:
+        modules = preload_modules
+
+    # Figures must not open windows in a background process
+    os.environ.setdefault("MPLBACKEND", "Agg")
+
+    loaded = []
+    for name in modules:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+        loaded.append(name)
+
+    return loaded
+
+
+def run_captured(path, level, timeout=None):
+    """Run one level of a solution, capturing its output.
+
+    The worker calls it in the child forked for each request, which inherits
+    the modules already imported by the worker and imports the solution
+    module afresh, so that changes of the solution are picked up and its
+    module-level state never leaks between runs.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    level : int
+        Level to run.
+    timeout : float | None, default=None
+        Time limit in seconds, no limit if None.
+
+    Returns
+    -------
+    dict
+        Answer, run time, error (if any) and output of the level.
+    """
+
+    output = io.StringIO()
+    try:
+        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(output):
+            result = run_level(path, level, timeout=timeout, quiet=False)
+    except BaseException as err:
+        result = {"path": str(path), "level": level, "answer": None, "time": None, "error": repr(err)}
+    result["output"] = output.getvalue()
+
+    return result
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handler of the requests sent to the worker, one JSON object per line.
+
+    Each request is handled in a child forked by the worker.
+    """
+
+    def handle(self):
+        request = json.loads(self.rfile.readline())
+        command = request.get("command", "run")
+
+        if command == "ping":
+            response = {"pid": os.getppid(), "modules": self.server.loaded}
+        elif command == "shutdown":
+            response = {"stopped": True}
+        elif command == "run":
+            response = run_captured(request["path"], request["level"], timeout=request.get("timeout"))
+        else:
+            response = {"error": f"Unknown command: {command}"}
+
+        self.wfile.write(json.dumps(response).encode() + b"\n")
+
+        if command == "shutdown":
+            self.server.request_stop()
+
+
+class WorkerServer(socketserver.ForkingMixIn, socketserver.UnixStreamServer):
+    """Long-lived worker running solutions on request over a local socket.
+
+    Requires a POSIX system, as each request is handled in a forked child.
+    The worker itself never starts threads, so that forking it is safe.
+    """
+
+    # Time between two checks of a stop request, in seconds
+    timeout = 0.1
+
+    def __init__(self, socket_path=default_socket_path, modules=None):
+        """Initialize the worker and preload the modules.
+
+        Parameters
+        ----------
+        socket_path : str | pl.Path, default=default_socket_path
+            Path to the Unix socket to listen on.
+        modules : list[str] | None, default=None
+            Names of the modules to preload, `preload_modules` if None.
+        """
+
+        self.socket_path = pl.Path(socket_path)
+        if self.socket_path.exists():
+            # Remove the socket of a worker that did not exit cleanly
+            if ping(self.socket_path) is not None:
+                raise WorkerError(f"A worker is already running on {self.socket_path}")
+            self.socket_path.unlink()
+
+        self.loaded = preload(modules)
+        # Children request a stop through a pipe, as they cannot stop their parent directly
+        self._stop_read, self._stop_write = os.pipe()
+        os.set_blocking(self._stop_read, False)
+        super().__init__(str(self.socket_path), _RequestHandler)
+
+    def request_stop(self):
+        """Request the worker to stop, from the worker or one of its children."""
+
+        os.write(self._stop_write, b"\0")
+
+    def stop_requested(self):
+        """Check whether a stop was requested.
+
+        Returns
+        -------
+        bool
+            Whether a stop was requested.
+        """
+
+        try:
+            return len(os.read(self._stop_read, 1)) > 0
+        except BlockingIOError:
+            return False
+
+    def serve(self):
+        """Serve requests until a stop is requested."""
+
+        try:
+            while not self.stop_requested():
+                self.handle_request()
+                self.collect_children()
+        finally:
+            self.server_close()
+            os.close(self._stop_read)
+            os.close(self._stop_write)
+            with contextlib.suppress(OSError):
+                self.socket_path.unlink()
+
+
+def send_request(request, socket_path=default_socket_path):
+    """Send a request to the worker and wait for its response.
+
+    Parameters
+    ----------
+    request : dict
+        JSON-serializable request.
+    socket_path : str | pl.Path, default=default_socket_path
+        Path to the Unix socket of the worker.
+
+    Returns
+    -------
+    dict
+        Response of the worker.
+    """
+
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.connect(str(socket_path))
+            sock.sendall(json.dumps(request).encode() + b"\n")
+            with sock.makefile("rb") as file:
+                line = file.readline()
+    except OSError as err:
+        raise WorkerError(f"Cannot reach the worker on {socket_path}: {err}") from err
+
+    if not line:
+        raise WorkerError(f"The worker on {socket_path} closed the connection")
+
+    return json.loads(line)
+
+
+def ping(socket_path=default_socket_path):
+    """Check whether a worker is running.
+
+    Parameters
+    ----------
+    socket_path : str | pl.Path, default=default_socket_path
+        Path to the Unix socket of the worker.
+
+    Returns
+    -------
+    dict | None
+        Process id and preloaded modules of the worker, None if it is not running.
+    """
+
+    try:
+        return send_request({"command": "ping"}, socket_path=socket_path)
+    except WorkerError:
+        return None
+
+
+def run_remote(path, level, timeout=None, socket_path=default_socket_path):
+    """Run one level of a solution on the worker.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    level : int
+        Level to run.
+    timeout : float | None, default=None
+        Time limit in seconds, no limit if None.
+    socket_path : str | pl.Path, default=default_socket_path
+        Path to the Unix socket of the worker.
+
+    Returns
+    -------
+    dict
+        Answer, run time, error (if any) and output of the level.
+    """
+
+    request = {"command": "run", "path": str(pl.Path(path).resolve()), "level": level, "timeout": timeout}
+    return send_request(request, socket_path=socket_path)
+
+
+def format_result(result, latency, verbose=False):
+    """Format the result of a run.
+
+    Parameters
+    ----------
+    result : dict
+        Result of the level.
+    latency : float
+        Time between the request and the response, in seconds.
+    verbose : bool, default=False
+        Whether to include the output of the solution.
+
+    Returns
+    -------
+    str
+        Formatted result.
+    """
+
+    lines = []
+    if verbose and result.get("output"):
+        lines.append(result["output"].rstrip("\n"))
+
+    if result["error"] is None:
+        lines.append(f"Level {result['level']}: {result['answer']} "
+                     f"(solved in {result['time']:.4e} s, round trip {latency:.4e} s)")
+    else:
+        lines.append(f"Level {result['level']}: ERROR: {result['error']}")
+
+    return "\n".join(lines)
+
+
+def watch(path, levels, timeout=None, socket_path=default_socket_path, interval=0.2, verbose=False):
+    """Run levels of a solution every time the solution or its input is saved.
+
+    Parameters
+    ----------
+    path : str | pl.Path
+        Path to the solution module.
+    levels : list[int]
+        Levels to run.
+    timeout : float | None, default=None
+        Time limit per level in seconds, no limit if None.
+    socket_path : str | pl.Path, default=default_socket_path
+        Path to the Unix socket of the worker.
+    interval : float, default=0.2
+        Polling interval of the files, in seconds.
+    verbose : bool, default=False
+        Whether to print the output of the solution.
+    """
+
+    path = pl.Path(path).resolve()
+    watched = [path, pl.Path(path.parent, "input.txt")]
+
+    last = None
+    while True:
+        stamps = []
+        for file_path in watched:
+            try:
+                stat = file_path.stat()
+                stamps.append((stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                stamps.append(None)
+
+        if stamps != last:
+            last = stamps
+            print(f"--- {time.strftime('%H:%M:%S')} {path}")
+            for level in levels:
+                start = time.perf_counter()
+                result = run_remote(path, level, timeout=timeout, socket_path=socket_path)
+                print(format_result(result, time.perf_counter() - start, verbose=verbose), flush=True)
+
+        time.sleep(interval)
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(
+        prog="adventofcode.worker",
+        description="Keeps a warm worker process to re-run Advent of Code solutions without start-up costs.",
+    )
+    parser.add_argument("-s", "--socket", type=str, default=str(default_socket_path), help="path to the worker socket")
+
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = subparsers.add_parser("serve", help="start the worker")
+    serve_parser.add_argument("-m", "--modules", type=str, nargs="+", help="modules to preload")
+
+    subparsers.add_parser("stop", help="stop the worker")
+    subparsers.add_parser("status", help="check whether the worker is running")
+
+    for name, help_str in [("run", "run a solution on the worker"), ("watch", "re-run a solution on save")]:
+        sub = subparsers.add_parser(name, help=help_str)
+        sub.add_argument("path", type=str, help="path to the solution module")
+        sub.add_argument("-l", "--level", type=int, nargs="+", default=[1, 2], help="requested level(s)")
+        sub.add_argument("-t", "--timeout", type=float, default=None, help="time limit per level (s)")
+        sub.add_argument("-v", "--verbose", action="store_true", help="show the output of the solution")
+
+    args = parser.parse_args()
+
+    try:
+        if args.command == "serve":
+            server = WorkerServer(args.socket, modules=args.modules)
+            print(f"Worker {os.getpid()} listening on {args.socket} (preloaded: {', '.join(server.loaded)})")
+            server.serve()
+
+        elif args.command == "stop":
+            send_request({"command": "shutdown"}, socket_path=args.socket)
+            print("Worker stopped")
+
+        elif args.command == "status":
+            status = ping(args.socket)
+            if status is None:
+                print(f"No worker running on {args.socket}")
+            else:
+                print(f"Worker {status['pid']} running on {args.socket} (preloaded: {', '.join(status['modules'])})")
+
+        elif args.command == "run":
+            for level in args.level:
+                start = time.perf_counter()
+                result = run_remote(args.path, level, timeout=args.timeout, socket_path=args.socket)
+                print(format_result(result, time.perf_counter() - start, verbose=args.verbose))
+
+        elif args.command == "watch":
+            watch(args.path, args.level, timeout=args.timeout, socket_path=args.socket, verbose=args.verbose)
+
+    except WorkerError as err:
+        print(err, file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        pass
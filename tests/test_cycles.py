@@ -0,0 +1,75 @@
+import numpy as np
+import pytest
+
+from adventofcode import cycles
+
+
+def _brute_force(step, x0):
+    """Reference cycle start and period, listing every state until a repetition."""
+
+    states = []
+    x = x0
+    while x not in states:
+        states.append(x)
+        x = step(x)
+
+    start = states.index(x)
+    return start, len(states) - start
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_cycle_finders_agree_with_brute_force(seed):
+
+    rng = np.random.default_rng(seed)
+    n = int(rng.integers(1, 60))
+    table = rng.integers(0, n, size=n).tolist()
+    x0 = int(rng.integers(0, n))
+
+    def step(x):
+        return table[x]
+
+    expected = _brute_force(step, x0)
+
+    assert cycles.find_cycle(step, x0) == expected
+    assert cycles.brent(step, x0) == expected
+    assert cycles.floyd(step, x0) == expected
+    assert cycles.has_cycle(step, x0)
+
+    start, period = expected
+    for n_steps in [0, 1, start, start + 3 * period + 1, 10**12]:
+        # Targets past the start land on the state at the same position in the cycle
+        x = x0
+        for _ in range(n_steps if n_steps < start else start + (n_steps - start) % period):
+            x = step(x)
+        assert cycles.fast_forward(step, x0, n_steps) == x
+
+
+def test_sequences_without_cycle():
+
+    def step(x):
+        return x + 1 if x < 10 else None
+
+    for finder in [cycles.find_cycle, cycles.brent, cycles.floyd]:
+        assert finder(step, 0) is None
+        # A long cycle is not found within a few steps
+        assert finder(lambda x: (x + 1) % 1000, 0, max_steps=50) is None
+
+    assert not cycles.has_cycle(step, 0)
+    assert cycles.fast_forward(step, 0, 5) == 5
+    assert cycles.fast_forward(step, 0, 20) is None
+
+
+def test_array_states_with_state_hash():
+
+    def step(state):
+        # Rotating rows of a 3x4 grid cycle with a period of 3
+        return np.roll(state, 1, axis=0)
+
+    x0 = np.arange(12).reshape(3, 4)
+    x0[2] = x0[1]
+
+    assert cycles.state_hash(x0) == cycles.state_hash(x0.copy())
+    assert cycles.state_hash(x0) != cycles.state_hash(x0.astype(np.int8))
+    assert cycles.find_cycle(step, x0, key=cycles.state_hash) == (0, 3)
+    assert cycles.brent(step, x0, key=cycles.state_hash) == (0, 3)
+    assert np.array_equal(cycles.fast_forward(step, x0, 10**9, key=cycles.state_hash), step(x0))
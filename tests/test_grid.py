@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from adventofcode.grid import Grid
+
+
+TEXT = "#..#\n.##.\n#...\n"
+
+
+@pytest.mark.parametrize("pad", [1, 2])
+@pytest.mark.parametrize("diagonal", [False, True])
+def test_neighbour_table_matches_coordinates(pad, diagonal):
+
+    grid = Grid.from_text(TEXT, mapping={"#": 1, ".": 2}, pad=pad, fill=9)
+    table = grid.neighbour_table(diagonal=diagonal)
+    directions = Grid.directions_8 if diagonal else Grid.directions_4
+    ni, nj = grid.shape
+
+    for i in range(ni):
+        for j in range(nj):
+            neighbours = table[grid.to_flat(i, j)]
+            for (di, dj), idx in zip(directions, neighbours):
+                assert grid.to_coords(idx) == (i + di, j + dj)
+                # Neighbours outside of the grid are padding cells
+                expected = grid[i + di, j + dj] if grid.in_bounds(i + di, j + dj) else 9
+                assert grid.flat[idx] == expected
+
+
+def test_count_neighbours_matches_brute_force():
+
+    grid = Grid.from_text(TEXT, mapping={"#": 1})
+    ni, nj = grid.shape
+
+    for diagonal in [False, True]:
+        counts = grid.count_neighbours(diagonal=diagonal)
+        directions = Grid.directions_8 if diagonal else Grid.directions_4
+        for i in range(ni):
+            for j in range(nj):
+                expected = sum(grid.in_bounds(i + di, j + dj) and grid[i + di, j + dj] == 1
+                               for di, dj in directions)
+                assert counts[i, j] == expected
+
+
+def test_cells_and_text_round_trip():
+
+    grid = Grid.from_text(TEXT, pad=2)
+
+    assert grid.shape == (3, 4)
+    assert grid.padded.shape == (7, 8)
+    assert grid.to_text() == TEXT.strip()
+    assert np.all(grid.flat[grid.cells()] == grid.values.reshape(-1))
+    assert grid.find_one(ord("#")) == (0, 0)
+    assert grid.find(ord("#")).tolist() == [[0, 0], [0, 3], [1, 1], [1, 2], [2, 0]]
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+import adventofcode as aoc
+from adventofcode.intervals import IntervalSet
+
+
+def _random_intervals(rng, n, low=-30, high=30):
+    """Draw inclusive intervals, some of them empty, overlapping or adjacent."""
+
+    starts = rng.integers(low, high, size=n)
+    ends = starts + rng.integers(-2, 8, size=n)
+    return [(int(s), int(e)) for s, e in zip(starts, ends)]
+
+
+def _as_set(intervals):
+    """Reference set of the integers covered by inclusive intervals."""
+
+    return {x for start, end in intervals for x in range(start, end + 1)}
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_matches_python_sets(seed):
+
+    rng = np.random.default_rng(seed)
+    a_intervals = _random_intervals(rng, int(rng.integers(0, 8)))
+    b_intervals = _random_intervals(rng, int(rng.integers(0, 8)))
+    a, b = IntervalSet(a_intervals), IntervalSet(b_intervals)
+    a_set, b_set = _as_set(a_intervals), _as_set(b_intervals)
+
+    assert _as_set(a) == a_set
+    assert a.total_length() == len(a_set)
+    assert bool(a) == bool(a_set)
+
+    assert _as_set(a | b) == a_set | b_set
+    assert _as_set(a & b) == a_set & b_set
+    assert _as_set(a - b) == a_set - b_set
+    assert a | b == b | a
+    assert a & b == b & a
+
+    values = np.arange(-40, 50)
+    expected = np.array([int(v) in a_set for v in values])
+    assert np.array_equal(a.contains(values), expected)
+    assert a.count(values) == len(a_set)
+    assert [int(v) in a for v in values] == expected.tolist()
+
+    # Adding the intervals one by one gives the same set
+    c = IntervalSet()
+    for start, end in b_intervals:
+        c.add(start, end)
+    assert c == b
+
+
+def test_intervals_are_disjoint_and_merged():
+
+    intervals = IntervalSet([(5, 7), (1, 3), (4, 4), (10, 12), (11, 15), (20, 19)])
+
+    # Adjacent intervals are merged, empty ones are ignored
+    assert list(intervals) == [(1, 7), (10, 15)]
+    assert len(intervals) == 2
+    assert intervals.total_length() == 13
+    assert repr(intervals) == "IntervalSet([(1, 7), (10, 15)])"
+
+    intervals.add(8, 9)
+    assert list(intervals) == [(1, 15)]
+    assert not IntervalSet()
+    assert not IntervalSet().contains([1, 2]).any()
+
+
+def test_exported_from_package():
+
+    assert "IntervalSet" in aoc.__all__
+    assert aoc.IntervalSet is IntervalSet
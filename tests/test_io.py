@@ -0,0 +1,87 @@
+import numpy as np
+
+from adventofcode import io
+
+
+def test_views_outlive_context_manager(tmp_path):
+
+    path = tmp_path / "input.txt"
+    path.write_text("#.#\n.#.\n")
+
+    with io.InputFile(path) as input_file:
+        grid = input_file.grid()
+        lines = input_file.line_views()
+
+    assert grid.tolist() == [[35, 46, 35], [46, 35, 46]]
+    assert [bytes(line) for line in lines] == [b"#.#", b".#."]
+
+
+def test_context_manager_without_views(tmp_path):
+
+    path = tmp_path / "input.txt"
+    path.write_text("1 -2\n3\n")
+
+    with io.InputFile(path) as input_file:
+        assert input_file.text() == "1 -2\n3"
+        assert input_file.ints().tolist() == [1, -2, 3]
+
+
+def test_load_input_returns_copies(tmp_path):
+
+    path = tmp_path / "input.txt"
+    path.write_text("1\n2\n3\n")
+
+    def parser(txt):
+        return [int(x) for x in txt.split()]
+
+    io.clear_memo()
+    first = io.load_input(path, parser=parser)
+    first.append(4)
+    second = io.load_input(path, parser=parser)
+    second.append(5)
+
+    assert io.load_input(path, parser=parser) == [1, 2, 3]
+
+
+def test_parsed_memo_is_bounded(tmp_path, monkeypatch):
+
+    monkeypatch.setattr(io, "parsed_memo_size", 2)
+    io.clear_memo()
+
+    for i in range(4):
+        path = tmp_path / f"input_{i}.txt"
+        path.write_text(str(i))
+        assert io.load_input(path, parser=lambda txt: np.array([int(txt)])).tolist() == [i]
+
+    assert len(io._parsed_memo) == 2
+
+
+def test_memo_keeps_parsed_objects(tmp_path):
+
+    path = tmp_path / "input.txt"
+    path.write_text("1 2 3")
+
+    io.clear_memo()
+    parsed = io.load_input(path, parser=lambda txt: np.array(txt.split(), dtype=int))
+
+    (memoized,) = io._parsed_memo.values()
+    assert isinstance(memoized, np.ndarray)
+    assert memoized is not parsed
+
+
+def test_persist_local_parser(tmp_path):
+
+    path = tmp_path / "input.txt"
+    path.write_text("4\n5")
+
+    def parser(txt):
+        return [int(x) for x in txt.split()]
+
+    io.clear_memo()
+    assert io.load_input(path, parser=parser, persist=True) == [4, 5]
+
+    (cache_file,) = (tmp_path / io.parsed_dir_name).iterdir()
+    assert "<" not in cache_file.name and ">" not in cache_file.name
+
+    io.clear_memo()
+    assert io.load_input(path, parser=parser, persist=True) == [4, 5]
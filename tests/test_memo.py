@@ -0,0 +1,56 @@
+from adventofcode import memo
+
+
+def test_persisted_entries_survive_scope(tmp_path):
+
+    path = tmp_path / "square.pkl"
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    cached = memo.memoize(square, persist=path)
+    with memo.scope(cached, save=True):
+        assert cached(3) == 9
+    assert calls == [3]
+
+    # A new process decorates the function again, and scopes it before the first call
+    cached = memo.memoize(square, persist=path)
+    with memo.scope(cached):
+        assert cached(3) == 9
+        assert cached.stats()["hits"] == 1
+    assert calls == [3]
+
+
+def test_scope_clears_unpersisted_entries():
+
+    calls = []
+
+    @memo.memoize
+    def double(x):
+        calls.append(x)
+        return 2 * x
+
+    with memo.scope(double):
+        double(1)
+        double(1)
+    with memo.scope(double):
+        double(1)
+
+    assert calls == [1, 1]
+
+
+def test_bounded_cache_evicts_least_recently_used():
+
+    @memo.memoize(maxsize=2)
+    def identity(x):
+        return x
+
+    identity(1)
+    identity(2)
+    identity(1)
+    identity(3)
+
+    assert list(identity.memo.data) == [(1,), (3,)]
+    assert identity.stats()["evictions"] == 1
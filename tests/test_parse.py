@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from adventofcode import parse
+
+
+def _random_text(rng, n):
+    """Draw a text of integers separated by spaces, commas, dashes and letters."""
+
+    separators = [" ", ", ", "-", " -", "\n", "x=", ": -"]
+    parts = []
+    for _ in range(n):
+        n_digits = int(rng.integers(1, 19))
+        parts.append(str(int(rng.integers(0, 10 ** n_digits))))
+        parts.append(separators[int(rng.integers(len(separators)))])
+    return "".join(parts)
+
+
+@pytest.mark.parametrize("negative", [True, False])
+@pytest.mark.parametrize("seed", range(5))
+def test_vectorized_matches_regex(seed, negative):
+
+    rng = np.random.default_rng(seed)
+    text = _random_text(rng, 2000)
+    assert len(text) >= parse._vectorize_min_size
+
+    pattern = parse._int_pattern if negative else parse._uint_pattern
+    expected = [int(x) for x in pattern.findall(text)]
+
+    for data in [text, text.encode(), memoryview(text.encode())]:
+        values = parse.ints(data, negative=negative)
+        assert values.dtype == np.int64
+        assert values.tolist() == expected
+
+    # Small texts are parsed by the regex
+    assert parse.ints(text[:200], negative=negative).tolist() == [int(x) for x in pattern.findall(text[:200])]
+
+
+@pytest.mark.parametrize("padding", [0, parse._vectorize_min_size])
+def test_int64_bounds_are_the_same_for_both_parsers(padding):
+
+    filler = " 1" * padding
+    limit = np.iinfo(np.int64)
+
+    values = parse.ints(f"{limit.max} {limit.min} 1234567890123456789{filler}")
+    assert values[:3].tolist() == [limit.max, limit.min, 1234567890123456789]
+
+    for number in [limit.max + 1, limit.min - 1, 10 ** 25]:
+        with pytest.raises(ValueError):
+            parse.ints(f"1 {number}{filler}")
+
+
+def test_int_rows_and_templates():
+
+    text = "p=0,4 v=3,-3\np=6,3 v=-1,-3\np=10,3 v=-1,2"
+
+    assert parse.int_rows(text, 4).tolist() == [[0, 4, 3, -3], [6, 3, -1, -3], [10, 3, -1, 2]]
+    with pytest.raises(ValueError):
+        parse.int_rows(text, 5)
+
+    assert parse.parse_lines("p={int},{int} v={int},{int}", text)[1] == (6, 3, -1, -3)
+    assert parse.parse_lines("{int}: {ints}", "190: 10 19\n3267: 81,40 27") == [(190, [10, 19]), (3267, [81, 40, 27])]
+    with pytest.raises(ValueError):
+        parse.parse_lines("{int}: {ints}", "190: 10 19\nabc")
@@ -0,0 +1,111 @@
+import numpy as np
+
+from adventofcode import search
+from adventofcode.grid import Grid
+
+
+MAZE = """\
+S...#...
+.##.#.#.
+.#..#.#.
+.#.##.#.
+...#..#E
+.#...#..
+"""
+
+
+def _maze_graph(weights=None):
+    """Build the graph of the open cells of the maze, optionally weighted."""
+
+    grid = Grid.from_text(MAZE, mapping={".": 1, "S": 1, "E": 1})
+    table = grid.neighbour_table()
+    flat = grid.flat
+
+    def cost(idx):
+        return 1 if weights is None else int(weights.reshape(-1)[idx])
+
+    unweighted = [[int(nei) for nei in table[idx] if flat[nei]] if flat[idx] else [] for idx in range(flat.size)]
+    weighted = [[(nei, cost(nei)) for nei in neis] for neis in unweighted]
+    source = int(grid.to_flat(0, 0))
+    target = int(grid.to_flat(4, 7))
+
+    return grid, unweighted, weighted, source, target
+
+
+def _bellman_ford(weighted, source):
+    """Reference shortest distances, relaxing every edge until nothing changes."""
+
+    dist = [float("inf")] * len(weighted)
+    dist[source] = 0
+    changed = True
+    while changed:
+        changed = False
+        for node, edges in enumerate(weighted):
+            for nei, cost in edges:
+                if dist[node] + cost < dist[nei]:
+                    dist[nei] = dist[node] + cost
+                    changed = True
+
+    return np.array(dist)
+
+
+def test_bfs_dijkstra_astar_agree():
+
+    grid, unweighted, weighted, source, target = _maze_graph()
+    n_nodes = grid.flat.size
+
+    dist, parents = search.bfs(unweighted, source, n_nodes, return_parents=True)
+    reference = _bellman_ford(weighted, source)
+    reached = np.isfinite(reference)
+
+    assert np.all(dist[reached] == reference[reached])
+    assert np.all(dist[~reached] == -1)
+    assert np.array_equal(search.dijkstra(weighted, source, n_nodes), reference)
+
+    def manhattan(node):
+        i, j = grid.to_coords(node)
+        return abs(i - 4) + abs(j - 7)
+
+    length, path = search.astar(weighted, source, target, manhattan, n_nodes)
+    assert length == dist[target] == 21
+    assert path[0] == source and path[-1] == target
+    assert len(path) == length + 1
+    assert all(b in unweighted[a] for a, b in zip(path[:-1], path[1:]))
+    assert len(search.reconstruct_path(parents, target)) == length + 1
+
+
+def test_weighted_searches_match_bellman_ford():
+
+    rng = np.random.default_rng(0)
+    grid = Grid.from_text(MAZE)
+    weights = np.zeros(grid.padded.shape, dtype=np.int64)
+    weights[1:-1, 1:-1] = rng.integers(1, 10, size=grid.shape)
+    _, _, weighted, source, target = _maze_graph(weights)
+    n_nodes = weights.size
+
+    reference = _bellman_ford(weighted, source)
+    dist, predecessors = search.dijkstra(weighted, source, n_nodes, return_predecessors=True)
+    assert np.array_equal(dist, reference)
+
+    length, path = search.astar(weighted, source, target, lambda node: 0, n_nodes)
+    assert length == reference[target]
+    assert sum(dict(weighted[a])[b] for a, b in zip(path[:-1], path[1:])) == length
+
+    # Nodes on shortest paths are exactly those whose distances add up
+    to_target = _bellman_ford(weighted, target)
+    costs = np.array([weights.reshape(-1)[node] for node in range(n_nodes)])
+    on_path = {node for node in range(n_nodes)
+               if reference[node] + to_target[node] - costs[node] + costs[target] == length}
+    assert search.shortest_path_nodes(predecessors, [target]) == on_path
+
+
+def test_bfs_stops_at_targets():
+
+    _, unweighted, _, source, target = _maze_graph()
+    n_nodes = len(unweighted)
+
+    full = search.bfs(unweighted, source, n_nodes)
+    partial = search.bfs(unweighted, [source], n_nodes, targets=[target])
+
+    assert partial[target] == full[target]
+    assert np.all(partial[partial >= 0] == full[partial >= 0])